@@ -28,8 +28,7 @@ if 'initial_sync_done' not in st.session_state:
     with st.spinner("🔄 서버 데이터 동기화 중..."):
         try:
             # Check if local logs exist, if not pull from GSheet
-            from src.activity_logger import ACCESS_LOG_FILE, USAGE_LOG_FILE
-            if not ACCESS_LOG_FILE.exists() or ACCESS_LOG_FILE.stat().st_size < 10:
+            if not activity_logger.local_logs_exist():
                 activity_logger.pull_from_gsheet()
                 st.session_state.initial_sync_done = True
                 print("DEBUG: Initial Sync from GSheet completed.")
@@ -1157,34 +1156,18 @@ if error:
 
 if raw_df is not None:
     
-    # [FIX] Ensure '관리지사' has no NaNs, fill with '미지정' (Global for all sources)
-    if '관리지사' in raw_df.columns:
-        raw_df['관리지사'] = raw_df['관리지사'].fillna('미지정').astype(str)
-        raw_df.loc[raw_df['관리지사'].str.strip() == '', '관리지사'] = '미정' # Fallback
-        
-        # [STRICT] Enforce '지사' suffix at data level
-        def standardize_branch(b):
-            if not b or b in ['미지정', '전체', 'None', 'nan']: return '미지정'
-            b_norm = unicodedata.normalize('NFC', str(b)).strip()
-            # If it's a known branch name without '지사', add it
-            known_branches = ['중앙', '강북', '서대문', '고양', '의정부', '남양주', '강릉', '원주']
-            if b_norm in known_branches:
-                return b_norm + '지사'
-            return b_norm
-
-        raw_df['관리지사'] = raw_df['관리지사'].apply(standardize_branch)
-    else:
-        raw_df['관리지사'] = '미지정'
-
-    # [FIX] Global NFC Normalization 
-    for col in ['관리지사', 'SP담당', '사업장명', '소재지전체주소', '영업상태명', '업태구분명']:
-        if col in raw_df.columns:
-            raw_df[col] = raw_df[col].astype(str).apply(lambda x: unicodedata.normalize('NFC', x).strip() if x else x)
+    # [FIX] Ensure '관리지사' has no NaNs, fill with '미지정' + Global NFC Normalization (all sources)
+    # [OPTIMIZATION] Done once in the (cached) loader; only frames it did not produce are normalized here
+    if not raw_df.attrs.get('display_normalized'):
+        raw_df = data_loader.normalize_display_columns(raw_df)
             
     # [FIX] HOT-RELOAD STATUS
     # Even if cached, we re-merge the latest JSON status to ensure freshness
     raw_df = data_loader.merge_activity_status(raw_df)
     
+    # [OPTIMIZATION] Low-cardinality columns back to categoricals (filters below compare codes)
+    raw_df = data_loader.apply_categorical_dtypes(raw_df)
+    
     # [FIX] Stability: Ensure raw_df is NEVER None to prevent crashes in downstream logic
     if raw_df is None:
         raw_df = pd.DataFrame()
@@ -1198,9 +1181,7 @@ if raw_df is not None:
             if col in raw_df.columns:
                  # Get max date safely
                  # [FIX] Ensure they are all tz-aware for comparison if they are not already
-                 series = pd.to_datetime(raw_df[col], errors='coerce')
-                 if series.dt.tz is None:
-                     series = series.dt.tz_localize('Asia/Seoul')
+                 series = data_loader.parse_date_series(raw_df[col])
                  max_val = series.max()
                  if pd.notna(max_val):
                      date_candidates.append(max_val)
@@ -3002,8 +2983,11 @@ if raw_df is not None:
         editable_cols = ['관리지사', '영업구역 수정']
         disabled_cols = [c for c in cols_to_show if c not in editable_cols]
         
+        # Editable text columns must be plain strings (categoricals only accept existing categories)
+        editor_df = edit_target_df[cols_to_show].astype({c: object for c in editable_cols if c in cols_to_show})
+        
         edited_df = st.data_editor(
-            edit_target_df[cols_to_show],
+            editor_df,
             column_config=column_config,
             use_container_width=True,
             num_rows="fixed",
@@ -3195,7 +3179,8 @@ if raw_df is not None:
                 # This bypasses any Sidebar lag that might have filtered base_df to the wrong branch. (e.g. Gangbuk)
                 
                 # 1. Start with Raw (but respect Role!)
-                mgr_df = raw_df[raw_df['관리지사'].astype(str).apply(lambda x: unicodedata.normalize('NFC', x)) == current_br_name].copy()
+                # 관리지사 is already NFC-normalized (data_loader.normalize_display_columns)
+                mgr_df = raw_df[raw_df['관리지사'].astype(str) == current_br_name].copy()
                 
                 # [SECURITY] Re-apply Manager Filter here because we started from raw_df
                 if st.session_state.user_role == 'manager':
@@ -4029,7 +4014,7 @@ if raw_df is not None:
             # [OVERHAUL] Pre-calculate record_key for Map
             # This ensures the key sent from Map matches the key used in Grid
             if not map_df.empty:
-                map_df['record_key'] = map_df.apply(lambda row: utils.generate_record_key(row.get('사업장명'), row.get('소재지전체주소')), axis=1)
+                map_df['record_key'] = utils.generate_record_keys(map_df['사업장명'], map_df['소재지전체주소'])
 
             st.markdown(f"**📍 조회된 업체**: {len(map_df):,} 개")
 
@@ -4261,7 +4246,7 @@ if raw_df is not None:
                 st.altair_chart(final_stack_chart, use_container_width=True, theme=None)
             
                 st.markdown("##### 👤 영업담당별 실적 Top 10")
-                mgr_counts = df['SP담당'].value_counts().head(10).reset_index()
+                mgr_counts = df['SP담당'].value_counts().loc[lambda c: c > 0].head(10).reset_index()
                 mgr_counts.columns = ['SP담당', 'count']
                 
                 mgr_chart = alt.Chart(mgr_counts).mark_bar(color="#4DB6AC", cornerRadiusTopRight=5, cornerRadiusBottomRight=5).encode(
@@ -4401,7 +4386,7 @@ if raw_df is not None:
 
         # [OPTIMIZATION] Vectorized Mapping for Activity Status
         if 'record_key' not in grid_df.columns:
-            grid_df['record_key'] = grid_df.apply(lambda row: activity_logger.get_record_key(row), axis=1)
+            grid_df['record_key'] = utils.generate_record_keys(grid_df['사업장명'], utils.record_address_series(grid_df))
 
         status_map = {k: v.get('활동진행상태', '') for k, v in status_data.items() if isinstance(v, dict)}
         note_map = {k: v.get('특이사항', '') for k, v in status_data.items() if isinstance(v, dict)}
@@ -0,0 +1,202 @@
+"""
+Ingestion benchmark: per-stage wall time and peak memory of load_and_process_data / process_api_data
+on synthetic LOCALDATA bundles (scripts/synthetic_localdata.py).
+
+Stages are reported through data_loader.STAGE_HOOK:
+  extract (zip open + header sniff), parse (CSV read), filter (dates + 2026 filter), key, dedup,
+  spill (streaming mode only), columns (mapping + KST dates), coords, district_load, address_match, merge
+
+Each case is run twice: under tracemalloc for per-stage peak memory, then for timing
+(tracemalloc slows Python code down, so its times are not reported). Both loader entry points
+are called unwrapped (no st.cache_data, no snapshot) so every run does the full work. The compiled
+district index and the address match memo are bypassed too: their in-process memos are cleared and
+snapshot_cache writes into a fresh temporary directory before every pass, so district_load and
+address_match are always measured cold.
+
+Usage:
+    python scripts/bench_ingest.py                          # 10k + 100k
+    python scripts/bench_ingest.py --sizes 1m --streaming   # nationwide-scale, bounded-memory mode
+    python scripts/bench_ingest.py --json out.json --baseline last.json   # fail on regressions
+"""
+
+import os
+import sys
+import json
+import time
+import logging
+import argparse
+import resource
+import tempfile
+import tracemalloc
+import warnings
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, 'scripts'))
+
+logging.getLogger('streamlit').setLevel(logging.ERROR)
+warnings.filterwarnings('ignore')
+
+from src import data_loader, snapshot_cache  # noqa: E402
+import synthetic_localdata  # noqa: E402
+
+STAGE_ORDER = ['extract', 'parse', 'filter', 'key', 'dedup', 'spill', 'columns', 'coords',
+               'district_load', 'address_match', 'merge']
+
+# Regressions smaller than this (seconds) are treated as noise
+MIN_REGRESSION_SEC = 0.05
+
+
+class StageRecorder:
+    """STAGE_HOOK callback: credits the time (and peak traced memory) since the last mark to `stage`."""
+
+    def __init__(self, memory=False):
+        self.memory = memory
+        self.times = {}
+        self.peaks = {}
+        self.last = time.perf_counter()
+
+    def __call__(self, stage):
+        now = time.perf_counter()
+        self.times[stage] = self.times.get(stage, 0.0) + (now - self.last)
+        if self.memory:
+            _, peak = tracemalloc.get_traced_memory()
+            self.peaks[stage] = max(self.peaks.get(stage, 0), peak)
+            tracemalloc.reset_peak()
+        self.last = time.perf_counter()
+
+
+def _cold_caches(cache_dir):
+    """Drops the in-process district index / match memos and points every snapshot_cache dir at `cache_dir`."""
+    data_loader._district_index_memo.clear()
+    data_loader._match_memo.clear()
+    snapshot_cache.SNAPSHOT_DIR = cache_dir
+    snapshot_cache.DISTRICT_INDEX_DIR = os.path.join(cache_dir, "district_index")
+    snapshot_cache.MATCH_MEMO_DIR = os.path.join(cache_dir, "match_memo")
+
+
+def _run(fn, memory):
+    recorder = StageRecorder(memory)
+    saved_dirs = (snapshot_cache.SNAPSHOT_DIR, snapshot_cache.DISTRICT_INDEX_DIR, snapshot_cache.MATCH_MEMO_DIR)
+    with tempfile.TemporaryDirectory(prefix="bench_ingest_") as cache_dir:
+        _cold_caches(cache_dir)
+        data_loader.STAGE_HOOK = recorder
+        if memory:
+            tracemalloc.start()
+        try:
+            t0 = time.perf_counter()
+            result = fn()
+            total = time.perf_counter() - t0
+        finally:
+            data_loader.STAGE_HOOK = None
+            if memory:
+                tracemalloc.stop()
+            # Nothing computed in this pass may leak into the next one (or into the user's cache)
+            data_loader._district_index_memo.clear()
+            data_loader._match_memo.clear()
+            snapshot_cache.SNAPSHOT_DIR, snapshot_cache.DISTRICT_INDEX_DIR, snapshot_cache.MATCH_MEMO_DIR = saved_dirs
+    return result, total, recorder
+
+
+def bench_case(name, fn, memory=True):
+    """Runs one case (timing pass + optional memory pass) and returns its report dict."""
+    peaks = {}
+    if memory:
+        # Memory pass first: it also warms up lazy imports before the timed pass
+        _, _, mem = _run(fn, memory=True)
+        peaks = mem.peaks
+    (final_df, _, err, stats), total, timing = _run(fn, memory=False)
+    if err:
+        raise RuntimeError(f"{name}: {err}")
+
+    stages = {}
+    for stage in STAGE_ORDER + sorted(set(timing.times) - set(STAGE_ORDER)):
+        if stage in timing.times:
+            stages[stage] = {'sec': round(timing.times[stage], 4),
+                             'peak_mb': round(peaks.get(stage, 0) / 1e6, 1) if memory else None}
+    return {'total_sec': round(total, 3), 'rows_out': int(len(final_df)), 'stats': stats, 'stages': stages}
+
+
+def print_report(name, report):
+    print(f"\n=== {name}: {report['total_sec']:.2f}s total, {report['rows_out']:,} rows out, stats={report['stats']} ===")
+    print(f"{'stage':<15}{'sec':>10}{'share':>8}{'peak MB':>10}")
+    total = report['total_sec'] or 1.0
+    for stage, m in report['stages'].items():
+        peak = f"{m['peak_mb']:.1f}" if m['peak_mb'] is not None else '-'
+        print(f"{stage:<15}{m['sec']:>10.3f}{m['sec'] / total:>8.0%}{peak:>10}")
+
+
+def compare(results, baseline, tolerance):
+    """Returns the list of (case, stage, old, new) whose time grew by more than `tolerance`."""
+    regressions = []
+    for case, report in results.items():
+        old_case = baseline.get(case)
+        if not old_case:
+            continue
+        for stage, m in report['stages'].items():
+            old = old_case['stages'].get(stage, {}).get('sec')
+            if old is not None and m['sec'] > old * (1 + tolerance) and m['sec'] - old > MIN_REGRESSION_SEC:
+                regressions.append((case, stage, old, m['sec']))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='LOCALDATA ingestion benchmark')
+    parser.add_argument('--sizes', type=str, default='10k,100k', help='Comma-separated presets (10k,100k,1m) or row counts')
+    parser.add_argument('--data-dir', type=str, default=os.path.join(ROOT, 'bench_data'), help='Where synthetic inputs are generated/reused')
+    parser.add_argument('--workers', type=int, default=1, help='Parse workers (1 keeps per-file stages in this process so they are attributed)')
+    parser.add_argument('--streaming', action='store_true', help='Force the bounded-memory streaming mode')
+    parser.add_argument('--api', action='store_true', help='Also benchmark process_api_data on the same rows')
+    parser.add_argument('--no-memory', action='store_true', help='Skip the tracemalloc pass')
+    parser.add_argument('--json', type=str, default=None, help='Write results to this JSON file')
+    parser.add_argument('--baseline', type=str, default=None, help='Previous --json output; exit 1 on regressions')
+    parser.add_argument('--tolerance', type=float, default=0.25, help='Allowed relative slowdown per stage vs --baseline')
+    args = parser.parse_args(argv)
+
+    os.makedirs(args.data_dir, exist_ok=True)
+    load = data_loader.load_and_process_data.__wrapped__
+    process_api = data_loader.process_api_data.__wrapped__
+    results = {}
+
+    for size in [s.strip() for s in args.sizes.split(',') if s.strip()]:
+        n_rows = synthetic_localdata.SIZES.get(size.lower()) or int(size)
+        zip_path = os.path.join(args.data_dir, f"LOCALDATA_NOWMON_CSV_synthetic_{n_rows}.zip")
+        district_path = os.path.join(args.data_dir, "synthetic_district.xlsx")
+        if not (os.path.exists(zip_path) and os.path.exists(district_path)):
+            print(f"Generating {n_rows:,} synthetic rows in {args.data_dir} ...")
+            zip_path, district_path = synthetic_localdata.generate(n_rows, args.data_dir)
+
+        case = f"zip_{size}" + ("_streaming" if args.streaming else "")
+        results[case] = bench_case(case, lambda: load(zip_path, district_path, workers=args.workers, use_snapshot=False,
+                                                      incremental=False, streaming=args.streaming or None),
+                                   memory=not args.no_memory)
+        print_report(case, results[case])
+
+        if args.api:
+            api_df = synthetic_localdata.to_api_frame(synthetic_localdata.generate_rows(n_rows))
+            case = f"api_{size}"
+            results[case] = bench_case(case, lambda: process_api(api_df.copy(), district_path),
+                                       memory=not args.no_memory)
+            print_report(case, results[case])
+
+    print(f"\nProcess max RSS: {resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024:.0f} MB")
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+        print(f"Results written to {args.json}")
+
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.tolerance)
+        for case, stage, old, new in regressions:
+            print(f"REGRESSION {case}/{stage}: {old:.3f}s -> {new:.3f}s")
+        if regressions:
+            return 1
+        print("No regressions against baseline.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,312 @@
+"""
+Synthetic LOCALDATA generator for the ingestion benchmark (scripts/bench_ingest.py).
+
+Produces, for a given row count:
+  - a cp949 LOCALDATA_NOWMON-style ZIP (one CSV per service category, real header layout)
+  - a district Excel (관리지사 / 영업구역 수정 / SP담당 / 주소시 / 주소군구 / 주소동)
+  - optionally an OpenAPI-shaped DataFrame (same columns as fetch_openapi_data)
+
+Addresses follow the real coverage: 서울/경기/강원 districts owned by the branches in
+CUSTOM_BRANCH_ORDER, plus uncovered 서울/경기 districts and other provinces that must not match.
+Everything is derived from a seed, so the same arguments always give the same files.
+
+Usage:
+    python scripts/synthetic_localdata.py --rows 100000 --out /tmp/localdata_bench
+"""
+
+import os
+import sys
+import random
+import zipfile
+import argparse
+import io
+
+import numpy as np
+import pandas as pd
+
+try:
+    from pyproj import Transformer
+    _to_5174 = Transformer.from_crs("epsg:4326", "epsg:5174", always_xy=True)
+except ImportError:
+    _to_5174 = None
+
+SIZES = {'10k': 10_000, '100k': 100_000, '1m': 1_000_000}
+
+# 시도 (full name in LOCALDATA, short name in the district file)
+SIDO = {
+    '서울': '서울특별시',
+    '경기': '경기도',
+    '강원': '강원특별자치도',
+    '부산': '부산광역시',
+    '대구': '대구광역시',
+    '대전': '대전광역시',
+}
+
+# Branch -> (시도, 군구 list) as in the district master
+BRANCH_COVERAGE = {
+    '중앙지사': [('서울', ['동대문구', '성동구', '성북구', '용산구', '종로구', '중구'])],
+    '강북지사': [('서울', ['강북구', '광진구', '노원구', '도봉구', '중랑구'])],
+    '서대문지사': [('서울', ['마포구', '서대문구', '은평구'])],
+    '고양지사': [('경기', ['고양시 덕양구', '고양시 일산동구', '고양시 일산서구', '파주시'])],
+    '의정부지사': [('경기', ['동두천시', '양주시', '연천군', '의정부시', '포천시']), ('강원', ['철원군'])],
+    '남양주지사': [('경기', ['구리시', '남양주시', '양평군', '가평군'])],
+    '강릉지사': [('강원', ['강릉시', '고성군', '동해시', '삼척시', '속초시', '양양군', '정선군', '태백시'])],
+    '원주지사': [('강원', ['원주시', '춘천시', '횡성군', '홍천군', '평창군', '영월군', '인제군', '양구군', '화천군'])],
+}
+
+# Districts present in LOCALDATA but not in the district file (rows stay 미지정)
+UNCOVERED = [
+    ('서울', ['강남구', '서초구', '송파구', '관악구', '영등포구', '강서구']),
+    ('경기', ['수원시 팔달구', '성남시 분당구', '용인시 수지구', '화성시', '부천시', '안산시 단원구']),
+    ('부산', ['해운대구', '부산진구']),
+    ('대구', ['수성구']),
+    ('대전', ['서구']),
+]
+
+# Rough bounding boxes (lat_min, lat_max, lon_min, lon_max) for coordinates
+BBOX = {
+    '서울': (37.45, 37.68, 126.80, 127.18),
+    '경기': (37.00, 38.10, 126.60, 127.60),
+    '강원': (37.10, 38.30, 127.60, 129.30),
+    '부산': (35.05, 35.25, 128.90, 129.20),
+    '대구': (35.80, 35.95, 128.50, 128.70),
+    '대전': (36.25, 36.45, 127.30, 127.50),
+}
+
+# Relative weight of a 군구 in the row distribution (dense cities vs rural 군)
+SIDO_WEIGHT = {'서울': 1.0, '경기': 0.8, '강원': 0.25, '부산': 0.8, '대구': 0.6, '대전': 0.5}
+
+DONG_STEMS = ['신정', '역삼', '청운', '효자', '사직', '삼청', '부암', '평창', '무악', '교남', '가회', '혜화',
+              '창신', '숭인', '신당', '약수', '청구', '회현', '명동', '필동', '장충', '광희', '을지', '황학',
+              '중앙', '석관', '장위', '월곡', '종암', '길음', '돈암', '안암', '보문', '정릉', '성수', '금호',
+              '옥수', '왕십리', '행당', '응봉', '사근', '마장', '송정', '용답', '중곡', '능동', '구의', '자양',
+              '화양', '군자', '상계', '중계', '하계', '공릉', '월계', '창동', '쌍문', '방학', '도봉', '면목']
+ROAD_STEMS = ['중앙', '평화', '통일', '세종', '충무', '을지', '퇴계', '동일', '한천', '노해', '마들', '왕산',
+              '양지', '시민', '장미', '진달래', '소나무', '은행', '느티', '새말', '푸른', '희망', '행복', '문화']
+SURNAMES = ['김', '이', '박', '최', '정', '강', '조', '윤', '장', '임', '한', '오', '서', '신', '권', '황']
+GIVEN = ['민준', '서연', '도윤', '지우', '하준', '서윤', '시우', '하은', '주원', '지민', '예준', '수아',
+         '건우', '지호', '현우', '유진', '승민', '다은', '준서', '채원']
+BIZ_WORDS = ['카페', '식당', '분식', '치킨', '약국', '의원', '마트', '헤어', '네일', '피트니스', '베이커리',
+             '한식', '국밥', '편의점', '세탁', '학원', '꽃집', '정육', '반찬', '커피']
+
+# (file name, service id, 업태구분명 choices, has 총면적)
+SERVICES = [
+    ('일반음식점', '07_24_04_P', ['한식', '분식', '경양식', '중국식', '일식', '호프/통닭'], False),
+    ('휴게음식점', '07_24_05_P', ['커피숍', '기타 휴게음식점', '패스트푸드', '편의점'], False),
+    ('제과점영업', '07_24_01_P', ['제과점영업'], False),
+    ('약국', '01_01_06_P', ['약국'], False),
+    ('의원', '01_01_02_P', ['의원', '치과의원', '한의원'], False),
+    ('미용업', '05_18_01_P', ['일반미용업', '네일미용업', '피부미용업'], False),
+    ('세탁업', '05_19_01_P', ['세탁업'], False),
+    ('숙박업', '05_17_01_P', ['여관업', '숙박업(생활)'], True),
+    ('체력단련장업', '10_39_01_P', ['체력단련장업'], True),
+    ('식품소분업', '07_23_01_P', ['식품소분업', '유통전문판매업'], False),
+]
+
+CSV_COLUMNS = ['번호', '개방서비스명', '개방서비스아이디', '개방자치단체코드', '관리번호', '인허가일자', '인허가취소일자',
+               '영업상태구분코드', '영업상태명', '상세영업상태코드', '상세영업상태명', '폐업일자', '휴업시작일자', '휴업종료일자',
+               '재개업일자', '소재지전화', '소재지면적', '소재지우편번호', '소재지전체주소', '도로명전체주소', '도로명우편번호',
+               '사업장명', '최종수정시점', '데이터갱신구분', '데이터갱신일자', '업태구분명', '좌표정보x(epsg5174)', '좌표정보y(epsg5174)']
+
+
+def _make_dongs(rng, gungu, n):
+    """Dong/읍/면 names of one 군구 (deterministic for a seeded rng)."""
+    suffix = ['읍', '면'] if gungu.endswith('군') else ['동']
+    names = []
+    for stem in rng.sample(DONG_STEMS, n):
+        name = stem + rng.choice(suffix)
+        if suffix == ['동'] and rng.random() < 0.3:
+            name = f"{stem}{rng.randint(1, 3)}동"
+        names.append(name)
+    return names
+
+
+def build_geography(seed=0):
+    """
+    Returns (districts, areas):
+      districts: rows of the district Excel
+      areas: one entry per (시도, 군구) with its dongs, owner branch (or None), weight and center
+    """
+    rng = random.Random(seed)
+    districts, areas = [], []
+    zone_no = 100
+
+    def add_area(sido, gungu, branch):
+        lat0, lat1, lon0, lon1 = BBOX[sido]
+        dongs = _make_dongs(rng, gungu, rng.randint(6, 14) if gungu.endswith('군') else rng.randint(10, 20))
+        weight = SIDO_WEIGHT[sido] * (0.3 if gungu.endswith('군') else 1.0)
+        center = (rng.uniform(lat0, lat1), rng.uniform(lon0, lon1))
+        areas.append({'sido': sido, 'gungu': gungu, 'dongs': dongs, 'branch': branch, 'weight': weight, 'center': center})
+        return dongs
+
+    for branch, coverage in BRANCH_COVERAGE.items():
+        for sido, gungus in coverage:
+            for gungu in gungus:
+                dongs = add_area(sido, gungu, branch)
+                # A zone (영업구역) spans a few dongs, one SP per zone
+                for start in range(0, len(dongs), 4):
+                    zone_no += 1
+                    manager = rng.choice(SURNAMES) + rng.choice(GIVEN)
+                    for dong in dongs[start:start + 4]:
+                        districts.append({'관리지사': branch, '영업구역 수정': f"G000{zone_no}", 'SP사번': float(rng.randint(1000, 9999)),
+                                          'SP담당': manager, '주소시': sido, '주소군구': gungu, '주소동': dong})
+    for sido, gungus in UNCOVERED:
+        for gungu in gungus:
+            add_area(sido, gungu, None)
+    return districts, areas
+
+
+def _to_epsg5174(lats, lons):
+    if _to_5174 is None:
+        return np.full(len(lats), np.nan), np.full(len(lats), np.nan)
+    return _to_5174.transform(lons, lats)
+
+
+def generate_rows(n_rows, seed=0, dup_rate=0.05):
+    """LOCALDATA-shaped DataFrame with `n_rows` rows (before splitting into service CSVs)."""
+    _, areas = build_geography(seed)
+    rs = np.random.default_rng(seed)
+    n_unique = int(n_rows * (1 - dup_rate))
+
+    weights = np.array([a['weight'] for a in areas])
+    area_idx = rs.choice(len(areas), size=n_unique, p=weights / weights.sum())
+    dong_pick = rs.random(n_unique)
+
+    sido_full = np.array([SIDO[areas[i]['sido']] for i in area_idx], dtype=object)
+    gungu = np.array([areas[i]['gungu'] for i in area_idx], dtype=object)
+    dong = np.array([areas[i]['dongs'][int(p * len(areas[i]['dongs']))] for i, p in zip(area_idx, dong_pick)], dtype=object)
+
+    bunji = rs.integers(1, 900, n_unique).astype(str)
+    ho = rs.integers(1, 60, n_unique).astype(str)
+    jibun = pd.Series(sido_full) + ' ' + gungu + ' ' + dong + ' ' + bunji + '-' + ho
+    has_bldg = rs.random(n_unique) < 0.4
+    jibun = jibun.where(~has_bldg, jibun + ' ' + pd.Series(rs.choice(ROAD_STEMS, n_unique)) + '빌딩')
+
+    road = (pd.Series(sido_full) + ' ' + gungu + ' ' + pd.Series(rs.choice(ROAD_STEMS, n_unique)) + '로 ' +
+            pd.Series(rs.integers(1, 400, n_unique).astype(str)) + ', ' + pd.Series(rs.integers(1, 6, n_unique).astype(str)) +
+            '층 (' + dong + ')')
+
+    names = (pd.Series(rs.choice(BIZ_WORDS, n_unique)) + ' ' + pd.Series(rs.choice(DONG_STEMS, n_unique)) + '점 ' +
+             pd.Series(np.arange(n_unique).astype(str)))
+
+    # Status mix: mostly active; closures carry a 폐업일자
+    closed = rs.random(n_unique) < 0.2
+    # Monthly change bundles are mostly this year's permits; the rest is older history the 2026 filter drops
+    recent = rs.random(n_unique) < 0.7
+    permit_offset = np.where(recent, rs.integers(0, 48, n_unique), rs.integers(-3000, 0, n_unique))
+    permit = pd.to_datetime('2026-01-01') + pd.to_timedelta(permit_offset, unit='D')
+    close_date = pd.to_datetime('2026-01-01') + pd.to_timedelta(rs.integers(-30, 48, n_unique), unit='D')
+
+    centers = np.array([areas[i]['center'] for i in area_idx])
+    lats = centers[:, 0] + rs.normal(0, 0.01, n_unique)
+    lons = centers[:, 1] + rs.normal(0, 0.01, n_unique)
+    xs, ys = _to_epsg5174(lats, lons)
+    has_coord = rs.random(n_unique) < 0.9
+
+    svc_idx = rs.integers(0, len(SERVICES), n_unique)
+    biz_type = np.empty(n_unique, dtype=object)
+    for i, (_, _, choices, _) in enumerate(SERVICES):
+        mask = svc_idx == i
+        biz_type[mask] = rs.choice(choices, mask.sum())
+        
+    df = pd.DataFrame({
+        '개방서비스명': np.array([svc[0] for svc in SERVICES], dtype=object)[svc_idx],
+        '개방서비스아이디': np.array([svc[1] for svc in SERVICES], dtype=object)[svc_idx],
+        '개방자치단체코드': rs.integers(3000000, 5000000, n_unique).astype(str),
+        '관리번호': [f"PHMD{seed:02d}{i:012d}" for i in range(n_unique)],
+        '인허가일자': permit.strftime('%Y-%m-%d'),
+        '인허가취소일자': '',
+        '영업상태구분코드': np.where(closed, '03', '01'),
+        '영업상태명': np.where(closed, '폐업', '영업/정상'),
+        '상세영업상태코드': np.where(closed, '02', '13'),
+        '상세영업상태명': np.where(closed, '폐업', '영업중'),
+        '폐업일자': np.where(closed, close_date.strftime('%Y-%m-%d'), ''),
+        '휴업시작일자': '',
+        '휴업종료일자': '',
+        '재개업일자': '',
+        '소재지전화': np.where(rs.random(n_unique) < 0.5, '02-' + pd.Series(rs.integers(1000, 9999, n_unique).astype(str)) + '-' +
+                          pd.Series(rs.integers(1000, 9999, n_unique).astype(str)), ''),
+        '소재지면적': np.round(rs.gamma(2.0, 40.0, n_unique), 2).astype(str),
+        '소재지우편번호': '',
+        '소재지전체주소': jibun.values,
+        '도로명전체주소': road.values,
+        '도로명우편번호': rs.integers(10000, 63000, n_unique).astype(str),
+        '사업장명': names.values,
+        '최종수정시점': (permit + pd.to_timedelta(rs.integers(0, 86400, n_unique), unit='s')).strftime('%Y-%m-%d %H:%M:%S'),
+        '데이터갱신구분': 'I',
+        '데이터갱신일자': '2026-02-17 00:20:02',
+        '업태구분명': biz_type,
+        '좌표정보x(epsg5174)': np.where(has_coord, np.round(xs, 6).astype(str), ''),
+        '좌표정보y(epsg5174)': np.where(has_coord, np.round(ys, 6).astype(str), ''),
+        '_svc': svc_idx,
+    })
+
+    # Re-registered businesses: same name/address with a different permit date (exercises dedup)
+    n_dup = n_rows - n_unique
+    if n_dup > 0:
+        dups = df.iloc[rs.integers(0, n_unique, n_dup)].copy()
+        shifted = pd.to_datetime(dups['인허가일자']) + pd.to_timedelta(rs.integers(-400, 30, n_dup), unit='D')
+        dups['인허가일자'] = shifted.dt.strftime('%Y-%m-%d').values
+        dups['관리번호'] = [f"PHMD{seed:02d}D{i:011d}" for i in range(n_dup)]
+        df = pd.concat([df, dups], ignore_index=True)
+    return df
+
+
+def write_bundle(df, out_dir, name):
+    """Writes one cp949 CSV per service into `<out_dir>/<name>.zip`; returns the ZIP path."""
+    zip_path = os.path.join(out_dir, f"{name}.zip")
+    with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zf:
+        for svc_i, (svc_name, svc_id, _, has_total) in enumerate(SERVICES):
+            part = df[df['_svc'] == svc_i].drop(columns=['_svc']).reset_index(drop=True)
+            part.insert(0, '번호', np.arange(1, len(part) + 1))
+            part = part[CSV_COLUMNS]
+            if has_total:
+                part['총면적'] = part['소재지면적']
+            buf = io.StringIO()
+            part.to_csv(buf, index=False)
+            zf.writestr(f"(20260201~20260217)_{svc_id}_{svc_name}.csv", buf.getvalue().encode('cp949', errors='replace'))
+    return zip_path
+
+
+def write_district(out_dir, seed=0):
+    districts, _ = build_geography(seed)
+    path = os.path.join(out_dir, "synthetic_district.xlsx")
+    pd.DataFrame(districts).to_excel(path, index=False)
+    return path
+
+
+def to_api_frame(df):
+    """OpenAPI-shaped frame (fetch_openapi_data columns: YYYYMMDD dates, 좌표정보(X)/(Y))."""
+    api = df.drop(columns=['_svc']).rename(columns={'좌표정보x(epsg5174)': '좌표정보(X)', '좌표정보y(epsg5174)': '좌표정보(Y)'})
+    for col in ['인허가일자', '폐업일자']:
+        api[col] = api[col].str.replace('-', '', regex=False)
+    api['총면적'] = ''
+    keep = ['개방자치단체코드', '관리번호', '개방서비스아이디', '개방서비스명', '사업장명', '소재지전체주소', '도로명전체주소',
+            '소재지전화', '인허가일자', '폐업일자', '휴업시작일자', '휴업종료일자', '재개업일자', '영업상태명', '업태구분명',
+            '좌표정보(X)', '좌표정보(Y)', '소재지면적', '총면적']
+    return api[keep].replace('', None)
+
+
+def generate(n_rows, out_dir, seed=0):
+    """Writes the bundle ZIP and district Excel for `n_rows`; returns (zip_path, district_path)."""
+    os.makedirs(out_dir, exist_ok=True)
+    df = generate_rows(n_rows, seed)
+    zip_path = write_bundle(df, out_dir, f"LOCALDATA_NOWMON_CSV_synthetic_{n_rows}")
+    return zip_path, write_district(out_dir, seed)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Synthetic LOCALDATA bundle + district file generator')
+    parser.add_argument('--rows', type=str, default='100k', help="Row count or preset (10k, 100k, 1m)")
+    parser.add_argument('--out', type=str, default='bench_data', help='Output directory')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args(argv)
+
+    n_rows = SIZES.get(args.rows.lower()) or int(args.rows)
+    zip_path, district_path = generate(n_rows, args.out, args.seed)
+    print(f"Bundle:   {zip_path} ({os.path.getsize(zip_path) / 1e6:.1f} MB, {n_rows:,} rows)")
+    print(f"District: {district_path}")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -4,6 +4,9 @@ import os
 from datetime import datetime
 from pathlib import Path
 import pandas as pd
+from .activity_store import SqliteActivityStore, ACTIVITY_STATUS, VISIT_REPORTS, CHANGE_HISTORY
+from . import event_log
+from .config import ACTIVITY_STORE
 try:
     import streamlit as st
     from streamlit_gsheets import GSheetsConnection
@@ -147,14 +150,117 @@ ACTIVITY_STATUS_FILE = STORAGE_DIR / "activity_status.json"
 CHANGE_HISTORY_FILE = STORAGE_DIR / "change_history.json"
 MAINTENANCE_FILE = STORAGE_DIR / "maintenance.json"
 
+# [NEW] Row-level SQLite (WAL) storage for the activity files (ACTIVITY_STORE='json' keeps whole-file JSON)
+ACTIVITY_DB_FILE = STORAGE_DIR / "activity.db"
+STORE_TABLES = {"activity_status.json": ACTIVITY_STATUS, "visit_reports.json": VISIT_REPORTS,
+                "change_history.json": CHANGE_HISTORY}
+_store = None
+_store_failed = False
+
+def get_activity_store():
+    """
+    Returns the shared SqliteActivityStore (created and migrated from the JSON files on first use),
+    or None when the JSON backend is configured or the database cannot be opened.
+    """
+    global _store, _store_failed
+    if ACTIVITY_STORE != "sqlite" or _store_failed:
+        return None
+    if _store is None:
+        try:
+            store = SqliteActivityStore(ACTIVITY_DB_FILE)
+            for filename, table in STORE_TABLES.items():
+                if store.migrate_json(table, STORAGE_DIR / filename):
+                    print(f"Migrated {filename} into {ACTIVITY_DB_FILE}")
+            _store = store
+        except Exception as e:
+            print(f"Activity store unavailable, falling back to JSON files: {e}")
+            _store_failed = True
+    return _store
+
+def _store_table(filepath):
+    """Store table backing a JSON file path, or None for files kept as JSON."""
+    return STORE_TABLES.get(Path(filepath).name) if get_activity_store() else None
+
+def _sync_store_table(table):
+    """Mirrors a store table to Google Sheets after a row-level write (same upload as save_json_file)."""
+    sync_to_gsheet(f"{table}.json", lambda: get_activity_store().load(table))
+
+# [NEW] Append-only JSONL log streams (see event_log): file name -> number of recent entries returned by
+# whole-file loads and mirrored to Google Sheets (the old truncation caps; older entries are archived, not dropped)
+LOGS_DIR = STORAGE_DIR / "logs"
+LOG_STREAMS = {"access_logs.json": 1000, "usage_logs.json": 10000, "view_logs.json": 2000}
+_migrated_logs = set()
+
+def _log_dir(filepath):
+    """Segment directory of a log stream, migrating its legacy JSON array on first use."""
+    filepath = Path(filepath)
+    log_dir = LOGS_DIR / filepath.stem
+    if filepath.name not in _migrated_logs:
+        _migrated_logs.add(filepath.name)
+        if event_log.migrate_json_log(log_dir, filepath):
+            print(f"Migrated {filepath.name} into {log_dir}")
+    return log_dir
+
+def append_log(filepath, entry):
+    """Appends one entry to a log stream (constant-time) and mirrors the recent window to Google Sheets."""
+    filepath = Path(filepath)
+    log_dir = _log_dir(filepath)
+    try:
+        event_log.append_event(log_dir, entry)
+    except Exception as e:
+        print(f"DEBUG: Error appending to {log_dir}: {e}")
+        return False
+    sync_to_gsheet(filepath.name, lambda: event_log.read_events(log_dir, limit=LOG_STREAMS[filepath.name]))
+    return True
+
+def read_log(filepath, days=None, limit=None):
+    """Entries of a log stream; `days` reads only the segments of that many recent days."""
+    return event_log.read_events(_log_dir(filepath), days=days, limit=limit)
+
+def local_logs_exist():
+    """True if any access log entry is stored locally (otherwise the app pulls history from Google Sheets)."""
+    return bool(event_log.list_segments(_log_dir(ACCESS_LOG_FILE)))
+
+def _saved_status(record_key):
+    """Stored activity status of one record ({} if none): an indexed lookup on the store backend."""
+    store = get_activity_store()
+    saved = store.get_status(record_key) if store else load_json_file(ACTIVITY_STATUS_FILE).get(record_key)
+    return saved or {}
+
+def _upsert_statuses(entries):
+    """Writes {record_key: status entry}: row upserts on the store backend, whole-file rewrite on JSON."""
+    store = get_activity_store()
+    if store:
+        store.upsert_statuses(entries)
+        _sync_store_table(ACTIVITY_STATUS)
+        return
+    statuses = load_json_file(ACTIVITY_STATUS_FILE)
+    statuses.update(entries)
+    save_json_file(ACTIVITY_STATUS_FILE, statuses)
+
+def _append_entries(filepath, entries, keep=None):
+    """Appends entries to a list file (visit reports / change history), keeping only the last `keep`."""
+    table = _store_table(filepath)
+    if table:
+        get_activity_store().append(table, entries, keep=keep)
+        _sync_store_table(table)
+        return
+    data = load_json_file(filepath)
+    if not isinstance(data, list): data = []
+    data.extend(entries)
+    if keep is not None and len(data) > keep:
+        data = data[-keep:]
+    save_json_file(filepath, data)
+
 # [NEW] Diagnostic Helper
 def get_storage_info():
     """Returns storage directory and file existence status"""
     files = {
-        "access_logs": ACCESS_LOG_FILE.exists(),
-        "usage_logs": USAGE_LOG_FILE.exists(),
-        "view_logs": VIEW_LOG_FILE.exists(),
+        "access_logs": (LOGS_DIR / ACCESS_LOG_FILE.stem).exists() or ACCESS_LOG_FILE.exists(),
+        "usage_logs": (LOGS_DIR / USAGE_LOG_FILE.stem).exists() or USAGE_LOG_FILE.exists(),
+        "view_logs": (LOGS_DIR / VIEW_LOG_FILE.stem).exists() or VIEW_LOG_FILE.exists(),
         "activity_status": ACTIVITY_STATUS_FILE.exists(),
+        "activity_db": ACTIVITY_DB_FILE.exists(),
         "maintenance": MAINTENANCE_FILE.exists()
     }
     return str(STORAGE_DIR), files
@@ -184,6 +290,15 @@ def normalize_status(status_str):
 def load_json_file(filepath):
     """Load JSON file, return empty dict/list if not exists or corrupted"""
     filepath = Path(filepath) # Ensure Path object
+    if filepath.name in LOG_STREAMS:
+        return read_log(filepath, limit=LOG_STREAMS[filepath.name])
+    table = _store_table(filepath)
+    if table:
+        try:
+            return get_activity_store().load(table)
+        except Exception as e:
+            print(f"Error loading {table} from {ACTIVITY_DB_FILE}: {e}")
+            return {} if table == ACTIVITY_STATUS else []
     if filepath.exists():
         try:
             with open(filepath, 'r', encoding='utf-8') as f:
@@ -222,6 +337,26 @@ def set_maintenance_mode(enabled, message=None):
 def save_json_file(filepath, data):
     """Save data to JSON file atomically (Write to temp -> Rename)"""
     filepath = Path(filepath) # Ensure Path object
+    if filepath.name in LOG_STREAMS:
+        # [NEW] Whole-list writes (sheet pull) replace the live segments; archives are kept
+        try:
+            event_log.replace_events(_log_dir(filepath), data if isinstance(data, list) else [])
+            sync_to_gsheet(filepath.name, data)
+            return True
+        except Exception as e:
+            print(f"DEBUG: Error saving {filepath.name} log segments: {e}")
+            return False
+    table = _store_table(filepath)
+    if table:
+        # [NEW] Whole-collection replace in one transaction (sheet pulls, external writers)
+        try:
+            get_activity_store().replace(table, data)
+            sync_to_gsheet(filepath.name, data)
+            return True
+        except Exception as e:
+            print(f"DEBUG: Error saving {table} to {ACTIVITY_DB_FILE}: {e}")
+            st.error(f"⚠️ 데이터 저장 오류 ({filepath.name}): {e}")
+            return False
     try:
         # Ensure parent dir exists
         if hasattr(filepath, 'parent'):
@@ -272,6 +407,10 @@ def sync_to_gsheet(filename, data, **kwargs):
         if "connections" not in st.secrets or "gsheets" not in st.secrets.connections:
             st.warning("⚠️ 구글 시트 연결 설정(Secrets)이 누락되었습니다. 데이터가 서버에만 저장됩니다.")
             return
+        
+        # Row-level store writes pass a loader so the full table is only read when a sheet is configured
+        if callable(data):
+            data = data()
             
         conn = st.connection("gsheets", type=GSheetsConnection)
         
@@ -581,8 +720,6 @@ def push_to_gsheet():
 
 def log_access(user_role, user_name, action="login"):
     """Log user access"""
-    logs = load_json_file(ACCESS_LOG_FILE)
-    
     log_entry = {
         "timestamp": utils.get_now_kst_str(),
         "user_role": user_role,
@@ -590,18 +727,14 @@ def log_access(user_role, user_name, action="login"):
         "action": action
     }
     
-    logs.append(log_entry)
-    
-    # Keep only last 1000 entries
-    if len(logs) > 1000:
-        logs = logs[-1000:]
-    
-    save_json_file(ACCESS_LOG_FILE, logs)
+    # [OPTIMIZATION] Constant-time append (old entries are archived instead of truncated)
+    append_log(ACCESS_LOG_FILE, log_entry)
 
 
 def get_access_logs(limit=200, days=None):
     """Get recent access logs with optional date filtering"""
-    logs = load_json_file(ACCESS_LOG_FILE)
+    # Only the segments of the requested window (or enough recent ones for `limit`) are read
+    logs = read_log(ACCESS_LOG_FILE, days=days) if days else read_log(ACCESS_LOG_FILE, limit=limit)
     if not logs: return []
     
     if days:
@@ -652,13 +785,12 @@ def get_record_key(row):
 
 def get_activity_status(record_key):
     """Get activity status for a record"""
-    statuses = load_json_file(ACTIVITY_STATUS_FILE)
-    return statuses.get(record_key, {
+    return _saved_status(record_key) or {
         "활동진행상태": "",
         "특이사항": "",
         "변경일시": "",
         "변경자": ""
-    })
+    }
 
 
 def save_activity_status(record_key, status, notes, user_name, user_branch=None, user_role=None):
@@ -669,8 +801,8 @@ def save_activity_status(record_key, status, notes, user_name, user_branch=None,
     from src import utils
     status = normalize_status(status)
     
-    statuses = load_json_file(ACTIVITY_STATUS_FILE)
-    old_data = statuses.get(record_key, {})
+    # [OPTIMIZATION] Single-record read/upsert instead of rewriting the whole status file
+    old_data = _saved_status(record_key)
     
     ts_str = utils.get_now_kst_str()
     
@@ -685,8 +817,7 @@ def save_activity_status(record_key, status, notes, user_name, user_branch=None,
     }
 
     
-    statuses[record_key] = new_data
-    save_json_file(ACTIVITY_STATUS_FILE, statuses)
+    _upsert_statuses({record_key: new_data})
     
     # Log Change if different
     if old_data.get("활동진행상태") != status or old_data.get("특이사항") != notes:
@@ -713,10 +844,7 @@ def save_activity_status(record_key, status, notes, user_name, user_branch=None,
                 "resulting_status": status
             }
             
-            reports = load_json_file(VISIT_REPORT_FILE)
-            if not isinstance(reports, list): reports = []
-            reports.append(visit_entry)
-            save_json_file(VISIT_REPORT_FILE, reports)
+            _append_entries(VISIT_REPORT_FILE, [visit_entry])
             
     return True
 
@@ -724,8 +852,6 @@ def save_activity_status(record_key, status, notes, user_name, user_branch=None,
 
 def log_change_history(record_key, old_data, new_data, user_name):
     """Log change to history"""
-    history = load_json_file(CHANGE_HISTORY_FILE)
-    
     change_entry = {
         "timestamp": utils.get_now_kst_str(),
         "record_key": record_key,
@@ -736,17 +862,15 @@ def log_change_history(record_key, old_data, new_data, user_name):
         "new_notes": new_data.get("특이사항", "")
     }
     
-    history.append(change_entry)
-    
     # Keep only last 5000 entries
-    if len(history) > 5000:
-        history = history[-5000:]
-    
-    save_json_file(CHANGE_HISTORY_FILE, history)
+    _append_entries(CHANGE_HISTORY_FILE, [change_entry], keep=5000)
 
 
 def get_change_history(record_key=None, limit=100):
     """Get change history, optionally filtered by record_key"""
+    store = get_activity_store()
+    if store:
+        return store.query(CHANGE_HISTORY, limit=limit, record_key=record_key)
     history = load_json_file(CHANGE_HISTORY_FILE)
     
     if record_key:
@@ -757,6 +881,9 @@ def get_change_history(record_key=None, limit=100):
     
 def get_user_activity_keys(user_name):
     """Get list of record keys that have been modified by this user"""
+    store = get_activity_store()
+    if store:
+        return store.status_keys_by_user(user_name)
     statuses = load_json_file(ACTIVITY_STATUS_FILE)
     if not statuses: return []
     
@@ -775,8 +902,6 @@ def get_user_activity_keys(user_name):
 
 def log_view(user_role, user_name, target, details):
     """Log view/search activity"""
-    logs = load_json_file(VIEW_LOG_FILE)
-    
     log_entry = {
         "timestamp": utils.get_now_kst_str(),
         "user_role": user_role,
@@ -785,17 +910,11 @@ def log_view(user_role, user_name, target, details):
         "details": details
     }
     
-    logs.append(log_entry)
-    
-    # Keep only last 2000 entries (views happen more often)
-    if len(logs) > 2000:
-        logs = logs[-2000:]
-        
-    save_json_file(VIEW_LOG_FILE, logs)
+    append_log(VIEW_LOG_FILE, log_entry)
 
 def get_view_logs(limit=100):
     """Get recent view logs"""
-    logs = load_json_file(VIEW_LOG_FILE)
+    logs = read_log(VIEW_LOG_FILE, limit=limit)
     return logs[-limit:] if logs else []
 
 
@@ -896,15 +1015,11 @@ def register_visit(record_key, content, audio_file, photo_files, user_info, forc
         # 5. EXECUTE WRITES (Sequential)
         
         # A. Reports
-        reports = load_json_file(VISIT_REPORT_FILE)
-        reports.append(visit_entry)
-        save_json_file(VISIT_REPORT_FILE, reports)
+        _append_entries(VISIT_REPORT_FILE, [visit_entry])
         
         # B. Status & History
-        statuses = load_json_file(ACTIVITY_STATUS_FILE)
-        old_data = statuses.get(record_key, {})
-        statuses[record_key] = status_entry
-        save_json_file(ACTIVITY_STATUS_FILE, statuses)
+        old_data = _saved_status(record_key)
+        _upsert_statuses({record_key: status_entry})
         
         # Log History if changed
         if old_data.get("활동진행상태") != new_status or old_data.get("특이사항") != content:
@@ -922,21 +1037,20 @@ def register_visit_batch(batch_list):
     BATCH OPERATION: Register multiple visits efficiently.
     - batch_list: list of dicts {record_key, content, user_info, forced_status}
     
-    1. Load all files once
+    1. Read the current status of each record once
     2. Process updates in memory
-    3. Save files once
+    3. Write all new reports and statuses at once
     """
     if not batch_list:
         return True, "No changes"
         
     try:
         # 1. Load data
-        reports = load_json_file(VISIT_REPORT_FILE)
-        if not isinstance(reports, list): reports = []
+        reports = []
         
         from src import utils
         from dateutil import parser
-        statuses = load_json_file(ACTIVITY_STATUS_FILE)
+        statuses = {}
         
         ts_str = utils.get_now_kst_str()
         try:
@@ -976,7 +1090,7 @@ def register_visit_batch(batch_list):
             reports.append(visit_entry)
             
             # 3. Update activity status (Latest status)
-            old_status_data = statuses.get(record_key, {})
+            old_status_data = statuses[record_key] if record_key in statuses else _saved_status(record_key)
             
             new_status_data = {
                 "활동진행상태": new_status,
@@ -996,8 +1110,8 @@ def register_visit_batch(batch_list):
                 log_change_history(record_key, old_status_data, new_status_data, user_info.get("name"))
                 
         # 3. Save files
-        save_json_file(VISIT_REPORT_FILE, reports)
-        save_json_file(ACTIVITY_STATUS_FILE, statuses)
+        _append_entries(VISIT_REPORT_FILE, reports)
+        _upsert_statuses(statuses)
         
         return True, f"{len(batch_list)}건 저장 완료"
         
@@ -1014,13 +1128,16 @@ def update_visit_report(report_id, new_content=None, new_photo_files=None, delet
     - deleted_photo_indices: List of indices (0, 1, 2) to clear
     """
     try:
-        reports = load_json_file(VISIT_REPORT_FILE)
-        target_idx = next((i for i, r in enumerate(reports) if r.get("id") == report_id), -1)
+        store = get_activity_store()
+        if store:
+            report = store.get_report(report_id)
+        else:
+            reports = load_json_file(VISIT_REPORT_FILE)
+            target_idx = next((i for i, r in enumerate(reports) if r.get("id") == report_id), -1)
+            report = reports[target_idx] if target_idx != -1 else None
         
-        if target_idx == -1:
+        if report is None:
             return False, "리포트를 찾을 수 없습니다."
-            
-        report = reports[target_idx]
         
         # 1. Update Content
         if new_content is not None:
@@ -1087,8 +1204,12 @@ def update_visit_report(report_id, new_content=None, new_photo_files=None, delet
             report['photo_path'] = report['photo_path1']
             
         # Prepare for save
-        reports[target_idx] = report
-        save_json_file(VISIT_REPORT_FILE, reports)
+        if store:
+            store.update_report(report_id, report)
+            _sync_store_table(VISIT_REPORTS)
+        else:
+            reports[target_idx] = report
+            save_json_file(VISIT_REPORT_FILE, reports)
         
         return True, "수정 완료"
         
@@ -1099,6 +1220,13 @@ def update_visit_report(report_id, new_content=None, new_photo_files=None, delet
 
 def delete_visit_report(report_id):
     """지정된 ID의 방문/활동 이력을 삭제합니다."""
+    store = get_activity_store()
+    if store:
+        if not store.delete_reports(report_id):
+            return False, "Report not found."
+        _sync_store_table(VISIT_REPORTS)
+        return True, "Deleted successfully."
+
     reports = load_json_file(VISIT_REPORT_FILE)
     if not isinstance(reports, list): return False, "No data found."
     
@@ -1112,6 +1240,12 @@ def delete_visit_report(report_id):
 
 # Read Methods
 def get_visit_reports(record_key=None, user_name=None, user_branch=None, limit=100):
+    # [OPTIMIZATION] Indexed query on the store backend (IDs are already fixed on insert)
+    store = get_activity_store()
+    if store:
+        return store.query(VISIT_REPORTS, newest_first=True, limit=limit,
+                           record_key=record_key, user_name=user_name, user_branch=user_branch)
+
     reports = load_json_file(VISIT_REPORT_FILE)
     if not isinstance(reports, list): reports = []
     
@@ -0,0 +1,227 @@
+"""
+Embedded SQLite (WAL) storage for activity_status, visit_reports and change_history.
+
+Each entry is stored as one row (its JSON document plus the indexed fields record_key, user_name,
+user_branch, timestamp), so saving one status or appending one report is a single upsert/insert
+instead of rewriting a whole JSON file. Whole-collection load/replace keep the JSON file shapes
+(dict by record_key for activity_status, list in insertion order for the others), and
+migrate_json imports a legacy JSON file once.
+"""
+
+import json
+import sqlite3
+from contextlib import closing
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+ACTIVITY_STATUS = "activity_status"
+VISIT_REPORTS = "visit_reports"
+CHANGE_HISTORY = "change_history"
+TABLES = (ACTIVITY_STATUS, VISIT_REPORTS, CHANGE_HISTORY)
+
+# Seconds a writer waits for another process/thread holding the write lock
+BUSY_TIMEOUT = 30
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+
+CREATE TABLE IF NOT EXISTS activity_status (
+    record_key TEXT PRIMARY KEY,
+    user_name TEXT,
+    timestamp TEXT,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_status_user ON activity_status (user_name);
+CREATE INDEX IF NOT EXISTS idx_status_ts ON activity_status (timestamp);
+
+CREATE TABLE IF NOT EXISTS visit_reports (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    id TEXT,
+    record_key TEXT,
+    user_name TEXT,
+    user_branch TEXT,
+    timestamp TEXT,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_reports_id ON visit_reports (id);
+CREATE INDEX IF NOT EXISTS idx_reports_key ON visit_reports (record_key, timestamp);
+CREATE INDEX IF NOT EXISTS idx_reports_user ON visit_reports (user_name, timestamp);
+CREATE INDEX IF NOT EXISTS idx_reports_branch ON visit_reports (user_branch, timestamp);
+CREATE INDEX IF NOT EXISTS idx_reports_ts ON visit_reports (timestamp);
+
+CREATE TABLE IF NOT EXISTS change_history (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    record_key TEXT,
+    user_name TEXT,
+    timestamp TEXT,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_history_key ON change_history (record_key);
+CREATE INDEX IF NOT EXISTS idx_history_ts ON change_history (timestamp);
+"""
+
+
+def _text(value: Any) -> Optional[str]:
+    """Indexed column value: strings as is, other non-null scalars as text."""
+    if value is None or isinstance(value, (dict, list)):
+        return None
+    if isinstance(value, float) and value != value:  # NaN from sheet pulls
+        return None
+    return value if isinstance(value, str) else str(value)
+
+
+def _dumps(entry: Dict[str, Any]) -> str:
+    return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+def report_id_fix(entry: Dict[str, Any]) -> str:
+    """Stable ID for legacy reports saved without one (same scheme as get_visit_reports)."""
+    ts = entry.get('timestamp', '00000000')
+    rk = entry.get('record_key', 'unk')
+    return f"rep_fix_{ts}_{rk[:5]}".replace(" ", "_").replace(":", "").replace("-", "")
+
+
+class SqliteActivityStore:
+    """Row-level store over one SQLite database in WAL mode (readers never block the writer)."""
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = str(path)
+        Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        with closing(self._connect()) as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(_SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        # One short-lived connection per operation: safe across Streamlit's script threads
+        conn = sqlite3.connect(self.path, timeout=BUSY_TIMEOUT)
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    # ----- rows -----
+
+    @staticmethod
+    def _row(table: str, entry: Dict[str, Any], key: Optional[str] = None) -> Tuple:
+        if table == ACTIVITY_STATUS:
+            return (key, _text(entry.get("변경자")), _text(entry.get("변경일시")), _dumps(entry))
+        if table == VISIT_REPORTS:
+            if 'id' not in entry:
+                entry = dict(entry, id=report_id_fix(entry))
+            return (_text(entry.get("id")), _text(entry.get("record_key")), _text(entry.get("user_name")),
+                    _text(entry.get("user_branch")), _text(entry.get("timestamp")), _dumps(entry))
+        return (_text(entry.get("record_key")), _text(entry.get("user")), _text(entry.get("timestamp")), _dumps(entry))
+
+    _INSERT = {
+        ACTIVITY_STATUS: "INSERT INTO activity_status (record_key, user_name, timestamp, data) VALUES (?, ?, ?, ?) "
+                         "ON CONFLICT(record_key) DO UPDATE SET user_name = excluded.user_name, "
+                         "timestamp = excluded.timestamp, data = excluded.data",
+        VISIT_REPORTS: "INSERT INTO visit_reports (id, record_key, user_name, user_branch, timestamp, data) VALUES (?, ?, ?, ?, ?, ?)",
+        CHANGE_HISTORY: "INSERT INTO change_history (record_key, user_name, timestamp, data) VALUES (?, ?, ?, ?)",
+    }
+
+    def upsert_statuses(self, statuses: Dict[str, Dict[str, Any]]) -> None:
+        """Inserts or replaces activity status entries by record_key (one transaction)."""
+        with closing(self._connect()) as conn, conn:
+            conn.executemany(self._INSERT[ACTIVITY_STATUS],
+                             [self._row(ACTIVITY_STATUS, v, k) for k, v in statuses.items()])
+
+    def append(self, table: str, entries: Iterable[Dict[str, Any]], keep: Optional[int] = None) -> None:
+        """Appends list entries (visit_reports / change_history); `keep` trims to the newest N rows."""
+        with closing(self._connect()) as conn, conn:
+            conn.executemany(self._INSERT[table], [self._row(table, e) for e in entries])
+            if keep is not None:
+                conn.execute(f"DELETE FROM {table} WHERE seq <= (SELECT MAX(seq) FROM {table}) - ?", (keep,))
+
+    def get_status(self, record_key: str) -> Optional[Dict[str, Any]]:
+        with closing(self._connect()) as conn:
+            row = conn.execute("SELECT data FROM activity_status WHERE record_key = ?", (record_key,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def status_keys_by_user(self, user_name: str) -> List[str]:
+        with closing(self._connect()) as conn:
+            rows = conn.execute("SELECT record_key FROM activity_status WHERE user_name = ? ORDER BY rowid", (user_name,)).fetchall()
+        return [r[0] for r in rows]
+
+    def get_report(self, report_id: str) -> Optional[Dict[str, Any]]:
+        with closing(self._connect()) as conn:
+            row = conn.execute("SELECT data FROM visit_reports WHERE id = ? ORDER BY seq LIMIT 1", (report_id,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def update_report(self, report_id: str, entry: Dict[str, Any]) -> bool:
+        """Replaces the first report with this ID in place (keeps its position)."""
+        _, record_key, user_name, user_branch, timestamp, data = self._row(VISIT_REPORTS, entry)
+        with closing(self._connect()) as conn, conn:
+            cur = conn.execute(
+                "UPDATE visit_reports SET record_key = ?, user_name = ?, user_branch = ?, timestamp = ?, data = ? "
+                "WHERE seq = (SELECT MIN(seq) FROM visit_reports WHERE id = ?)",
+                (record_key, user_name, user_branch, timestamp, data, report_id))
+            return cur.rowcount > 0
+
+    def delete_reports(self, report_id: str) -> int:
+        with closing(self._connect()) as conn, conn:
+            return conn.execute("DELETE FROM visit_reports WHERE id = ?", (report_id,)).rowcount
+
+    def query(self, table: str, newest_first: bool = False, limit: Optional[int] = None, **filters: Any) -> List[Dict[str, Any]]:
+        """
+        List entries filtered by indexed columns (record_key / user_name / user_branch).
+        newest_first orders by timestamp descending (insertion order among equal timestamps);
+        otherwise the last `limit` entries are returned in insertion order.
+        """
+        where = [f"{col} = ?" for col, v in filters.items() if v]
+        params: List[Any] = [v for v in filters.values() if v]
+        sql = f"SELECT data FROM {table}" + (f" WHERE {' AND '.join(where)}" if where else "")
+        sql += " ORDER BY COALESCE(timestamp, '') DESC, seq" if newest_first else " ORDER BY seq DESC"
+        if limit:
+            sql += " LIMIT ?"
+            params.append(limit)
+        with closing(self._connect()) as conn:
+            rows = conn.execute(sql, params).fetchall()
+        if not newest_first:
+            rows.reverse()
+        return [json.loads(r[0]) for r in rows]
+
+    # ----- whole collections (load_json_file / save_json_file shapes) -----
+
+    def load(self, table: str) -> Union[Dict[str, Any], List[Dict[str, Any]]]:
+        with closing(self._connect()) as conn:
+            if table == ACTIVITY_STATUS:
+                return {k: json.loads(d) for k, d in conn.execute("SELECT record_key, data FROM activity_status ORDER BY rowid")}
+            return [json.loads(d) for (d,) in conn.execute(f"SELECT data FROM {table} ORDER BY seq")]
+
+    def replace(self, table: str, data: Union[Dict[str, Any], List[Dict[str, Any]]]) -> None:
+        """Replaces a whole collection in one transaction (sheet pulls, external whole-file writers)."""
+        with closing(self._connect()) as conn, conn:
+            conn.execute(f"DELETE FROM {table}")
+            if table == ACTIVITY_STATUS:
+                rows = [self._row(table, v, k) for k, v in (data or {}).items() if isinstance(v, dict)]
+            else:
+                rows = [self._row(table, e) for e in (data or []) if isinstance(e, dict)]
+            conn.executemany(self._INSERT[table], rows)
+
+    def migrate_json(self, table: str, json_path: Union[str, Path]) -> bool:
+        """
+        One-time import of a legacy JSON file into an empty table. The file is left in place
+        (as a backup); a marker in `meta` prevents importing it again.
+        """
+        marker = f"migrated:{table}"
+        with closing(self._connect()) as conn:
+            if conn.execute("SELECT 1 FROM meta WHERE key = ?", (marker,)).fetchone():
+                return False
+        json_path = Path(json_path)
+        data = None
+        if json_path.exists():
+            try:
+                with open(json_path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+            except Exception as e:
+                print(f"Activity store: could not migrate {json_path}: {e}")
+                return False
+        with closing(self._connect()) as conn, conn:
+            empty = conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0] == 0
+            if data and empty:
+                if table == ACTIVITY_STATUS:
+                    rows = [self._row(table, v, k) for k, v in data.items() if isinstance(v, dict)]
+                else:
+                    rows = [self._row(table, e) for e in data if isinstance(e, dict)]
+                conn.executemany(self._INSERT[table], rows)
+            conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (marker, str(json_path)))
+        return bool(data) and empty
@@ -0,0 +1,451 @@
+"""
+District Address Matcher
+
+Tiered matching of normalized LOCALDATA/API addresses against the district master:
+  1. Exact / prefix (시도 + 시군구 + 동) hits through a dictionary index
+  2. Char 2-3-gram TF-IDF cosine similarity for the remaining addresses only, blocked by 시도 + 시군구,
+     with the top-k candidates re-ranked by rapidfuzz
+  3. Coordinates: rows still unmatched go to the nearest located district address of their block
+"""
+
+from typing import Any, Dict, List, Optional, Tuple
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+import pandas as pd
+from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.neighbors import BallTree
+
+try:
+    from rapidfuzz import fuzz, process as rf_process
+    HAS_RAPIDFUZZ = hasattr(rf_process, 'cpdist')  # cpdist: rapidfuzz >= 3.6
+except ImportError:
+    HAS_RAPIDFUZZ = False
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
+from src.config import MATCH_WORKERS, MATCH_PARALLEL_MIN_ROWS
+
+# Long province names -> short form used by the district master (주소시)
+SIDO_ALIASES = {
+    '서울시': '서울', '서울특별시': '서울',
+    '부산시': '부산', '부산광역시': '부산',
+    '대구시': '대구', '대구광역시': '대구',
+    '인천시': '인천', '인천광역시': '인천',
+    '광주시': '광주', '광주광역시': '광주',
+    '대전시': '대전', '대전광역시': '대전',
+    '울산시': '울산', '울산광역시': '울산',
+    '세종시': '세종', '세종특별자치시': '세종',
+    '경기도': '경기',
+    '강원도': '강원', '강원특별자치도': '강원',
+    '충청북도': '충북', '충청남도': '충남',
+    '전라북도': '전북', '전북특별자치도': '전북', '전라남도': '전남',
+    '경상북도': '경북', '경상남도': '경남',
+    '제주도': '제주', '제주특별자치도': '제주',
+}
+
+# Spatial fallback: max distance to the located district address, and rows needed to locate one
+SPATIAL_MAX_KM = 3.0
+SPATIAL_MIN_POINTS = 3
+EARTH_RADIUS_KM = 6371.0
+
+# Bump when the layout of compile_district_index() changes (persisted indexes are rebuilt)
+COMPILED_INDEX_VERSION = "4"
+
+# Fuzzy stage settings (chunk size in target rows; memory follows the product's nnz, not chunk x corpus)
+TFIDF_CHUNK_SIZE = 5000
+TFIDF_THRESHOLD = 0.5
+# Candidates re-ranked with rapidfuzz per address; cosine scores from TFIDF_TRUST_SCORE up are not re-ranked
+RERANK_TOP_K = 5
+TFIDF_TRUST_SCORE = 0.85
+
+
+def address_tokens(addr: str) -> List[str]:
+    """Splits a normalized address, with the province token in its short form."""
+    tokens = addr.split()
+    if tokens:
+        tokens[0] = SIDO_ALIASES.get(tokens[0], tokens[0])
+    return tokens
+
+
+def build_district_index(district_norms: List[str]) -> Dict[str, Any]:
+    """
+    Dictionary index over the district addresses (first occurrence wins, like the district dedup):
+    'exact' by normalized string, 'prefix' by canonical token string, plus the prefix lengths present.
+    """
+    exact: Dict[str, int] = {}
+    prefix: Dict[str, int] = {}
+    for i, addr in enumerate(district_norms):
+        exact.setdefault(addr, i)
+        prefix.setdefault(' '.join(address_tokens(addr)), i)
+    lengths = sorted({key.count(' ') + 1 for key in prefix}, reverse=True)
+    return {'exact': exact, 'prefix': prefix, 'lengths': lengths}
+
+
+def lookup_district_index(index: Dict[str, Any], addr: str) -> int:
+    """Returns the district position of an exact or longest-prefix hit, or -1."""
+    hit = index['exact'].get(addr)
+    if hit is not None:
+        return hit
+    tokens = address_tokens(addr)
+    for n in index['lengths']:
+        if len(tokens) >= n:
+            hit = index['prefix'].get(' '.join(tokens[:n]))
+            if hit is not None:
+                return hit
+    return -1
+
+
+def block_key(addr: str) -> str:
+    """Blocking key of a normalized address: short 시도 + 시군구 token."""
+    return ' '.join(address_tokens(addr)[:2])
+
+
+def _group_positions(keys: List[str]) -> Dict[str, np.ndarray]:
+    """Positions of each distinct key, in first-seen key order and ascending position order."""
+    codes, uniques = pd.factorize(pd.Series(keys, dtype=object))
+    order = np.argsort(codes, kind='stable')
+    return dict(zip(uniques, np.split(order, np.cumsum(np.bincount(codes))[:-1])))
+
+
+def sparse_topk(query_matrix: Any, corpus_matrix: Any, k: int = 1, threshold: float = 0.0) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Top-k corpus rows per query row by dot product (= cosine for L2-normalized TF-IDF rows), computed as
+    a sparse product. Scores below `threshold` are dropped before ranking; ties go to the lower corpus index.
+    Returns (indices, scores), both (n_queries, k), padded with -1 / 0.0.
+    """
+    n = query_matrix.shape[0]
+    indices = np.full((n, k), -1, dtype=np.int64)
+    scores = np.zeros((n, k), dtype=np.float64)
+
+    product = (query_matrix @ corpus_matrix.T).tocsr()
+    keep = product.data >= threshold
+    if not keep.any():
+        return indices, scores
+    rows = np.repeat(np.arange(n), np.diff(product.indptr))[keep]
+    cols = product.indices[keep]
+    data = product.data[keep]
+
+    order = np.lexsort((cols, -data, rows))
+    rows, cols, data = rows[order], cols[order], data[order]
+    row_start = np.searchsorted(rows, np.arange(n))
+    rank = np.arange(len(rows)) - row_start[rows]
+    top = rank < k
+    indices[rows[top], rank[top]] = cols[top]
+    scores[rows[top], rank[top]] = data[top]
+    return indices, scores
+
+
+def _arrow_lookup(keys: Any, index: Dict[str, int]) -> np.ndarray:
+    """Positions of arrow string `keys` in a {key: position} dict (-1 = missing or null key)."""
+    found = pc.index_in(keys, value_set=pa.array(list(index), type=pa.string()))
+    found = pc.fill_null(found, -1).to_numpy(zero_copy_only=False).astype(np.int64)
+    positions = np.fromiter(index.values(), dtype=np.int64, count=len(index))
+    return np.where(found >= 0, positions[np.maximum(found, 0)], -1)
+
+
+def _arrow_tokens(arr: Any, n_max: int) -> Tuple[Any, np.ndarray, Any]:
+    """(first n_max tokens as a list array, token counts capped at n_max + 1, short-form province token)."""
+    tokens = pc.utf8_split_whitespace(arr, max_splits=n_max)
+    n_tokens = pc.list_value_length(tokens).to_numpy(zero_copy_only=False)
+    first = pc.list_element(pc.list_slice(tokens, 0, 1), 0)
+    alias = pc.index_in(first, value_set=pa.array(list(SIDO_ALIASES), type=pa.string()))
+    first = pc.coalesce(pc.take(pa.array(list(SIDO_ALIASES.values()), type=pa.string()), alias), first)
+    return tokens, n_tokens, first
+
+
+def _arrow_prefix(tokens: Any, first: Any, n: int) -> Any:
+    if n == 1:
+        return first
+    return pc.binary_join_element_wise(first, pc.binary_join(pc.list_slice(tokens, 1, n), ' '), ' ')
+
+
+def address_heads(addrs: List[str], lengths: List[int]) -> Dict[int, np.ndarray]:
+    """For each n in `lengths`: the first n canonical tokens of every address ('' if it has fewer)."""
+    if not HAS_PYARROW:
+        tokens = [address_tokens(a) for a in addrs]
+        return {n: np.array([' '.join(t[:n]) if len(t) >= n else '' for t in tokens], dtype=object) for n in lengths}
+    tokens, n_tokens, first = _arrow_tokens(pa.array(addrs, type=pa.string()), max(lengths))
+    heads = {}
+    for n in lengths:
+        head = np.array(_arrow_prefix(tokens, first, n).to_pylist(), dtype=object)
+        head[n_tokens < n] = ''
+        heads[n] = head
+    return heads
+
+
+def index_lookup(addrs: List[str], compiled: Dict[str, Any]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    lookup_district_index over many normalized addresses, plus their 시도 + 시군구 block codes.
+    Returns (index hit positions, block codes), -1 = none. Tokenizing, province aliasing and the
+    key lookups run as Arrow compute kernels when pyarrow is available.
+    """
+    if not HAS_PYARROW:
+        positions = np.array([lookup_district_index(compiled, a) for a in addrs], dtype=np.int64)
+        return positions, compiled['block_keys'].get_indexer([block_key(a) for a in addrs])
+
+    arr = pa.array(addrs, type=pa.string())
+    tokens, n_tokens, first = _arrow_tokens(arr, max(compiled['lengths'] + [2]))
+
+    positions = _arrow_lookup(arr, compiled['exact'])
+    for n in compiled['lengths']:
+        todo = (positions < 0) & (n_tokens >= n)
+        if not todo.any():
+            continue
+        positions[todo] = _arrow_lookup(_arrow_prefix(tokens, first, n).filter(pa.array(todo)), compiled['prefix'])
+    blocks = pc.if_else(pa.array(n_tokens >= 2), _arrow_prefix(tokens, first, 2), first)
+    return positions, _arrow_lookup(blocks, {key: code for code, key in enumerate(compiled['blocks'])})
+
+
+def compile_district_index(district_norms: List[str], district_originals: List[str]) -> Dict[str, Any]:
+    """
+    Everything the matcher needs about a district master, computed once per district file:
+    dictionary index, fitted TF-IDF vectorizer + matrix, and block positions. Picklable.
+    """
+    compiled = build_district_index(district_norms)
+    compiled['originals'] = list(district_originals)
+    # Canonical token strings + token counts, compared against target address heads when re-ranking
+    compiled['keys'] = [' '.join(address_tokens(a)) for a in district_norms]
+    compiled['n_tokens'] = np.array([len(address_tokens(a)) for a in district_norms], dtype=np.int64)
+    compiled['blocks'] = _group_positions([block_key(a) for a in district_norms])
+
+    # Block codes (positions in compiled['blocks']) for the array checks in match_addresses
+    compiled['block_keys'] = pd.Index(list(compiled['blocks']), dtype=object)
+    compiled['block_members'] = list(compiled['blocks'].values())
+    compiled['block_codes'] = np.full(len(district_norms), -1, dtype=np.int64)
+    for code, members in enumerate(compiled['block_members']):
+        compiled['block_codes'][members] = code
+    compiled['vectorizer'], compiled['matrix'] = None, None
+    if district_norms:
+        # IDF weights come from the whole district corpus, so in-block scores equal the global ones
+        compiled['vectorizer'] = TfidfVectorizer(analyzer='char', ngram_range=(2, 3)).fit(district_norms)
+        compiled['matrix'] = compiled['vectorizer'].transform(district_norms)
+    # District locations for the spatial fallback; set once from the first master load (see district_centroids)
+    compiled['centroids'] = None
+    return compiled
+
+
+def rerank_topk(queries: List[str], candidates: np.ndarray, cosine: np.ndarray, state: Dict[str, Any],
+                workers: int = -1) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Picks one of the top-k TF-IDF candidates per query (district positions, -1 padded, best cosine first).
+    Candidates are re-ranked by rapidfuzz ratio between the candidate and the query's head with as
+    many canonical tokens, scored for all pairs in one multi-threaded cpdist call. Cosine hits of
+    TFIDF_TRUST_SCORE or more are kept as they are (as in utils.get_best_match); ratio ties keep the
+    higher cosine. Returns (district positions, cosine scores).
+    """
+    rows = np.arange(len(queries))
+    choice = np.zeros(len(queries), dtype=np.int64)
+    if HAS_RAPIDFUZZ and candidates.shape[1] > 1 and (candidates[:, 1] >= 0).any():
+        qi, kj = np.nonzero(candidates >= 0)
+        pair_pos = candidates[qi, kj]
+        pair_len = state['n_tokens'][pair_pos]
+        pair_query = np.empty(len(qi), dtype=object)
+        for n, heads in address_heads(queries, np.unique(pair_len).tolist()).items():
+            mask = pair_len == n
+            pair_query[mask] = heads[qi[mask]]
+        ratios = np.full(candidates.shape, -1.0)
+        ratios[qi, kj] = rf_process.cpdist(pair_query.tolist(), [state['keys'][p] for p in pair_pos],
+                                          scorer=fuzz.ratio, workers=workers)
+        choice = np.where(cosine[:, 0] >= TFIDF_TRUST_SCORE, 0, ratios.argmax(axis=1))
+    return candidates[rows, choice], cosine[rows, choice]
+
+
+def _match_state(compiled: Dict[str, Any], rerank: bool) -> Dict[str, Any]:
+    """Read-only part of the compiled index needed by _match_task (shipped once to each pool worker)."""
+    return {'vectorizer': compiled['vectorizer'], 'matrix': compiled['matrix'], 'keys': compiled['keys'],
+            'n_tokens': compiled['n_tokens'], 'top_k': RERANK_TOP_K if rerank and HAS_RAPIDFUZZ else 1}
+
+
+# Read-only matcher state of pool workers (set once per process by _init_match_worker)
+_worker_state: Dict[str, Any] = {}
+
+
+def _init_match_worker(state: Dict[str, Any]) -> None:
+    _worker_state.update(state)
+
+
+def _match_task(state: Dict[str, Any], items: List[Tuple[List[str], np.ndarray]], rerank_workers: int = -1) -> List[Tuple[np.ndarray, np.ndarray]]:
+    """Matches a batch of (queries, candidate district positions) pairs; returns (district positions, scores) per pair."""
+    out = []
+    for queries, candidates in items:
+        best, scores = sparse_topk(state['vectorizer'].transform(queries), state['matrix'][candidates],
+                                   k=state['top_k'], threshold=TFIDF_THRESHOLD)
+        best = np.where(best >= 0, candidates[np.maximum(best, 0)], -1)
+        out.append(rerank_topk(queries, best, scores, state, rerank_workers))
+    return out
+
+
+def _match_task_in_worker(items: List[Tuple[List[str], np.ndarray]]) -> List[Tuple[np.ndarray, np.ndarray]]:
+    # One rapidfuzz thread per pool process
+    return _match_task(_worker_state, items, rerank_workers=1)
+
+
+def tfidf_match(queries: List[str], compiled: Dict[str, Any], workers: Optional[int] = None,
+                query_blocks: Optional[np.ndarray] = None, rerank: bool = True) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Fuzzy stage: best TF-IDF cosine candidate per query, searched only among district addresses of the
+    same 시도 + 시군구 block (so cross-city hits cannot happen). Returns (district positions, scores),
+    -1 / 0.0 = no match. Large inputs are spread over a process pool; results do not depend on the worker count.
+    `query_blocks` are the block codes of the queries, if already known (see index_lookup).
+    With `rerank`, the top RERANK_TOP_K candidates are re-ranked with rapidfuzz (see rerank_topk).
+    """
+    result = np.full(len(queries), -1, dtype=np.int64)
+    result_scores = np.zeros(len(queries), dtype=np.float64)
+    if not queries:
+        return result, result_scores
+
+    if query_blocks is None:
+        _, query_blocks = index_lookup(queries, compiled)
+    block_rows = {code: rows for code, rows in _group_positions(query_blocks).items() if code >= 0}
+    if not block_rows:
+        return result, result_scores
+
+    state = _match_state(compiled, rerank)
+
+    # Tasks of ~TFIDF_CHUNK_SIZE query rows, each a list of (block chunk queries, block candidates)
+    tasks, task_rows = [], []
+    items, rows_in_items, size = [], [], 0
+    for code, rows in block_rows.items():
+        for i in range(0, len(rows), TFIDF_CHUNK_SIZE):
+            chunk_rows = rows[i:i + TFIDF_CHUNK_SIZE]
+            items.append(([queries[k] for k in chunk_rows], compiled['block_members'][code]))
+            rows_in_items.append(chunk_rows)
+            size += len(chunk_rows)
+            if size >= TFIDF_CHUNK_SIZE:
+                tasks.append(items); task_rows.append(rows_in_items)
+                items, rows_in_items, size = [], [], 0
+    if items:
+        tasks.append(items); task_rows.append(rows_in_items)
+
+    results = {}
+    workers = MATCH_WORKERS if workers is None else workers
+    workers = min(workers, len(tasks)) if len(queries) >= MATCH_PARALLEL_MIN_ROWS else 1
+    if workers > 1:
+        try:
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_match_worker,
+                                     initargs=(state,)) as executor:
+                future_to_idx = {executor.submit(_match_task_in_worker, task): t for t, task in enumerate(tasks)}
+                for future in as_completed(future_to_idx):
+                    results[future_to_idx[future]] = future.result()
+        except Exception as e:
+            # [FALLBACK] Pool could not start (e.g. restricted sandbox); match sequentially below
+            print(f"Process pool unavailable, matching sequentially: {e}")
+            results = {}
+
+    for t, task in enumerate(tasks):
+        if t not in results:
+            results[t] = _match_task(state, task)
+
+    # Each result is written back to its own query rows, so completion order does not matter
+    for t, rows_in_items in enumerate(task_rows):
+        for chunk_rows, (matched, scores) in zip(rows_in_items, results[t]):
+            result[chunk_rows] = matched
+            result_scores[chunk_rows] = scores
+    return result, result_scores
+
+
+def district_centroids(positions: np.ndarray, lat: np.ndarray, lon: np.ndarray, n_districts: int) -> np.ndarray:
+    """
+    (n_districts, 2) array of lat/lon medians of the rows text-matched to each district address;
+    NaN for districts with fewer than SPATIAL_MIN_POINTS located rows. Built once per compiled index.
+    """
+    centroids = np.full((n_districts, 2), np.nan)
+    anchors = (positions >= 0) & np.isfinite(lat) & np.isfinite(lon)
+    if not anchors.any():
+        return centroids
+    grouped = pd.DataFrame({'pos': positions[anchors], 'lat': lat[anchors], 'lon': lon[anchors]}).groupby('pos')
+    medians = grouped[['lat', 'lon']].median()[grouped.size() >= SPATIAL_MIN_POINTS]
+    centroids[medians.index.to_numpy()] = medians.to_numpy()
+    return centroids
+
+
+def spatial_fallback(positions: np.ndarray, blocks: np.ndarray, lat: np.ndarray, lon: np.ndarray,
+                     centroids: np.ndarray, district_blocks: np.ndarray) -> np.ndarray:
+    """
+    Assigns rows without a text match to the nearest located district address of their own 시도 + 시군구
+    block, by coordinates. `centroids` comes from district_centroids() over the master data and
+    `district_blocks` is the block code of each district address, so the result does not depend on
+    which other rows are in the current load. One haversine BallTree per block; hits farther than
+    SPATIAL_MAX_KM are dropped.
+    Inputs are per row: district positions (-1 = unmatched), block codes, WGS84 coordinates (NaN = none).
+    """
+    result = positions.copy()
+    todo = np.flatnonzero((positions < 0) & (blocks >= 0) & np.isfinite(lat) & np.isfinite(lon))
+    located = np.flatnonzero(np.isfinite(centroids).all(axis=1))
+    if not len(todo) or not len(located):
+        return result
+
+    located_blocks = district_blocks[located]
+    for block, rows in _group_positions(blocks[todo]).items():
+        members = located[located_blocks == block]
+        if not len(members):
+            continue
+        rows = todo[rows]
+        tree = BallTree(np.radians(centroids[members]), metric='haversine')
+        dist, idx = tree.query(np.radians(np.column_stack([lat[rows], lon[rows]])), k=1)
+        near = dist[:, 0] * EARTH_RADIUS_KM <= SPATIAL_MAX_KM
+        result[rows[near]] = members[idx[near, 0]]
+    return result
+
+
+def match_addresses(target_norms: List[str], compiled: Dict[str, Any], workers: Optional[int] = None,
+                    memo: Optional[Dict[str, Tuple[int, float]]] = None,
+                    coords: Optional[Tuple[np.ndarray, np.ndarray]] = None,
+                    locate_districts: bool = False) -> List[Optional[str]]:
+    """
+    Matches each normalized target address to a district address (original form) or None,
+    using a compile_district_index() result. Each distinct address is matched once; only index
+    misses go through TF-IDF.
+    `memo` (address -> (district position, score), for this compiled index) is consulted before
+    TF-IDF and updated in place with its new results.
+    `coords` (lat, lon arrays aligned with target_norms) enables the spatial fallback for rows
+    without a text match, against the district locations stored in compiled['centroids'].
+    `locate_districts` (full master loads only) builds those locations from this call's text matches when the
+    index has none yet; once set they are never recomputed, so a row's fallback does not depend on the other
+    rows of later loads. Loads without them (daily deltas, OpenAPI before any master load) skip the fallback.
+    """
+    if not target_norms:
+        return []
+
+    codes, uniques = pd.factorize(pd.Series(target_norms, dtype=object))
+    uniques = pd.Series(uniques, dtype=object)
+
+    # Tier 1: exact / prefix index
+    positions, blocks = index_lookup(uniques.tolist(), compiled)
+
+    # Tier 2: previous TF-IDF results, then TF-IDF for the rest (addresses outside every district block stay -1)
+    misses = np.flatnonzero((positions < 0) & (blocks >= 0))
+    if memo and len(misses):
+        remembered = uniques.iloc[misses].map(memo)
+        known = remembered.notna().to_numpy()
+        if known.any():
+            positions[misses[known]] = np.array(remembered[known].tolist())[:, 0]
+            misses = misses[~known]
+    if len(misses):
+        queries = uniques.iloc[misses].tolist()
+        positions[misses], scores = tfidf_match(queries, compiled, workers, query_blocks=blocks[misses])
+        if memo is not None:
+            memo.update(zip(queries, zip(positions[misses].tolist(), scores.tolist())))
+
+    # Acceptance: every hit must lie in the target's own 시도 + 시군구 block (array check, no per-row loop)
+    mismatched = positions >= 0
+    mismatched[mismatched] = compiled['block_codes'][positions[mismatched]] != blocks[mismatched]
+    positions[mismatched] = -1
+
+    row_positions = positions[codes]
+    if coords is not None:
+        lat, lon = (np.asarray(pd.to_numeric(pd.Series(c), errors='coerce'), dtype=np.float64) for c in coords)
+        if locate_districts and compiled.get('centroids') is None:
+            compiled['centroids'] = district_centroids(row_positions, lat, lon, len(compiled['originals']))
+        if compiled.get('centroids') is not None:
+            row_positions = spatial_fallback(row_positions, blocks[codes], lat, lon,
+                                             compiled['centroids'], compiled['block_codes'])
+
+    originals = np.array(compiled['originals'] + [None], dtype=object)
+    return originals[row_positions].tolist()
@@ -17,3 +17,23 @@ CUSTOM_BRANCH_ORDER = ['중앙지사', '강북지사', '서대문지사', '고
 
 # Role Mapping
 ROLE_MAP = {'admin': '👮 관리자', 'branch': '🏢 지사 관리자', 'manager': '👤 담당자'}
+
+# Parallel Ingestion
+# Process-pool size for parsing the per-category CSVs of a LOCALDATA bundle (1 = sequential)
+INGEST_WORKERS = int(os.environ.get('INGEST_WORKERS', min(8, os.cpu_count() or 1)))
+
+# Parallel Address Matching
+# Process-pool size for the TF-IDF matching stage; inputs with fewer fuzzy rows than the minimum stay in-process
+MATCH_WORKERS = int(os.environ.get('MATCH_WORKERS', min(8, os.cpu_count() or 1)))
+MATCH_PARALLEL_MIN_ROWS = 20_000
+
+# Out-of-core Ingestion (nationwide LOCALDATA_ALL_CSV bundles)
+# Bundles whose uncompressed CSVs exceed this size are read in chunks with a disk-spilled dedup
+STREAM_MIN_BYTES = int(os.environ.get('STREAM_MIN_BYTES', 1024 * 1024 * 1024))
+STREAM_CHUNK_ROWS = 200_000
+SPILL_PARTITIONS = 16
+
+# Activity Storage
+# 'sqlite' keeps activity_status / visit_reports / change_history in one WAL database (row-level writes);
+# 'json' keeps the legacy whole-file JSON documents
+ACTIVITY_STORE = os.environ.get('ACTIVITY_STORE', 'sqlite')
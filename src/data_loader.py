@@ -1,20 +1,63 @@
 
 import pandas as pd
 import os
+import csv
+import re
 import zipfile
-import glob
 import streamlit as st
 import requests
 import xml.etree.ElementTree as ET
 import unicodedata
 import shutil
+import tempfile
 import numpy as np
-from typing import Optional, Tuple, List, Dict, Any, Union
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
+from typing import Optional, Tuple, List, Dict, Any, Union, Iterator
+from concurrent.futures import ProcessPoolExecutor, as_completed
 
 # Import from local utils
-from src.utils import normalize_address, parse_coordinates_row, get_best_match, calculate_area, transformer, HAS_PYPROJ
+from src.utils import normalize_address, normalize_addresses, convert_coordinates, get_best_match, calculate_area, generate_record_keys, record_address_series
+from src.config import INGEST_WORKERS, STREAM_MIN_BYTES, STREAM_CHUNK_ROWS, SPILL_PARTITIONS, CUSTOM_BRANCH_ORDER
+from src import snapshot_cache, address_matcher
+
+# Columns projected out of each LOCALDATA CSV (matched by substring, same as the final column mapping)
+DESIRED_COLUMN_PATTERNS = ['소재지전체주소', '도로명전체주소', '사업장명', '업태구분명', '영업상태명', 
+                           '소재지전화', '총면적', '소재지면적', '인허가일자', '폐업일자', 
+                           '재개업일자', '최종수정시점', '데이터기준일자']
+
+# Low-cardinality columns held as pandas categoricals (int codes instead of one string per row)
+CATEGORICAL_COLUMNS = ['관리지사', 'SP담당', '영업구역 수정', '영업상태명', '업태구분명', '활동진행상태']
+
+# Fixed category order of 관리지사 (remaining values follow, sorted)
+BRANCH_CATEGORY_ORDER = [unicodedata.normalize('NFC', b) for b in CUSTOM_BRANCH_ORDER + ['미지정']]
+
+# LOCALDATA date columns parsed at ingestion (once, with an explicit format)
+LOCALDATA_DATE_COLUMNS = ['인허가일자', '폐업일자', '재개업일자']
+
+# Source date layouts, detected from the first value of a column (LOCALDATA CSV / OpenAPI)
+DATE_FORMATS = [
+    (re.compile(r'\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}'), '%Y-%m-%d %H:%M:%S'),
+    (re.compile(r'\d{4}-\d{2}-\d{2} \d{2}:\d{2}'), '%Y-%m-%d %H:%M'),
+    (re.compile(r'\d{4}-\d{2}-\d{2}'), '%Y-%m-%d'),
+    (re.compile(r'\d{14}'), '%Y%m%d%H%M%S'),
+    (re.compile(r'\d{8}'), '%Y%m%d'),
+    (re.compile(r'\d{4}\.\d{2}\.\d{2}'), '%Y.%m.%d'),
+]
+
+# Optional per-stage profiling hook (scripts/bench_ingest.py); called with the name of the stage
+# that just finished. None in the app, so the marks cost one comparison each.
+STAGE_HOOK: Optional[Any] = None
+
+# Compiled district index of the current district file (key -> compile result), see load_district_index
+_district_index_memo: Dict[str, Dict[str, Any]] = {}
+
+# Address match memo of the current district index (key -> {normalized address: (position, score)})
+_match_memo: Dict[str, Dict[str, Tuple[int, float]]] = {}
+
+# Parsed fixed-coordinate Excel of the current file version (key -> frame), see load_fixed_coordinates_data
+_fixed_coords_memo: Dict[str, pd.DataFrame] = {}
+
+# File name prefixes of the delta ZIPs produced by daily_fetch.py
+DAILY_ZIP_PREFIXES = ('LOCALDATA_DAILY_', 'LOCALDATA_YESTERDAY_')
 
 def normalize_str(s: Any) -> Optional[str]:
     if pd.isna(s): return s
@@ -25,15 +68,65 @@ def normalize_str(s: Any) -> Optional[str]:
         return b_norm + '지사'
     return b_norm
 
-def _process_and_merge_district_data(target_df: pd.DataFrame, district_file_path_or_obj: Any) -> Tuple[pd.DataFrame, List[Dict], Optional[str]]:
+def _stage_done(stage: str) -> None:
+    if STAGE_HOOK is not None:
+        STAGE_HOOK(stage)
+
+def _detect_date_format(first_value: str) -> Optional[str]:
+    """strftime format matching a sample value, or None for unknown layouts."""
+    for pattern, fmt in DATE_FORMATS:
+        if pattern.fullmatch(first_value):
+            return fmt
+    return None
+
+def parse_date_series(ser: pd.Series, tz: Optional[str] = 'Asia/Seoul') -> pd.Series:
     """
-    Common logic to process district file, match addresses, and merge with target_df.
+    Parses a date column with an explicit format detected once per column (instead of
+    per-element inference), then localizes to `tz` (None keeps it naive).
+    Already-parsed columns are only localized/converted. Values in a second layout get
+    their own detection pass; unknown layouts fall back to pandas inference.
+    """
+    if pd.api.types.is_datetime64_any_dtype(ser):
+        parsed = ser
+    else:
+        values = ser.to_numpy(dtype=object)
+        pos = np.flatnonzero(pd.notna(values))
+        out = np.full(len(values), np.datetime64('NaT'), dtype='datetime64[ns]')
+        tried = set()
+        while len(pos):
+            sample = next((str(v).strip() for v in values[pos] if str(v).strip()), None)
+            if sample is None:
+                break
+            fmt = _detect_date_format(sample)
+            if fmt is None or fmt in tried:
+                rest = pd.to_datetime(pd.Series(values[pos], dtype=object).astype(str).str.strip(), errors='coerce')
+                if rest.dt.tz is not None:
+                    rest = rest.dt.tz_convert('Asia/Seoul').dt.tz_localize(None)
+                out[pos] = rest.to_numpy(dtype='datetime64[ns]')
+                break
+            tried.add(fmt)
+            chunk = pd.to_datetime(values[pos], format=fmt, errors='coerce')
+            ok = chunk.notna()
+            out[pos[ok]] = chunk[ok].to_numpy(dtype='datetime64[ns]')
+            pos = pos[~ok]
+        parsed = pd.Series(out, index=ser.index, name=ser.name)
+        
+    if tz is None:
+        return parsed
+    if parsed.dt.tz is None:
+        # KST has no DST since 1988; ambiguous/nonexistent only guard odd historical values
+        return parsed.dt.tz_localize(tz, ambiguous='NaT', nonexistent='shift_forward')
+    return parsed.dt.tz_convert(tz)
+
+def _read_district_frame(district_file_path_or_obj: Any) -> Tuple[Optional[pd.DataFrame], Optional[str]]:
+    """
+    Reads and normalizes the district Excel file (one row per normalized address).
     """
     # 1. Load District File
     try:
         df_district = pd.read_excel(district_file_path_or_obj)
     except Exception as e:
-        return target_df, [], f"Error reading District file: {e}"
+        return None, f"Error reading District file: {e}"
 
     # 2. Normalize District Data with Robust Column Mapping
     if '주소시' in df_district.columns:
@@ -44,29 +137,90 @@ def _process_and_merge_district_data(target_df: pd.DataFrame, district_file_path
         if addr_col:
             df_district['full_address'] = df_district[addr_col]
         else:
-            return target_df, [], "District file must contain an address column (e.g., '주소' or '설치주소').", {}
+            return None, "District file must contain an address column (e.g., '주소' or '설치주소')."
 
     # Try candidate names for Branch
     branch_col = next((c for c in df_district.columns if any(p in c for p in ['관리지사', '지사'])), None)
     if branch_col:
-        df_district['관리지사'] = df_district[branch_col].apply(normalize_str)
+        df_district['관리지사'] = map_unique_values(df_district[branch_col], normalize_str)
     else:
         df_district['관리지사'] = '미지정'
 
     # Try candidate names for Manager
     mgr_col = next((c for c in df_district.columns if any(p in c for p in ['SP담당', '구역담당영업사원', '담당'])), None)
     if mgr_col:
-        df_district['SP담당'] = df_district[mgr_col].apply(normalize_str)
+        df_district['SP담당'] = map_unique_values(df_district[mgr_col], normalize_str)
     else:
         df_district['SP담당'] = '미지정'
 
-    df_district['full_address'] = df_district['full_address'].apply(normalize_str)
+    df_district['full_address'] = map_unique_values(df_district['full_address'], normalize_str)
     
-    df_district['full_address_norm'] = df_district['full_address'].apply(normalize_address)
+    df_district['full_address_norm'] = normalize_addresses(df_district['full_address'])
     df_district = df_district.dropna(subset=['full_address_norm'])
     
     # Deduplicate District Data
     df_district = df_district.drop_duplicates(subset=['full_address_norm'], keep='first')
+    return df_district, None
+
+def load_district_index(district_file_path_or_obj: Any) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+    """
+    Compiled district index: address matcher structures (index, fitted TF-IDF, blocks) plus the
+    merge frame and manager info. Built once per district file content and kept on disk and in memory.
+    """
+    key = snapshot_cache.compute_inputs_key([], district_file_path_or_obj, namespace=f"district_index:{address_matcher.COMPILED_INDEX_VERSION}")
+    if key and key in _district_index_memo:
+        return _district_index_memo[key], None
+
+    compiled = snapshot_cache.load_district_index(key)
+    if compiled is None:
+        df_district, err = _read_district_frame(district_file_path_or_obj)
+        if err:
+            return None, err
+
+        compiled = address_matcher.compile_district_index(df_district['full_address_norm'].tolist(), df_district['full_address'].tolist())
+
+        merge_cols = ['full_address', '관리지사', 'SP담당']
+        if '영업구역 수정' in df_district.columns:
+            merge_cols.append('영업구역 수정')
+        compiled['district_df'] = df_district[merge_cols].reset_index(drop=True)
+
+        # Extract Manager Info
+        if '영업구역 수정' in df_district.columns:
+            compiled['mgr_info'] = df_district[['SP담당', '영업구역 수정', '관리지사']].drop_duplicates().to_dict(orient='records')
+        else:
+            compiled['mgr_info'] = df_district[['SP담당', '관리지사']].drop_duplicates().to_dict(orient='records')
+
+        snapshot_cache.save_district_index(key, compiled)
+
+    compiled['key'] = key
+    if key:
+        _district_index_memo.clear()
+        _district_index_memo[key] = compiled
+    return compiled, None
+
+def _load_match_memo(district_key: Optional[str]) -> Dict[str, Tuple[int, float]]:
+    """In-process copy of the persistent address match memo of a district index."""
+    if not district_key:
+        return {}
+    if district_key not in _match_memo:
+        _match_memo.clear()
+        _match_memo[district_key] = snapshot_cache.load_match_memo(district_key)
+    return _match_memo[district_key]
+
+def _process_and_merge_district_data(target_df: pd.DataFrame, district_file_path_or_obj: Any, master: bool = False) -> Tuple[pd.DataFrame, List[Dict], Optional[str]]:
+    """
+    Common logic to process district file, match addresses, and merge with target_df.
+    `master` marks a full LOCALDATA build: if the compiled index has no district locations for the spatial
+    fallback yet, its text matches set them once and they are persisted with the index for every later load.
+    """
+    # 1-2. Load + normalize District File
+    # [OPTIMIZATION] Compiled once per district file content (disk + in-process), see load_district_index
+    district, err = load_district_index(district_file_path_or_obj)
+    if err:
+        return target_df, [], err
+    df_district = district['district_df']
+    
+    _stage_done('district_load')
     
     # 3. Prepare Target Data for Matching
     # Ensure target_df has '소재지전체주소'
@@ -74,76 +228,33 @@ def _process_and_merge_district_data(target_df: pd.DataFrame, district_file_path
         # If API data lacked it or named differently, ensure mapped before calling this
         pass
 
-    target_df['소재지전체주소_norm'] = target_df['소재지전체주소'].astype(str).apply(normalize_address)
+    # [OPTIMIZATION] Normalized once per distinct address (see utils.normalize_addresses)
+    target_df['소재지전체주소_norm'] = normalize_addresses(target_df['소재지전체주소'])
     # Don't dropNA on target immediately, or we lose rows? 
     # Logic in previous code: target_df = target_df.dropna(subset=['소재지전체주소_norm'])
     # Yes, we can drop because we can't match without address
     target_df = target_df.dropna(subset=['소재지전체주소_norm'])
 
     # 4. Batch Matching Logic
-    # Prepare Corpus (District)
-    vectorizer = TfidfVectorizer(analyzer='char', ngram_range=(2, 3)).fit(df_district['full_address_norm'])
-    district_matrix = vectorizer.transform(df_district['full_address_norm'])
-    district_originals = df_district['full_address'].tolist()
-    
-    # Prepare Query (Target)
-    target_addrs = target_df['소재지전체주소_norm'].tolist()
-    
-    matched_results = []
-    
-    if target_addrs:
-        target_matrix = vectorizer.transform(target_addrs)
-        
-        # Chunked Processing
-        chunk_size = 1000
-        num_rows = target_matrix.shape[0]
-        THRESHOLD = 0.5
-        
-        def extract_geo_tokens(addr):
-            if not addr: return set()
-            tokens = addr.split()
-            return set(tokens[:2]) if len(tokens) >= 2 else set(tokens)
-
-        for i in range(0, num_rows, chunk_size):
-            end = min(i + chunk_size, num_rows)
-            chunk_target = target_matrix[i:end]
-            chunk_sim = cosine_similarity(chunk_target, district_matrix)
-            
-            chunk_best_indices = chunk_sim.argmax(axis=1)
-            chunk_best_scores = chunk_sim.max(axis=1)
-            
-            for j, score in enumerate(chunk_best_scores):
-                if score >= THRESHOLD:
-                    candidate = district_originals[chunk_best_indices[j]]
-                    query = target_addrs[i + j]
-                    
-                    q_tok = extract_geo_tokens(query)
-                    c_tok = extract_geo_tokens(candidate)
-                    
-                    # [FIX] Strictly enforce City/Province (First Token) match 
-                    # before allowing token intersection match to prevent
-                    # cross-city matching (e.g. Incheon Jung-gu matching Seoul Jung-gu)
-                    q_city = str(query).split()[0] if query else ""
-                    c_city = str(candidate).split()[0] if candidate else ""
-                    
-                    # City names might be '서울' vs '서울시', so check prefix sharing
-                    city_match = q_city and c_city and (q_city in c_city or c_city in q_city)
-                    
-                    if city_match and q_tok.intersection(c_tok):
-                        matched_results.append(candidate)
-                    else:
-                        matched_results.append(None)
-                else:
-                    matched_results.append(None)
+    # [OPTIMIZATION] Tiered: exact/prefix (시도+시군구+동) dictionary hits first, TF-IDF only for the rest
+    # [OPTIMIZATION] Fuzzy results are remembered per district file, so repeat addresses skip TF-IDF
+    memo = _load_match_memo(district['key'])
+    memo_size = len(memo)
+    # [NEW] Rows the text matcher cannot place fall back to the nearest district address by coordinates
+    coords = (target_df['lat'].to_numpy(), target_df['lon'].to_numpy()) if {'lat', 'lon'} <= set(target_df.columns) else None
+    locate = master and coords is not None and district.get('centroids') is None
+    matched_results = address_matcher.match_addresses(target_df['소재지전체주소_norm'].tolist(), district, memo=memo, coords=coords,
+                                                      locate_districts=locate)
+    if len(memo) > memo_size:
+        snapshot_cache.save_match_memo(district['key'], memo)
+    if locate:
+        snapshot_cache.save_district_index(district['key'], district)
     
     target_df['matched_address'] = matched_results
+    _stage_done('address_match')
     
     # 5. Merge
-    merge_cols = ['full_address', '관리지사', 'SP담당']
-    if '영업구역 수정' in df_district.columns:
-        merge_cols.append('영업구역 수정')
-        
-    final_df = target_df.merge(df_district[merge_cols], left_on='matched_address', right_on='full_address', how='left')
+    final_df = target_df.merge(df_district, left_on='matched_address', right_on='full_address', how='left')
     
     # 6. Area Calculation
     site_area = pd.to_numeric(final_df['소재지면적'], errors='coerce').fillna(0)
@@ -161,11 +272,7 @@ def _process_and_merge_district_data(target_df: pd.DataFrame, district_file_path
     if '영업구역 수정' in final_df.columns:
         final_df['영업구역 수정'] = final_df['영업구역 수정'].fillna('')
         
-    # Extract Manager Info
-    if '영업구역 수정' in df_district.columns:
-        mgr_info = df_district[['SP담당', '영업구역 수정', '관리지사']].drop_duplicates().to_dict(orient='records')
-    else:
-        mgr_info = df_district[['SP담당', '관리지사']].drop_duplicates().to_dict(orient='records')
+    mgr_info = [dict(m) for m in district['mgr_info']]
 
     # 8. Merge Persistent Activity Status
     # [FEATURE] Load saved activity status (e.g. Visit) and merge
@@ -176,17 +283,10 @@ def _process_and_merge_district_data(target_df: pd.DataFrame, district_file_path
     # Logic: Max of (In-permission Date, Closed Date, Activity Change Date, Current Time if all null)
     
     # Ensure datetime format and timezone consistency (KST) for all possible date columns
+    # [OPTIMIZATION] LOCALDATA/API dates arrive parsed and localized; only 변경일시 (activity JSON) is text
     for col in ['인허가일자', '폐업일자', '변경일시', '최종수정시점']:
         if col in final_df.columns:
-            # First convert to datetime (ensure it's not a string)
-            converted = pd.to_datetime(final_df[col], errors='coerce')
-            
-            # [FIX] Safer localization logic to avoid 'Already tz-aware' or mixed TZ errors
-            if converted.dt.tz is None:
-                final_df[col] = converted.dt.tz_localize('Asia/Seoul', ambiguous='infer', nonexistent='shift_forward')
-            else:
-                # If already tz-aware, just ensure it's KST
-                final_df[col] = converted.dt.tz_convert('Asia/Seoul')
+            final_df[col] = parse_date_series(final_df[col])
             
     # Candidate columns for "Last Modified"
     # We prioritize: Activity Change > Closed Date > License Date > Original CSV Date
@@ -214,6 +314,13 @@ def _process_and_merge_district_data(target_df: pd.DataFrame, district_file_path
     else:
         from src import utils
         final_df['최종수정시점'] = utils.get_now_kst()
+        
+    # 10. Branch names + NFC text columns (once here, instead of on every app rerun)
+    final_df = normalize_display_columns(final_df)
+    
+    # 11. [OPTIMIZATION] Low-cardinality columns as categoricals
+    final_df = apply_categorical_dtypes(final_df)
+    _stage_done('merge')
             
     return final_df, mgr_info, None
 
@@ -239,16 +346,8 @@ def merge_activity_status(df: pd.DataFrame) -> pd.DataFrame:
         # 1. Ensure 'record_key' exists
         if 'record_key' not in df.columns:
             # Fallback generation if not pre-calculated
-            # Use vectorized string operations if possible, or apply as last resort
-            # Since utils.generate_record_key has complex regex/dict replacement, we stick to apply 
-            # but only for the key generation part.
-            df['record_key'] = df.apply(
-                lambda row: utils.generate_record_key(
-                    row.get('사업장명', ''),
-                    row.get('소재지전체주소', '') or row.get('도로명전체주소', '') or row.get('주소', '')
-                ),
-                axis=1
-            )
+            # [OPTIMIZATION] Vectorized, same keys as utils.generate_record_key per row
+            df['record_key'] = generate_record_keys(df.get('사업장명', pd.Series('', index=df.index)), record_address_series(df))
         
         # 2. Prepare Mapping Dictionaries
         status_map = {}
@@ -291,167 +390,390 @@ def merge_activity_status(df: pd.DataFrame) -> pd.DataFrame:
              
     return df
 
-@st.cache_data
-def load_and_process_data(zip_file_path_or_obj: Any, district_file_path_or_obj: Any, dist_mtime: Optional[float] = None) -> Tuple[Union[pd.DataFrame, None], List[Dict], Optional[str], Dict[str, int]]:
+def map_unique_values(series: pd.Series, func: Any) -> pd.Series:
     """
-    Loads data from uploads, extracts ZIP, processes CSVs, and merges with district data.
-    Returns: (DataFrame, ManagerInfo, ErrorMessage, StatsDict)
+    Applies `func` once per distinct value (NaN included) and broadcasts the results back by code,
+    instead of once per row. Returns an object Series aligned to `series`.
     """
-    # 1. Process Zip File
-    # [FIX] Use unique subfolder in system temp directory to prevent collisions and Streamlit watcher loops
-    import tempfile
-    extract_folder = tempfile.mkdtemp(prefix="sales_assist_ext_")
-    
-    # Handle single or multiple inputs
-    zip_inputs = zip_file_path_or_obj if isinstance(zip_file_path_or_obj, list) else [zip_file_path_or_obj]
-    
+    codes, uniques = pd.factorize(series, use_na_sentinel=False)
+    mapped = np.empty(len(uniques), dtype=object)
+    mapped[:] = [func(v) for v in uniques]
+    return pd.Series(mapped[codes], index=series.index, name=series.name)
+
+# Text columns shown/filtered in the app, NFC-normalized and stripped
+DISPLAY_TEXT_COLUMNS = ['관리지사', 'SP담당', '사업장명', '소재지전체주소', '영업상태명', '업태구분명']
+
+def standardize_branch(b: Any) -> str:
+    # [STRICT] Enforce '지사' suffix at data level
+    if pd.isna(b): return '미지정'
+    b = str(b)
+    if b.strip() == '': return '미정' # Fallback
+    if not b or b in ['미지정', '전체', 'None', 'nan']: return '미지정'
+    b_norm = unicodedata.normalize('NFC', str(b)).strip()
+    # If it's a known branch name without '지사', add it
+    known_branches = ['중앙', '강북', '서대문', '고양', '의정부', '남양주', '강릉', '원주']
+    if b_norm in known_branches:
+        return b_norm + '지사'
+    return b_norm
+
+def _nfc_strip(x: Any) -> Any:
+    # Missing values stay missing (no 'nan' strings in the output or as categories)
+    return x if pd.isna(x) else unicodedata.normalize('NFC', str(x)).strip()
+
+def normalize_display_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Standardizes 관리지사 (no NaNs, '지사' suffix) and NFC-normalizes the non-null display text values,
+    once per distinct value. Marks the frame via df.attrs so the app can skip it on reruns.
+    record_key is generated from the raw text first (as at ingestion), so saved statuses keep matching.
+    """
+    if 'record_key' not in df.columns and '사업장명' in df.columns:
+        df['record_key'] = generate_record_keys(df['사업장명'], record_address_series(df))
+
+    if '관리지사' in df.columns:
+        df['관리지사'] = map_unique_values(df['관리지사'], standardize_branch)
+    else:
+        df['관리지사'] = '미지정'
+        
+    for col in DISPLAY_TEXT_COLUMNS:
+        if col in df.columns:
+            df[col] = map_unique_values(df[col], _nfc_strip)
+    df.attrs['display_normalized'] = True
+    return df
+
+def apply_categorical_dtypes(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Converts CATEGORICAL_COLUMNS to categoricals with a stable category order:
+    관리지사 follows CUSTOM_BRANCH_ORDER (+ '미지정'), other values are sorted.
+    '' is always a category so the usual fillna('') keeps working.
+    """
+    if df is None or df.empty:
+        return df
+    for col in CATEGORICAL_COLUMNS:
+        if col not in df.columns:
+            continue
+        present = pd.unique(df[col].dropna())
+        fixed = BRANCH_CATEGORY_ORDER if col == '관리지사' else []
+        rest = sorted((v for v in present if v not in fixed), key=str)
+        if '' not in rest:
+            rest.insert(0, '')
+        df[col] = pd.Categorical(df[col], categories=fixed + rest)
+    return df
+
+def _open_zip_inputs(zip_inputs: List[Any]) -> List[zipfile.ZipFile]:
+    """
+    Opens every ZIP input (path or uploaded file object) for streaming reads.
+    Closes the already-opened archives if one of them fails.
+    """
+    zip_refs = []
     try:
-        for i, zip_item in enumerate(zip_inputs):
+        for zip_item in zip_inputs:
             # Skip if None
             if zip_item is None: continue
+            zip_refs.append(zipfile.ZipFile(zip_item, 'r'))
+    except Exception:
+        for zip_ref in zip_refs:
+            zip_ref.close()
+        raise
+    return zip_refs
+
+def _iter_csv_members(zip_refs: List[zipfile.ZipFile]) -> Iterator[Tuple[zipfile.ZipFile, zipfile.ZipInfo]]:
+    """
+    Yields (archive, member) for every CSV inside the archives, in archive order.
+    Members are read in place via ZipFile.open, so nothing is written to disk.
+    """
+    for zip_ref in zip_refs:
+        for member in zip_ref.infolist():
+            if member.is_dir(): continue
+            if not member.filename.lower().endswith('.csv'): continue
+            yield zip_ref, member
+
+def _sniff_csv_header(zip_ref: zipfile.ZipFile, member: zipfile.ZipInfo) -> List[str]:
+    """
+    Reads only the first line of a CSV member and returns its column names.
+    """
+    with zip_ref.open(member) as fh:
+        first_line = fh.readline()
+    text = first_line.decode('cp949', errors='replace').rstrip('\r\n')
+    return next(csv.reader([text]), [])
+
+def _select_localdata_columns(columns: List[str]) -> List[int]:
+    """
+    Resolves the positions of the columns the pipeline actually uses:
+    desired patterns, coordinates, status (for the 2026 filter) and record-key fallbacks.
+    Every matching column is kept so the global first-match mapping is unchanged.
+    """
+    selected = []
+    for i, c in enumerate(columns):
+        if (any(pat in c for pat in DESIRED_COLUMN_PATTERNS) or '좌표' in c 
+                or '상태명' in c or c == '주소'):
+            selected.append(i)
+    return selected
+
+def generate_vectorized_record_key(df_in: pd.DataFrame) -> pd.DataFrame:
+    """Vectorized version of utils.generate_record_key for high performance N=134k+"""
+    if df_in is None or df_in.empty: return df_in
+    
+    # 1. Prepare Title and Address series
+    t_ser = df_in.get('사업장명', pd.Series(['']*len(df_in), index=df_in.index)).fillna('').astype(str)
+    a_ser = (df_in.get('소재지전체주소', pd.Series(['']*len(df_in), index=df_in.index)).fillna('')
+             .combine_first(df_in.get('도로명전체주소', pd.Series(['']*len(df_in), index=df_in.index)).fillna(''))
+             .combine_first(df_in.get('주소', pd.Series(['']*len(df_in), index=df_in.index)).fillna(''))
+             .astype(str))
+    
+    # 2. [OPTIMIZATION] Shared compiled normalizer (byte-identical to utils.generate_record_key)
+    df_in['record_key'] = generate_record_keys(t_ser, a_ser)
+    return df_in
+
+def _date_years(parsed: pd.Series, raw: pd.Series) -> pd.Series:
+    """Year of a parsed date column; unparseable strings fall back to their leading digits."""
+    years = parsed.dt.year
+    missing = years.isna() & raw.notna()
+    if missing.any():
+        digits = raw[missing].astype(str).str.replace(r'[^0-9]', '', regex=True)
+        years[missing] = pd.to_numeric(digits.str[:4], errors='coerce')
+    return years.fillna(0).astype(int)
+
+def _filter_localdata_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Parses the LOCALDATA date columns (naive; localized once per bundle), then applies the
+    2026 filter: active businesses permitted from 2026, closed ones closed from 2026.
+    Works on a whole file or on one chunk of it.
+    """
+    # [OPTIMIZATION] Single date-normalization stage: the parsed columns are reused by the
+    # year filter, the latest-permit dedup and the final KST localization
+    years = {}
+    for col in LOCALDATA_DATE_COLUMNS:
+        if col in df.columns:
+            raw = df[col]
+            df[col] = parse_date_series(raw, tz=None)
+            years[col] = _date_years(df[col], raw)
             
-            # Create unique subfolder to prevent overwrite
-            # [FIX] Use subfolders for multi-zip mixing
-            sub_zip_folder = os.path.join(extract_folder, f"zip_{i}")
-            os.makedirs(sub_zip_folder, exist_ok=True)
-            
-            with zipfile.ZipFile(zip_item, 'r') as zip_ref:
-                # [FIX] Manually extract each file to handle 'File name too long' issue
-                for member in zip_ref.infolist():
-                    filename = member.filename
-                    # Truncate filename if it's too long (filesystem limit is usually 255)
-                    # We use a safe margin (100) and preserve extension
-                    if len(filename) > 100:
-                        import hashlib
-                        ext = os.path.splitext(filename)[1]
-                        h = hashlib.md5(filename.encode()).hexdigest()[:8]
-                        filename = filename[:80] + "_" + h + ext
-                    
-                    target_path = os.path.join(sub_zip_folder, filename)
-                    # Ensure directories exist
-                    os.makedirs(os.path.dirname(target_path), exist_ok=True)
-                    
-                    if not member.is_dir():
-                        with zip_ref.open(member) as source, open(target_path, "wb") as target:
-                            shutil.copyfileobj(source, target)
-    except Exception as e:
-        return None, [], f"ZIP extraction failed: {e}", {}
-        
-    all_files = glob.glob(os.path.join(extract_folder, "**/*.csv"), recursive=True)
-    dfs = []
-    
-    def generate_vectorized_record_key(df_in):
-        """Vectorized version of utils.generate_record_key for high performance N=134k+"""
-        if df_in is None or df_in.empty: return df_in
-        
-        # 1. Prepare Title and Address series
-        t_ser = df_in.get('사업장명', pd.Series(['']*len(df_in), index=df_in.index)).fillna('').astype(str)
-        a_ser = (df_in.get('소재지전체주소', pd.Series(['']*len(df_in), index=df_in.index)).fillna('')
-                 .combine_first(df_in.get('도로명전체주소', pd.Series(['']*len(df_in), index=df_in.index)).fillna(''))
-                 .combine_first(df_in.get('주소', pd.Series(['']*len(df_in), index=df_in.index)).fillna(''))
-                 .astype(str))
-        
-        # 2. Define Vectorized Clean
-        replacements = {
-            "서울특별시": "서울", "서울시": "서울", "경기도": "경기", "기도": "경기",
-            "인천특별광역시": "인천", "인천광역시": "인천", "인천시": "인천",
-            "부산광역시": "부산", "부산시": "부산", "대구광역시": "대구", "대구시": "대구",
-            "광주광역시": "광주", "광주시": "광주", "대전광역시": "대전", "대전시": "대전",
-            "울산광역시": "울산", "울산시": "울산", "세종특별자치시": "세종", "세종시": "세종",
-            "제주특별자치도": "제주", "제주도": "제주", "제주시": "제주",
-            "강원특별자치도": "강원", "강원도": "강원", "전북특별자치도": "전북", "전라북도": "전북",
-            "충청북도": "충북", "충북도": "충북", "충청남도": "충남", "충남도": "충남",
-            "전라남도": "전남", "전남도": "전남", "경상북도": "경북", "경북도": "경북",
-            "경상남도": "경남", "경남도": "경남"
-        }
+    # Filter standard headers
+    # [OPTIMIZATION] Smart Filter for 2026 onwards
+    if '인허가일자' in df.columns:
+        # Find status column to differentiate active vs closed
+        status_cols = [c for c in df.columns if '상태명' in c]
+    
+        if status_cols:
+            status_col = status_cols[0]
+            # 영업/정상은 2026년 이후만, 폐업 등은 전체 포함
+            is_active = df[status_col].str.contains('영업|정상', na=False)
+            is_valid_date = years['인허가일자'] >= 2026
+        
+            if '폐업일자' in df.columns:
+                is_valid_close_date = years['폐업일자'] >= 2026
+            else:
+                is_valid_close_date = False
+        
+            mask_active = is_active & is_valid_date
+            mask_closed = ~is_active & is_valid_close_date
         
-        def v_clean(ser):
-            # Normalize to NFC
-            # ser = ser.str.normalize('NFC') # Removed to match utils.py behavior (which does it string by string)
-            # Bulk replacements
-            for k, v in replacements.items():
-                ser = ser.str.replace(k, v, regex=False)
-            # Remove quotes and whitespace cleanup
-            ser = ser.str.replace('"', '', regex=False).str.replace("'", "", regex=False).str.replace('\n', '', regex=False)
-            ser = ser.str.replace(r'\s+', ' ', regex=True).str.strip()
-            return ser
-
-        # 3. Apply Clean and Join
-        df_in['record_key'] = v_clean(t_ser) + "_" + v_clean(a_ser)
-        return df_in
-
-    for file in all_files:
+            df_filtered = df[mask_active | mask_closed].copy()
+        else:
+            df_filtered = df[years['인허가일자'] >= 2026].copy()
+    else:
+        df_filtered = df.copy()
+    return df_filtered
+
+def _dedup_latest_permit(df: pd.DataFrame, subset: List[str]) -> pd.DataFrame:
+    """Keeps the row with the newest 인허가일자 per `subset` key."""
+    if '인허가일자' in df.columns:
+        if pd.api.types.is_datetime64_any_dtype(df['인허가일자']):
+            # Already parsed by the date-normalization stage
+            df.sort_values(by='인허가일자', ascending=False, inplace=True, na_position='last')
+        else:
+            df['인허가일자_dt'] = parse_date_series(df['인허가일자'], tz=None)
+            df.sort_values(by='인허가일자_dt', ascending=False, inplace=True, na_position='last')
+            df.drop(columns=['인허가일자_dt'], inplace=True)
+    df.drop_duplicates(subset=subset, keep='first', inplace=True)
+    return df
+
+def _process_localdata_member(zip_ref: zipfile.ZipFile, member: zipfile.ZipInfo) -> Optional[pd.DataFrame]:
+    """
+    Per-file ingestion step: read -> 2026 filter -> record key -> per-file dedup.
+    Returns None for members without an address column or with no remaining rows.
+    """
+    try:
+        # [OPTIMIZATION] Sniff header once, then parse only the used columns in a single pass
+        header = _sniff_csv_header(zip_ref, member)
+        if not any('주소' in c for c in header): return None
+        usecols = _select_localdata_columns(header)
+        _stage_done('extract')
+        
+        with zip_ref.open(member) as fh:
+            df = pd.read_csv(fh, encoding='cp949', on_bad_lines='skip', dtype=str, low_memory=False, usecols=usecols)
+        _stage_done('parse')
+    
+        df_filtered = _filter_localdata_frame(df)
+        _stage_done('filter')
+        
+        if not df_filtered.empty:
+            # [OPTIMIZATION] Early Deduplication per File using vectorized key
+            df_filtered = generate_vectorized_record_key(df_filtered)
+            _stage_done('key')
+            df_filtered = _dedup_latest_permit(df_filtered, ['record_key'])
+            _stage_done('dedup')
+            return df_filtered
+        return None
+    except Exception:
+        return None
+
+def _process_localdata_member_by_path(zip_path: str, member_name: str) -> Optional[pd.DataFrame]:
+    """
+    Process-pool entry point: reopens the archive by path inside the worker.
+    """
+    with zipfile.ZipFile(zip_path, 'r') as zip_ref:
+        return _process_localdata_member(zip_ref, zip_ref.getinfo(member_name))
+
+def _collect_localdata_frames(zip_sources: List[Any], zip_refs: List[zipfile.ZipFile], workers: int) -> List[pd.DataFrame]:
+    """
+    Runs the per-file step over every CSV member and returns the frames in archive order.
+    Members of on-disk archives are spread over a process pool; uploaded file objects
+    cannot be shared with worker processes and are parsed in-process.
+    """
+    tasks = []
+    for zip_source, zip_ref in zip(zip_sources, zip_refs):
+        by_path = isinstance(zip_source, (str, os.PathLike))
+        for _, member in _iter_csv_members([zip_ref]):
+            tasks.append((zip_source if by_path else None, zip_ref, member))
+            
+    results = {}
+    pool_tasks = [i for i, t in enumerate(tasks) if t[0] is not None]
+    workers = min(workers, len(pool_tasks))
+    
+    if workers > 1:
         try:
-            # Check header
-            df_iter = pd.read_csv(file, encoding='cp949', on_bad_lines='skip', dtype=str, chunksize=1000)
-            header = next(df_iter)
-            if not any('주소' in c for c in header.columns): continue
-                
-            df = pd.read_csv(file, encoding='cp949', on_bad_lines='skip', dtype=str, low_memory=False)
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                future_to_idx = {executor.submit(_process_localdata_member_by_path, os.fspath(tasks[i][0]), tasks[i][2].filename): i for i in pool_tasks}
+                for future in as_completed(future_to_idx):
+                    idx = future_to_idx[future]
+                    try:
+                        results[idx] = future.result()
+                    except Exception:
+                        results[idx] = None
+        except Exception as e:
+            # [FALLBACK] Pool could not start (e.g. restricted sandbox); parse sequentially below
+            print(f"Process pool unavailable, parsing sequentially: {e}")
+            results = {}
             
-            # Filter standard headers
-            # [OPTIMIZATION] Smart Filter for 2026 onwards
-            if '인허가일자' in df.columns:
-                # Find status column to differentiate active vs closed
-                status_cols = [c for c in df.columns if '상태명' in c]
+    for i, (_, zip_ref, member) in enumerate(tasks):
+        if i not in results:
+            results[i] = _process_localdata_member(zip_ref, member)
+            
+    # Deterministic merge order regardless of completion order
+    return [results[i] for i in sorted(results.keys()) if results[i] is not None]
+
+def _stream_localdata_frames(zip_refs: List[zipfile.ZipFile], chunk_rows: int, partitions: int) -> Tuple[Optional[pd.DataFrame], int]:
+    """
+    Bounded-memory ingestion for nationwide bundles (e.g. LOCALDATA_ALL_CSV.zip).
+    Each CSV is read in chunks; every chunk is filtered, keyed and spilled to disk,
+    hash-partitioned by record_key. The per-file and global "latest 인허가일자" dedup then
+    runs one partition at a time, so peak memory tracks the chunk size and the filtered
+    output, not the input size.
+    Returns: (DeduplicatedFrame, CountBeforeGlobalDedup)
+    """
+    spill_dir = tempfile.mkdtemp(prefix="sales_assist_spill_")
+    try:
+        # Ordered union of columns in file order, so the first-match column mapping is unchanged
+        col_order = []
+        n_chunks = 0
+        
+        for src_idx, (zip_ref, member) in enumerate(_iter_csv_members(zip_refs)):
+            try:
+                header = _sniff_csv_header(zip_ref, member)
+                if not any('주소' in c for c in header): continue
+                usecols = _select_localdata_columns(header)
+                _stage_done('extract')
                 
-                if status_cols:
-                    status_col = status_cols[0]
-                    # 영업/정상은 2026년 이후만, 폐업 등은 전체 포함
-                    raw_dates = df['인허가일자'].fillna('').astype(str).str.replace(r'[^0-9]', '', regex=True)
-                    df['parsed_temp_year'] = pd.to_numeric(raw_dates.str[:4], errors='coerce').fillna(0).astype(int)
-                    
-                    is_active = df[status_col].str.contains('영업|정상', na=False)
-                    is_valid_date = df['parsed_temp_year'] >= 2026
-                    
-                    if '폐업일자' in df.columns:
-                        raw_close_dates = df['폐업일자'].fillna('').astype(str).str.replace(r'[^0-9]', '', regex=True)
-                        close_years = pd.to_numeric(raw_close_dates.str[:4], errors='coerce').fillna(0).astype(int)
-                        is_valid_close_date = close_years >= 2026
-                    else:
-                        is_valid_close_date = False
-                    
-                    mask_active = is_active & is_valid_date
-                    mask_closed = ~is_active & is_valid_close_date
-                    
-                    df_filtered = df[mask_active | mask_closed].copy()
-                    df_filtered.drop(columns=['parsed_temp_year'], inplace=True)
-                else:
-                    raw_dates = df['인허가일자'].fillna('').astype(str).str.replace(r'[^0-9]', '', regex=True)
-                    temp_years = pd.to_numeric(raw_dates.str[:4], errors='coerce').fillna(0).astype(int)
-                    df_filtered = df[temp_years >= 2026].copy()
-            else:
-                df_filtered = df.copy()
+                with zip_ref.open(member) as fh:
+                    reader = pd.read_csv(fh, encoding='cp949', on_bad_lines='skip', dtype=str, usecols=usecols, chunksize=chunk_rows)
+                    for chunk in reader:
+                        _stage_done('parse')
+                        chunk = _filter_localdata_frame(chunk)
+                        _stage_done('filter')
+                        if chunk.empty: continue
+                        chunk = generate_vectorized_record_key(chunk)
+                        _stage_done('key')
+                        chunk = _dedup_latest_permit(chunk, ['record_key'])
+                        _stage_done('dedup')
+                        chunk['_src'] = src_idx
+                        
+                        col_order.extend(c for c in chunk.columns if c not in col_order)
+                        
+                        part_ids = pd.util.hash_pandas_object(chunk['record_key'], index=False).values % partitions
+                        for p in np.unique(part_ids):
+                            chunk[part_ids == p].to_pickle(os.path.join(spill_dir, f"p{p:04d}_{n_chunks:07d}.pkl"))
+                        n_chunks += 1
+                        _stage_done('spill')
+            except Exception:
+                continue
                 
-            if not df_filtered.empty:
-                # [OPTIMIZATION] Early Deduplication per File using vectorized key
-                df_filtered = generate_vectorized_record_key(df_filtered)
-                if '인허가일자' in df_filtered.columns:
-                    df_filtered['인허가일자_dt'] = pd.to_datetime(df_filtered['인허가일자'], errors='coerce')
-                    df_filtered.sort_values(by='인허가일자_dt', ascending=False, inplace=True)
-                    df_filtered.drop(columns=['인허가일자_dt'], inplace=True)
+        spilled = sorted(os.listdir(spill_dir))
+        parts = []
+        count_before = 0
+        for p in range(partitions):
+            prefix = f"p{p:04d}_"
+            files = [f for f in spilled if f.startswith(prefix)]
+            if not files: continue
+            part_df = pd.concat([pd.read_pickle(os.path.join(spill_dir, f)) for f in files], ignore_index=True)
+            for f in files:
+                os.remove(os.path.join(spill_dir, f))
                 
-                df_filtered.drop_duplicates(subset=['record_key'], keep='first', inplace=True)
-                dfs.append(df_filtered)
-        except Exception:
-            continue
+            # Per-file dedup first (same count semantics as the in-memory path), then global
+            part_df = _dedup_latest_permit(part_df, ['_src', 'record_key'])
+            count_before += len(part_df)
+            part_df = _dedup_latest_permit(part_df, ['record_key'])
+            parts.append(part_df.drop(columns=['_src']))
+            _stage_done('dedup')
             
-    if not dfs:
-        return None, [], "No valid CSV files found in ZIP.", {}
-        
-    concatenated_df = pd.concat(dfs, ignore_index=True)
-    
-    # [STATS] Before Global Mix Count
-    count_before = len(concatenated_df)
-    
-    # [GLOBAL DEDUPLICATION] Final pass
-    if '인허가일자' in concatenated_df.columns:
-        concatenated_df['인허가일자_dt'] = pd.to_datetime(concatenated_df['인허가일자'], errors='coerce')
-        concatenated_df.sort_values(by='인허가일자_dt', ascending=False, inplace=True, na_position='last')
-        concatenated_df.drop(columns=['인허가일자_dt'], inplace=True)
+        if not parts:
+            return None, 0
+        result = pd.concat(parts, ignore_index=True)
+        return result.reindex(columns=[c for c in col_order if c != '_src']), count_before
+    finally:
+        shutil.rmtree(spill_dir, ignore_errors=True)
 
-    # Remove duplicates based on record_key
-    concatenated_df.drop_duplicates(subset=['record_key'], keep='first', inplace=True)
+def _build_localdata_target(zip_sources: List[Any], workers: int, streaming: Optional[bool] = None) -> Tuple[Optional[pd.DataFrame], Dict[str, int], Optional[str]]:
+    """
+    ZIP -> parsed, filtered, globally deduplicated and geocoded target frame (before district matching).
+    `streaming` forces the bounded-memory chunked mode on/off (None: auto by uncompressed CSV size).
+    Returns: (TargetDataFrame, StatsDict, ErrorMessage)
+    """
+    # 1. Open Zip File(s)
+    # [OPTIMIZATION] Stream CSV members straight out of the archive (no temp-dir extraction)
+    try:
+        zip_refs = _open_zip_inputs(zip_sources)
+    except Exception as e:
+        return None, {}, f"ZIP extraction failed: {e}"
+    _stage_done('extract')
+        
+    if streaming is None:
+        total_bytes = sum(m.file_size for _, m in _iter_csv_members(zip_refs))
+        streaming = total_bytes >= STREAM_MIN_BYTES
+        
+    # 2. Parse per-category CSVs
+    try:
+        if streaming:
+            # [OPTIMIZATION] Out-of-core: chunked reads + hash-partitioned spill for the global dedup
+            concatenated_df, count_before = _stream_localdata_frames(zip_refs, STREAM_CHUNK_ROWS, SPILL_PARTITIONS)
+        else:
+            # [OPTIMIZATION] Per-file work fans out to a process pool, merged back in archive order
+            dfs = _collect_localdata_frames(zip_sources, zip_refs, workers)
+            concatenated_df = pd.concat(dfs, ignore_index=True) if dfs else None
+            
+            # [STATS] Before Global Mix Count
+            count_before = len(concatenated_df) if concatenated_df is not None else 0
+            
+            # [GLOBAL DEDUPLICATION] Final pass (remove duplicates based on record_key)
+            if concatenated_df is not None:
+                concatenated_df = _dedup_latest_permit(concatenated_df, ['record_key'])
+            _stage_done('dedup')
+    finally:
+        for zip_ref in zip_refs:
+            zip_ref.close()
+            
+    if concatenated_df is None or concatenated_df.empty:
+        return None, {}, "No valid CSV files found in ZIP."
     
     # [STATS] After Mix Count
     count_after = len(concatenated_df)
@@ -464,9 +786,7 @@ def load_and_process_data(zip_file_path_or_obj: Any, district_file_path_or_obj:
     x_col = next((c for c in all_cols if '좌표' in c and ('x' in c.lower() or 'X' in c)), None)
     y_col = next((c for c in all_cols if '좌표' in c and ('y' in c.lower() or 'Y' in c)), None)
     
-    desired_patterns = ['소재지전체주소', '도로명전체주소', '사업장명', '업태구분명', '영업상태명', 
-                        '소재지전화', '총면적', '소재지면적', '인허가일자', '폐업일자', 
-                        '재개업일자', '최종수정시점', '데이터기준일자']
+    desired_patterns = DESIRED_COLUMN_PATTERNS
     
     rename_map = {}
     selected_cols = []
@@ -496,10 +816,11 @@ def load_and_process_data(zip_file_path_or_obj: Any, district_file_path_or_obj:
              target_df['소재지전체주소'] = target_df['주소']
 
     # Date Parsing
-    date_cols = ['인허가일자', '폐업일자', '재개업일자']
+    # [OPTIMIZATION] Columns are already parsed per file; localized to KST once here
+    date_cols = LOCALDATA_DATE_COLUMNS
     for col in date_cols:
         if col in target_df.columns:
-            target_df[col] = pd.to_datetime(target_df[col], errors='coerce')
+            target_df[col] = parse_date_series(target_df[col])
             
     # [FIX] Compute '최종수정시점' for accurate Period Filtering in app.py
     # Takes the maximum valid date among Permit, Closure, and Re-open dates.
@@ -509,44 +830,158 @@ def load_and_process_data(zip_file_path_or_obj: Any, district_file_path_or_obj:
     
     if '인허가일자' in target_df.columns:
         target_df.sort_values(by='인허가일자', ascending=False, inplace=True)
+    _stage_done('columns')
         
     # Coordinate Parsing
     if x_col and y_col:
         x_c = x_col if x_col in target_df.columns else next((k for k,v in rename_map.items() if v == '좌표정보(X)'), x_col)
         y_c = y_col if y_col in target_df.columns else next((k for k,v in rename_map.items() if v == '좌표정보(Y)'), y_col)
         
-        xs = pd.to_numeric(target_df[x_c], errors='coerce').values
-        ys = pd.to_numeric(target_df[y_c], errors='coerce').values
-        
-        lats = np.full(xs.shape, np.nan)
-        lons = np.full(ys.shape, np.nan)
-        valid_mask = ~np.isnan(xs) & ~np.isnan(ys)
-        
-        if np.any(valid_mask):
-             sample_x = xs[valid_mask]
-             if np.median(sample_x) > 200 and HAS_PYPROJ:
-                 try:
-                     lon_v, lat_v = transformer.transform(xs[valid_mask], ys[valid_mask])
-                     lats[valid_mask] = lat_v
-                     lons[valid_mask] = lon_v
-                 except: pass
-             else:
-                 lats = ys
-                 lons = xs
-        
-        # Bound Check
-        bad_mask = (lats < 30) | (lats > 45) | (lons < 120) | (lons > 140)
-        lats[bad_mask] = np.nan
-        lons[bad_mask] = np.nan
+        # [OPTIMIZATION] Shared batched engine (per-row lat/lon + CRS detection, one pyproj call per CRS, bounds check)
+        lats, lons = convert_coordinates(target_df[x_c].values, target_df[y_c].values,
+                                         groups=target_df.get('소재지전체주소'))
         
         target_df['lat'] = lats
         target_df['lon'] = lons
     else:
         target_df['lat'] = None
         target_df['lon'] = None
+    _stage_done('coords')
+        
+    return target_df, stats, None
+
+def _input_name(item: Any) -> str:
+    """Base file name of a path or uploaded file object (NFC)."""
+    if isinstance(item, (str, os.PathLike)):
+        name = os.path.basename(os.fspath(item))
+    else:
+        name = getattr(item, 'name', '') or ''
+    return unicodedata.normalize('NFC', name)
+
+def split_daily_inputs(zip_sources: List[Any]) -> Tuple[List[Any], List[Any]]:
+    """
+    Splits ZIP inputs into base bundles and daily delta ZIPs (daily_fetch.py output), keeping order.
+    """
+    base, daily = [], []
+    for item in zip_sources:
+        (daily if _input_name(item).startswith(DAILY_ZIP_PREFIXES) else base).append(item)
+    return base, daily
+
+def upsert_by_record_key(base_df: pd.DataFrame, delta_df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Upserts delta rows into base by record_key with the global dedup rule:
+    newest 인허가일자 wins, ties go to the delta. Only keys present in the delta are compared.
+    """
+    if delta_df is None or delta_df.empty:
+        return base_df
+    if base_df is None or base_df.empty:
+        return delta_df
+        
+    # Keep the base schema stable (delta CSVs may carry differently named raw columns)
+    delta_df = delta_df.reindex(columns=base_df.columns)
+    delta_df = delta_df.drop_duplicates(subset=['record_key'], keep='first')
+    
+    hit = base_df['record_key'].isin(delta_df['record_key'])
+    if hit.any() and '인허가일자' in base_df.columns:
+        base_dates = base_df.loc[hit].drop_duplicates(subset=['record_key']).set_index('record_key')['인허가일자']
+        delta_dates = delta_df.set_index('record_key')['인허가일자'].reindex(base_dates.index)
+        base_wins = (base_dates > delta_dates) | (delta_dates.isna() & base_dates.notna())
+        delta_df = delta_df[~delta_df['record_key'].isin(base_wins.index[base_wins])]
+        hit = base_df['record_key'].isin(delta_df['record_key'])
+        
+    # Delta rows first: they are the most recent permits, matching the 인허가일자-descending order
+    # (concat of differing categoricals falls back to object, so the dtypes are re-applied)
+    return apply_categorical_dtypes(pd.concat([delta_df, base_df[~hit]], ignore_index=True))
+
+def _load_incremental(base_sources: List[Any], daily_sources: List[Any], district_file_path_or_obj: Any, workers: int, streaming: Optional[bool] = None) -> Optional[Tuple[pd.DataFrame, List[Dict], Optional[str], Dict[str, int]]]:
+    """
+    Base snapshot + daily upserts. Every prefix (base, base+d1, base+d1+d2, ...) is snapshotted,
+    so a new daily ZIP only parses and matches its own rows.
+    Returns None if the inputs cannot be keyed (caller falls back to the full pipeline).
+    """
+    chain = [snapshot_cache.compute_inputs_key(base_sources, district_file_path_or_obj)]
+    for daily in daily_sources:
+        chain.append(snapshot_cache.chain_key(chain[-1], daily))
+    if any(k is None for k in chain):
+        return None
+        
+    # Longest already-processed prefix
+    start, cached = 0, None
+    for n in range(len(chain) - 1, -1, -1):
+        cached = snapshot_cache.load_snapshot(chain[n])
+        if cached is not None:
+            start = n
+            break
+            
+    if cached is None:
+        target_df, stats, err = _build_localdata_target(base_sources, workers, streaming)
+        if err:
+            return None, [], err, {}
+        final_df, mgr_info, err = _process_and_merge_district_data(target_df, district_file_path_or_obj, master=True)
+        if err or final_df is None:
+            return final_df, mgr_info, err, stats
+        snapshot_cache.save_snapshot(chain[0], final_df, mgr_info, stats)
+    else:
+        final_df, mgr_info, stats = cached
+    stats = dict(stats)
+        
+    for i in range(start, len(daily_sources)):
+        delta_target, delta_stats, err = _build_localdata_target([daily_sources[i]], workers)
+        if not err and delta_target is not None and not delta_target.empty:
+            delta_final, _, err = _process_and_merge_district_data(delta_target, district_file_path_or_obj)
+            if err:
+                return final_df, mgr_info, err, stats
+            new_keys = (~delta_final['record_key'].drop_duplicates().isin(final_df['record_key'])).sum()
+            final_df = upsert_by_record_key(final_df, delta_final)
+            stats['before'] = stats.get('before', 0) + delta_stats.get('before', 0)
+            stats['after'] = stats.get('after', 0) + int(new_keys)
+        # Empty/invalid daily ZIPs still get their chain snapshot so they are not re-read
+        snapshot_cache.save_snapshot(chain[i + 1], final_df, mgr_info, stats)
+        
+    return final_df, mgr_info, None, stats
+
+@st.cache_data
+def load_and_process_data(zip_file_path_or_obj: Any, district_file_path_or_obj: Any, dist_mtime: Optional[float] = None, workers: Optional[int] = None, use_snapshot: bool = True, incremental: bool = True, streaming: Optional[bool] = None) -> Tuple[Union[pd.DataFrame, None], List[Dict], Optional[str], Dict[str, int]]:
+    """
+    Loads data from uploads, streams CSVs out of the ZIP, and merges with district data.
+    `workers` sets the process-pool size for per-file parsing (default: config.INGEST_WORKERS, 1 = sequential).
+    `use_snapshot` reuses/writes the on-disk snapshot keyed by the inputs' content hash.
+    `incremental` applies LOCALDATA_DAILY_*/YESTERDAY ZIPs as upserts onto the base snapshot.
+    `streaming` forces the bounded-memory chunked mode (None: auto above config.STREAM_MIN_BYTES).
+    Returns: (DataFrame, ManagerInfo, ErrorMessage, StatsDict)
+    """
+    # Handle single or multiple inputs
+    zip_inputs = zip_file_path_or_obj if isinstance(zip_file_path_or_obj, list) else [zip_file_path_or_obj]
+    zip_sources = [z for z in zip_inputs if z is not None]
+    if workers is None:
+        workers = INGEST_WORKERS
+    
+    # 0. [OPTIMIZATION] Persistent snapshot (survives restarts/redeploys, shared by replicas)
+    snapshot_key = None
+    if use_snapshot:
+        snapshot_key = snapshot_cache.compute_inputs_key(zip_sources, district_file_path_or_obj)
+        cached = snapshot_cache.load_snapshot(snapshot_key)
+        if cached is not None:
+            final_df, mgr_info, stats = cached
+            return final_df, mgr_info, None, stats
+        
+        # [OPTIMIZATION] Daily ZIPs are applied as deltas onto the processed base bundle
+        if incremental:
+            base_sources, daily_sources = split_daily_inputs(zip_sources)
+            if base_sources and daily_sources:
+                result = _load_incremental(base_sources, daily_sources, district_file_path_or_obj, workers, streaming)
+                if result is not None:
+                    return result
+    
+    target_df, stats, err = _build_localdata_target(zip_sources, workers, streaming)
+    if err:
+        return None, [], err, {}
         
     # Delegate to common processor
-    final_df, mgr_info, err = _process_and_merge_district_data(target_df, district_file_path_or_obj)
+    final_df, mgr_info, err = _process_and_merge_district_data(target_df, district_file_path_or_obj, master=True)
+    
+    if snapshot_key and err is None and final_df is not None:
+        snapshot_cache.save_snapshot(snapshot_key, final_df, mgr_info, stats)
     return final_df, mgr_info, err, stats
 
 
@@ -642,33 +1077,26 @@ def process_api_data(target_df: pd.DataFrame, district_file_path_or_obj: Any) ->
     
     # Coordinate parsing
     if x_col in target_df.columns and y_col in target_df.columns:
-         # Check if we need to call parse_coordinates_row.
-         # But in `load_and_process`, we did vectorized. Let's do vectorized here too if possible?
-         # `parse_coordinates_row` handles the logic row-by-row safely.
-         # For consistency with previous API logic, let's keep it or improve.
-         # Improve: use vectorized if possible, but row-by-row is safer for mixed API data.
-         target_df['lat'], target_df['lon'] = zip(*target_df.apply(lambda row: parse_coordinates_row(row, x_col, y_col), axis=1))
+         # [OPTIMIZATION] Same batched engine as the ZIP path instead of a per-row parse_coordinates_row apply
+         target_df['lat'], target_df['lon'] = convert_coordinates(target_df[x_col].values, target_df[y_col].values,
+                                                                  groups=target_df.get('소재지전체주소'))
     else:
          target_df['lat'] = None
          target_df['lon'] = None
+    _stage_done('coords')
          
     for col in ['인허가일자', '폐업일자', '휴업시작일자', '휴업종료일자', '재개업일자']:
         if col in target_df.columns:
-            target_df[col] = pd.to_datetime(target_df[col], format='%Y%m%d', errors='coerce')
+            target_df[col] = parse_date_series(target_df[col])
             
     if '인허가일자' in target_df.columns:
         target_df.sort_values(by='인허가일자', ascending=False, inplace=True)
+    _stage_done('columns')
 
     # [OPTIMIZATION] Generate record_key for API data
     if 'record_key' not in target_df.columns:
-        from . import utils
-        target_df['record_key'] = target_df.apply(
-            lambda row: utils.generate_record_key(
-                row.get('사업장명', ''),
-                row.get('소재지전체주소', '') or row.get('도로명전체주소', '') or row.get('주소', '')
-            ),
-            axis=1
-        )
+        target_df['record_key'] = generate_record_keys(target_df.get('사업장명', pd.Series('', index=target_df.index)), record_address_series(target_df))
+    _stage_done('key')
 
     # Delegate to common processor
     final_df, mgr_info, err = _process_and_merge_district_data(target_df, district_file_path_or_obj)
@@ -678,15 +1106,44 @@ def process_api_data(target_df: pd.DataFrame, district_file_path_or_obj: Any) ->
 
 
 
+def clean_coordinate_series(series: pd.Series) -> pd.Series:
+    """
+    Vectorized coordinate cleaning: numbers (or strings, with ',' as decimal separator) inside the
+    Korean lat (33~43) or lon (124~132) ranges are kept, everything else becomes NaN.
+    """
+    values = pd.to_numeric(series, errors='coerce')
+    retry = values.isna() & series.notna()
+    if retry.any():
+        values[retry] = pd.to_numeric(series[retry].astype(str).str.strip().str.replace(',', '.', regex=False), errors='coerce')
+    values = values.astype(float)
+    return values.where(((values > 33) & (values < 43)) | ((values > 124) & (values < 132)))
+
 def load_fixed_coordinates_data(file_path: str):
     """
     [NEW] Fast-path to load fixed coordinate data from Excel.
-    Used for 'Suspended' facilities view.
+    Used for 'Suspended' facilities view. Parsed once per file content (in memory and on disk);
+    callers get a copy, so mutating the result never touches the cached frame.
     """
+    # [OPTIMIZATION] Cache keyed by file content (path digests are memoized by size/mtime)
+    key = snapshot_cache.compute_inputs_key([], file_path, namespace="fixed_coords")
+    if key and key in _fixed_coords_memo:
+        return _fixed_coords_memo[key].copy(), {}, "", {}
+
+    df = snapshot_cache.load_fixed_coordinates(key)
+    if df is None:
+        df, err = _read_fixed_coordinates_frame(file_path)
+        if err:
+            return None, {}, err, {}
+        snapshot_cache.save_fixed_coordinates(key, df)
+
+    if key:
+        _fixed_coords_memo.clear()
+        _fixed_coords_memo[key] = df
+    return df.copy(), {}, "", {}
+
+def _read_fixed_coordinates_frame(file_path: str) -> Tuple[Optional[pd.DataFrame], Optional[str]]:
+    """Reads and normalizes the fixed-coordinate Excel. Returns (df, err)."""
     try:
-        import unicodedata
-        import numpy as np
-        from . import utils
         df = pd.read_excel(file_path)
         
         # 1. Map Columns with Robust Normalization
@@ -715,35 +1172,15 @@ def load_fixed_coordinates_data(file_path: str):
         df.rename(columns=final_rename, inplace=True)
         
         # 2. Ensure Coordinates are numeric with robust cleaning
-        def clean_coord(x):
-            if pd.isna(x) or x is None: return np.nan
-            try:
-                v = float(x)
-                if v == 0: return np.nan
-                if (33 < v < 43) or (124 < v < 132):
-                    return v
-                return np.nan
-            except:
-                s = str(x).strip().replace(',', '.')
-                try:
-                    v = float(s)
-                    if v == 0: return np.nan
-                    if (33 < v < 43) or (124 < v < 132):
-                        return v
-                    return np.nan
-                except: return np.nan
-            
-        if 'lat' in df.columns: df['lat'] = df['lat'].apply(clean_coord)
-        if 'lon' in df.columns: df['lon'] = df['lon'].apply(clean_coord)
+        # [OPTIMIZATION] Vectorized instead of a per-cell clean_coord apply
+        if 'lat' in df.columns: df['lat'] = clean_coordinate_series(df['lat'])
+        if 'lon' in df.columns: df['lon'] = clean_coordinate_series(df['lon'])
         
         # 3. Generate record_key
-        df['record_key'] = df.apply(
-            lambda row: utils.generate_record_key(
-                str(row.get('사업장명', '')),
-                str(row.get('소재지전체주소', '') or '')
-            ),
-            axis=1
-        )
+        # [OPTIMIZATION] Vectorized keys (each distinct name/address normalized once)
+        titles = df['사업장명'].astype(str) if '사업장명' in df.columns else pd.Series('', index=df.index)
+        addrs = df['소재지전체주소'] if '소재지전체주소' in df.columns else pd.Series('', index=df.index)
+        df['record_key'] = generate_record_keys(titles, addrs.where(addrs.astype(object).astype(bool), '').astype(str))
         
         # 4. Fill missing defaults
         expected_cols = ['사업장명', '소재지전체주소', 'lat', 'lon', '관리지사', 'SP담당', 
@@ -752,6 +1189,6 @@ def load_fixed_coordinates_data(file_path: str):
             if c not in df.columns:
                 df[c] = "-"
         
-        return df, {}, "", {}
+        return df, None
     except Exception as e:
-        return None, {}, f"Fixed load error: {e}", {}
+        return None, f"Fixed load error: {e}"
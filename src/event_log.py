@@ -0,0 +1,202 @@
+"""
+Append-only JSON Lines logs (access / usage / view) split into dated segment files.
+
+A stream is a directory of segments named <YYYY-MM-DD>.jsonl (one per KST day, continued as
+<YYYY-MM-DD>.1.jsonl, .2.jsonl ... once a segment exceeds SEGMENT_MAX_BYTES). Logging appends one line
+to the current segment; readers open only the segments whose day falls inside the requested window.
+Segments older than ARCHIVE_AFTER_DAYS are gzip-compressed into <stream>/archive/ (still readable)
+instead of being truncated away.
+"""
+
+import gzip
+import json
+import os
+import re
+from datetime import timedelta
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from src import utils
+
+# A day's segment is continued in a new file past this size
+SEGMENT_MAX_BYTES = 8 * 1024 * 1024
+
+# Live segments older than this are compressed into the archive directory
+ARCHIVE_AFTER_DAYS = 30
+
+_SEGMENT_NAME = re.compile(r'^(\d{4}-\d{2}-\d{2})(?:\.(\d+))?\.jsonl(\.gz)?$')
+_DATE_PREFIX = re.compile(r'^\d{4}-\d{2}-\d{2}')
+
+# In-process cache: stream dir -> (day, part) of the segment currently appended to
+_current_segment: Dict[str, Tuple[str, int]] = {}
+
+
+def _segment_path(log_dir: Path, day: str, part: int) -> Path:
+    return log_dir / (f"{day}.jsonl" if part == 0 else f"{day}.{part}.jsonl")
+
+
+def _entry_day(entry: Dict[str, Any]) -> str:
+    """KST day of an entry (from its 'YYYY-MM-DD ...' timestamp, else today)."""
+    ts = entry.get('timestamp')
+    if isinstance(ts, str) and _DATE_PREFIX.match(ts):
+        return ts[:10]
+    return utils.get_now_kst().strftime('%Y-%m-%d')
+
+
+def list_segments(log_dir: Union[str, Path]) -> List[Tuple[str, int, Path]]:
+    """(day, part, path) of every live and archived segment of a stream, oldest first."""
+    log_dir = Path(log_dir)
+    segments = []
+    for directory in (log_dir, log_dir / "archive"):
+        if not directory.is_dir():
+            continue
+        for path in directory.iterdir():
+            m = _SEGMENT_NAME.match(path.name)
+            if m:
+                segments.append((m.group(1), int(m.group(2) or 0), path))
+    segments.sort(key=lambda s: (s[0], s[1]))
+    return segments
+
+
+def _encode(entry: Dict[str, Any]) -> str:
+    return json.dumps(entry, ensure_ascii=False, default=str) + "\n"
+
+
+def append_event(log_dir: Union[str, Path], entry: Dict[str, Any]) -> None:
+    """Appends one entry to the stream (a single write to the current segment)."""
+    log_dir = Path(log_dir)
+    day = _entry_day(entry)
+    key = str(log_dir)
+    current = _current_segment.get(key)
+    if current is None or current[0] != day:
+        # First write of the day in this process: find the latest part and archive old segments
+        log_dir.mkdir(parents=True, exist_ok=True)
+        parts = [part for d, part, path in list_segments(log_dir) if d == day and path.parent == log_dir]
+        current = (day, max(parts, default=0))
+        archive_segments(log_dir)
+
+    path = _segment_path(log_dir, *current)
+    try:
+        if path.stat().st_size >= SEGMENT_MAX_BYTES:
+            current = (day, current[1] + 1)
+            path = _segment_path(log_dir, *current)
+    except FileNotFoundError:
+        pass
+    _current_segment[key] = current
+
+    with open(path, 'a', encoding='utf-8') as f:
+        f.write(_encode(entry))
+
+
+def _read_segment(path: Path) -> List[Dict[str, Any]]:
+    opener = gzip.open if path.suffix == '.gz' else open
+    entries = []
+    try:
+        with opener(path, 'rt', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    entries.append(json.loads(line))
+                except json.JSONDecodeError:
+                    continue  # torn last line of an interrupted write
+    except OSError as e:
+        print(f"Log segment read failed ({path}): {e}")
+    return entries
+
+
+def read_events(log_dir: Union[str, Path], days: Optional[int] = None, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+    """
+    Entries of a stream in chronological order. `days` opens only the segments of the last `days`
+    KST days (callers still filter by exact timestamp); `limit` returns the last N entries, reading
+    segments from the newest backwards until enough are found.
+    """
+    segments = list_segments(log_dir)
+    if days is not None:
+        first_day = (utils.get_now_kst() - timedelta(days=days)).strftime('%Y-%m-%d')
+        segments = [s for s in segments if s[0] >= first_day]
+
+    if not limit:
+        entries = []
+        for _, _, path in segments:
+            entries.extend(_read_segment(path))
+        return entries
+
+    chunks, count = [], 0
+    for _, _, path in reversed(segments):
+        chunk = _read_segment(path)
+        chunks.append(chunk)
+        count += len(chunk)
+        if count >= limit:
+            break
+    entries = [e for chunk in reversed(chunks) for e in chunk]
+    return entries[-limit:]
+
+
+def _write_day_segments(log_dir: Path, entries: List[Dict[str, Any]]) -> None:
+    by_day: Dict[str, List[str]] = {}
+    for entry in entries:
+        if isinstance(entry, dict):
+            by_day.setdefault(_entry_day(entry), []).append(_encode(entry))
+    for day, lines in by_day.items():
+        tmp = log_dir / f"{day}.jsonl.tmp"
+        with open(tmp, 'w', encoding='utf-8') as f:
+            f.writelines(lines)
+        os.replace(tmp, _segment_path(log_dir, day, 0))
+
+
+def replace_events(log_dir: Union[str, Path], entries: List[Dict[str, Any]]) -> None:
+    """
+    Replaces the live segments with `entries` (whole-list writers such as the sheet pull).
+    Archived segments are kept.
+    """
+    log_dir = Path(log_dir)
+    log_dir.mkdir(parents=True, exist_ok=True)
+    for _, _, path in list_segments(log_dir):
+        if path.parent == log_dir:
+            path.unlink()
+    _current_segment.pop(str(log_dir), None)
+    _write_day_segments(log_dir, entries or [])
+
+
+def archive_segments(log_dir: Union[str, Path], older_than_days: int = ARCHIVE_AFTER_DAYS) -> int:
+    """Compresses live segments older than `older_than_days` into <log_dir>/archive/. Returns the count."""
+    log_dir = Path(log_dir)
+    cutoff = (utils.get_now_kst() - timedelta(days=older_than_days)).strftime('%Y-%m-%d')
+    archived = 0
+    for day, _, path in list_segments(log_dir):
+        if day >= cutoff or path.parent != log_dir:
+            continue
+        try:
+            (log_dir / "archive").mkdir(exist_ok=True)
+            target = log_dir / "archive" / (path.name + ".gz")
+            with open(path, 'rb') as src, gzip.open(str(target) + ".tmp", 'wb') as dst:
+                dst.write(src.read())
+            os.replace(str(target) + ".tmp", target)
+            path.unlink()
+            archived += 1
+        except OSError as e:
+            print(f"Log segment archive failed ({path}): {e}")
+    return archived
+
+
+def migrate_json_log(log_dir: Union[str, Path], json_path: Union[str, Path]) -> bool:
+    """
+    One-time split of a legacy JSON-array log into dated segments. The JSON file is renamed
+    to *.json.migrated afterwards. Returns True if entries were migrated.
+    """
+    log_dir, json_path = Path(log_dir), Path(json_path)
+    if not json_path.exists():
+        return False
+    try:
+        with open(json_path, 'r', encoding='utf-8') as f:
+            entries = json.load(f)
+    except Exception as e:
+        print(f"Log migration failed ({json_path}): {e}")
+        return False
+    if not isinstance(entries, list):
+        entries = []
+    log_dir.mkdir(parents=True, exist_ok=True)
+    if entries and not list_segments(log_dir):
+        _write_day_segments(log_dir, entries)
+    os.replace(json_path, json_path.with_suffix('.json.migrated'))
+    return bool(entries)
+
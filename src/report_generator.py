@@ -22,6 +22,7 @@ def generate_static_report(zip_path, district_path):
     
     # Branch Stats
     branch_counts = df['관리지사'].value_counts()
+    branch_counts = branch_counts[branch_counts > 0] # Categorical columns also count unused categories
     
     # Recent Activity (Last 30 Days)
     today = pd.Timestamp.now()
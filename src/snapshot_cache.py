@@ -0,0 +1,257 @@
+"""
+Persistent Snapshot Cache
+
+Stores processed LOCALDATA results (final DataFrame + manager info + stats) on disk
+as Parquet, keyed by a content hash of the input ZIP(s) and district file.
+Unlike @st.cache_data, snapshots survive restarts, redeploys and new replicas.
+
+Also stores compiled district indexes and their address match memos (pickled), keyed by the
+district file's content hash.
+"""
+
+import os
+import json
+import pickle
+import hashlib
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+try:
+    import pyarrow  # noqa: F401 (Parquet engine, shipped with streamlit)
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
+# [CLOUD_COMPAT] Same storage root as the other persistent data, /tmp fallback if read-only
+SNAPSHOT_DIR = os.path.join(os.path.expanduser("~"), ".sales_assistant_data", "snapshots")
+try:
+    os.makedirs(SNAPSHOT_DIR, exist_ok=True)
+except Exception:
+    import tempfile
+    SNAPSHOT_DIR = os.path.join(tempfile.gettempdir(), ".sales_assistant_data", "snapshots")
+    os.makedirs(SNAPSHOT_DIR, exist_ok=True)
+
+# Bump whenever the processing pipeline changes its output, to invalidate old snapshots
+SNAPSHOT_VERSION = "10"
+
+# Number of snapshots kept on disk (oldest are pruned)
+SNAPSHOT_KEEP = 5
+
+# Compiled district indexes (one per district file version; a handful is plenty)
+DISTRICT_INDEX_DIR = os.path.join(SNAPSHOT_DIR, "district_index")
+DISTRICT_INDEX_KEEP = 3
+
+# Address -> district match memos, one per compiled district index (a new district file starts empty)
+MATCH_MEMO_DIR = os.path.join(SNAPSHOT_DIR, "match_memo")
+
+# Parsed fixed-coordinate (정지 시설) Excel views, one per file version
+FIXED_COORDS_DIR = os.path.join(SNAPSHOT_DIR, "fixed_coords")
+FIXED_COORDS_KEEP = 2
+
+_HASH_CHUNK = 1024 * 1024
+
+# In-process memo: (path, size, mtime) -> digest, so a path is hashed once per process
+_path_digest_memo: Dict[Tuple[str, int, float], str] = {}
+
+
+def hash_input(item: Any) -> Optional[str]:
+    """
+    Returns the SHA-256 hex digest of a file path or file-like object (e.g. Streamlit upload).
+    File objects are rewound afterwards. Returns None for unsupported inputs.
+    """
+    if item is None:
+        return None
+
+    if isinstance(item, (str, os.PathLike)):
+        path = os.fspath(item)
+        if not os.path.exists(path):
+            return None
+        file_stat = os.stat(path)
+        memo_key = (os.path.abspath(path), file_stat.st_size, file_stat.st_mtime)
+        if memo_key in _path_digest_memo:
+            return _path_digest_memo[memo_key]
+        h = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for block in iter(lambda: f.read(_HASH_CHUNK), b''):
+                h.update(block)
+        digest = h.hexdigest()
+        _path_digest_memo[memo_key] = digest
+        return digest
+
+    if hasattr(item, 'read') and hasattr(item, 'seek'):
+        h = hashlib.sha256()
+        item.seek(0)
+        for block in iter(lambda: item.read(_HASH_CHUNK), b''):
+            h.update(block)
+        item.seek(0)
+        return h.hexdigest()
+
+    return None
+
+
+def compute_inputs_key(zip_inputs: List[Any], district_input: Any, namespace: str = "bundle") -> Optional[str]:
+    """
+    Builds the snapshot key from the content of every ZIP (order-sensitive) and the district file.
+    Returns None if any input cannot be hashed (snapshot is then skipped).
+    """
+    h = hashlib.sha256()
+    h.update(f"{namespace}:{SNAPSHOT_VERSION}".encode())
+    for item in list(zip_inputs) + [district_input]:
+        digest = hash_input(item)
+        if digest is None:
+            return None
+        h.update(digest.encode())
+    return h.hexdigest()
+
+
+def chain_key(parent_key: Optional[str], item: Any) -> Optional[str]:
+    """
+    Key of a snapshot derived from `parent_key` by applying one more input (e.g. a daily delta ZIP).
+    """
+    digest = hash_input(item)
+    if not parent_key or digest is None:
+        return None
+    return hashlib.sha256(f"{parent_key}+{digest}".encode()).hexdigest()
+
+
+def _snapshot_paths(key: str) -> Tuple[str, str]:
+    base = os.path.join(SNAPSHOT_DIR, key)
+    return base + ".parquet", base + ".json"
+
+
+def load_snapshot(key: Optional[str]) -> Optional[Tuple[pd.DataFrame, List[Dict], Dict[str, int]]]:
+    """
+    Loads (final_df, mgr_info, stats) for a key, or None on miss / unreadable snapshot.
+    """
+    if not key or not HAS_PYARROW:
+        return None
+    df_path, meta_path = _snapshot_paths(key)
+    if not (os.path.exists(df_path) and os.path.exists(meta_path)):
+        return None
+    try:
+        with open(meta_path, 'r', encoding='utf-8') as f:
+            meta = json.load(f)
+        df = pd.read_parquet(df_path)
+        # Parquet returns None for missing strings; restore NaN so astype(str)/'nan' checks behave as before
+        for col in df.columns[df.dtypes == object]:
+            df[col] = df[col].where(df[col].notna(), np.nan)
+        # Touch so pruning keeps recently used snapshots
+        os.utime(meta_path, None)
+        return df, meta.get('mgr_info', []), meta.get('stats', {})
+    except Exception as e:
+        print(f"Snapshot load failed ({key[:12]}): {e}")
+        return None
+
+
+def save_snapshot(key: Optional[str], df: pd.DataFrame, mgr_info: List[Dict], stats: Dict[str, int]) -> bool:
+    """
+    Writes a snapshot atomically (temp file -> rename) and prunes old ones.
+    """
+    if not key or not HAS_PYARROW or df is None:
+        return False
+    df_path, meta_path = _snapshot_paths(key)
+    try:
+        tmp_df = df_path + ".tmp"
+        df.to_parquet(tmp_df, engine='pyarrow')
+        os.replace(tmp_df, df_path)
+
+        # Meta is written last: a snapshot only counts once its meta exists
+        tmp_meta = meta_path + ".tmp"
+        with open(tmp_meta, 'w', encoding='utf-8') as f:
+            json.dump({'version': SNAPSHOT_VERSION, 'mgr_info': mgr_info, 'stats': stats}, f, ensure_ascii=False, default=str)
+        os.replace(tmp_meta, meta_path)
+
+        prune_snapshots()
+        return True
+    except Exception as e:
+        print(f"Snapshot save failed ({key[:12]}): {e}")
+        for p in (df_path + ".tmp", meta_path + ".tmp"):
+            if os.path.exists(p):
+                os.remove(p)
+        return False
+
+
+def prune_snapshots(keep: int = SNAPSHOT_KEEP) -> None:
+    """Removes all but the `keep` most recently used snapshots."""
+    try:
+        metas = [os.path.join(SNAPSHOT_DIR, f) for f in os.listdir(SNAPSHOT_DIR) if f.endswith(".json")]
+        metas.sort(key=os.path.getmtime, reverse=True)
+        for meta_path in metas[keep:]:
+            base = meta_path[:-len(".json")]
+            for p in (meta_path, base + ".parquet"):
+                if os.path.exists(p):
+                    os.remove(p)
+    except Exception as e:
+        print(f"Snapshot prune failed: {e}")
+
+
+def _load_pickle(directory: str, key: Optional[str], label: str) -> Optional[Any]:
+    if not key:
+        return None
+    path = os.path.join(directory, key + ".pkl")
+    if not os.path.exists(path):
+        return None
+    try:
+        with open(path, 'rb') as f:
+            obj = pickle.load(f)
+        os.utime(path, None)
+        return obj
+    except Exception as e:
+        print(f"{label} load failed ({key[:12]}): {e}")
+        return None
+
+
+def _save_pickle(directory: str, key: Optional[str], obj: Any, keep: int, label: str) -> bool:
+    """Writes obj atomically to <directory>/<key>.pkl and keeps the `keep` most recently used files."""
+    if not key:
+        return False
+    path = os.path.join(directory, key + ".pkl")
+    tmp = path + ".tmp"
+    try:
+        os.makedirs(directory, exist_ok=True)
+        with open(tmp, 'wb') as f:
+            pickle.dump(obj, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, path)
+
+        paths = [os.path.join(directory, f) for f in os.listdir(directory) if f.endswith(".pkl")]
+        paths.sort(key=os.path.getmtime, reverse=True)
+        for old in paths[keep:]:
+            os.remove(old)
+        return True
+    except Exception as e:
+        print(f"{label} save failed ({key[:12]}): {e}")
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        return False
+
+
+def load_district_index(key: Optional[str]) -> Optional[Dict[str, Any]]:
+    """Loads a compiled district index, or None on miss / unreadable file."""
+    return _load_pickle(DISTRICT_INDEX_DIR, key, "District index")
+
+
+def save_district_index(key: Optional[str], compiled: Dict[str, Any]) -> bool:
+    """Writes a compiled district index atomically and prunes old ones."""
+    return _save_pickle(DISTRICT_INDEX_DIR, key, compiled, DISTRICT_INDEX_KEEP, "District index")
+
+
+def load_match_memo(district_key: Optional[str]) -> Dict[str, Tuple[int, float]]:
+    """Address -> (district position, score) memo of a district index; empty on miss."""
+    return _load_pickle(MATCH_MEMO_DIR, district_key, "Match memo") or {}
+
+
+def save_match_memo(district_key: Optional[str], memo: Dict[str, Tuple[int, float]]) -> bool:
+    """Writes the match memo of a district index. Memos of older district versions are pruned."""
+    return _save_pickle(MATCH_MEMO_DIR, district_key, memo, DISTRICT_INDEX_KEEP, "Match memo")
+
+
+def load_fixed_coordinates(key: Optional[str]) -> Optional[pd.DataFrame]:
+    """Loads a parsed fixed-coordinate frame, or None on miss / unreadable file."""
+    return _load_pickle(FIXED_COORDS_DIR, key, "Fixed coordinates")
+
+
+def save_fixed_coordinates(key: Optional[str], df: pd.DataFrame) -> bool:
+    """Writes a parsed fixed-coordinate frame atomically and prunes old ones."""
+    return _save_pickle(FIXED_COORDS_DIR, key, df, FIXED_COORDS_KEEP, "Fixed coordinates")
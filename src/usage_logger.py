@@ -31,14 +31,19 @@ def save_json_file(filepath, data):
     from . import activity_logger
     return activity_logger.save_json_file(filepath, data)
 
+def load_usage_logs(days=None):
+    """
+    Usage log entries (activity_logger JSONL stream); `days` reads only the segments of that window.
+    """
+    from . import activity_logger
+    return activity_logger.read_log(USAGE_LOG_FILE, days=days)
+
 # ===== USAGE LOGGING =====
 
 def log_usage(user_role, user_name, user_branch, action, details=None):
     """
     Log user usage activity
     """
-    logs = load_json_file(USAGE_LOG_FILE)
-    
     from . import utils
     log_entry = {
         "timestamp": utils.get_now_kst_str(),
@@ -49,19 +54,16 @@ def log_usage(user_role, user_name, user_branch, action, details=None):
         "details": details or {}
     }
     
-    logs.append(log_entry)
-    
-    # Keep only last 10000 entries
-    if len(logs) > 10000:
-        logs = logs[-10000:]
-    
-    save_json_file(USAGE_LOG_FILE, logs)
+    # [OPTIMIZATION] Constant-time append to the dated JSONL segment (runs on every filter change)
+    from . import activity_logger
+    activity_logger.append_log(USAGE_LOG_FILE, log_entry)
 
 def get_usage_logs(days=30, user_name=None, user_branch=None, action=None):
     """
     Get usage logs with filters
     """
-    logs = load_json_file(USAGE_LOG_FILE)
+    # [OPTIMIZATION] Only the segments of the requested window are read
+    logs = load_usage_logs(days)
     
     if not logs:
         return []
@@ -95,7 +97,7 @@ def get_usage_stats(days=30):
     """
     Get usage statistics for admin dashboard
     """
-    logs = load_json_file(USAGE_LOG_FILE)
+    logs = load_usage_logs(days)
     
     if not logs:
         return {
@@ -167,7 +169,7 @@ def get_user_activity_timeline(user_name, days=7):
     """
     Get detailed activity timeline for a specific user
     """
-    logs = load_json_file(USAGE_LOG_FILE)
+    logs = load_usage_logs(days)
     
     if not logs:
         return []
@@ -206,7 +208,7 @@ def get_navigation_history(days=30, user_name=None, user_branch=None):
     """
     Get navigation history with business details
     """
-    logs = load_json_file(USAGE_LOG_FILE)
+    logs = load_usage_logs(days)
     
     if not logs:
         return []
@@ -313,7 +315,7 @@ def get_interest_history(days=30, user_name=None, user_branch=None):
     """
     Get interest marking history with business details
     """
-    logs = load_json_file(USAGE_LOG_FILE)
+    logs = load_usage_logs(days)
     
     if not logs:
         return []
@@ -1,4 +1,5 @@
 import pandas as pd
+import numpy as np
 import re
 import unicodedata
 import os
@@ -6,6 +7,7 @@ import json
 from sklearn.metrics.pairwise import cosine_similarity
 from difflib import SequenceMatcher
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 
 def get_now_kst():
     """Returns current time in KST (UTC+9) as pd.Timestamp"""
@@ -27,12 +29,27 @@ except ImportError:
 # Coordinate Conversion
 try:
     from pyproj import Transformer
-    # EPSG:5174 (Modified Bessel Middle) to EPSG:4326 (WGS84 Lat/Lon)
-    transformer = Transformer.from_crs("epsg:5174", "epsg:4326", always_xy=True)
     HAS_PYPROJ = True
 except ImportError:
     HAS_PYPROJ = False
-    transformer = None
+
+@lru_cache(maxsize=None)
+def get_transformer(crs):
+    """Cached pyproj Transformer from `crs` to EPSG:4326 (WGS84 Lat/Lon), lon/lat axis order."""
+    return Transformer.from_crs(crs, "epsg:4326", always_xy=True)
+
+# EPSG:5174 (Modified Bessel Middle) to EPSG:4326 (WGS84 Lat/Lon)
+transformer = get_transformer("epsg:5174") if HAS_PYPROJ else None
+
+# Bracketed parts (e.g. (Apt 101), (Bldg B)) and literal replacements of normalize_address, in order
+_ADDRESS_BRACKETS = re.compile(r'\([^)]*\)')
+ADDRESS_REPLACEMENTS = [
+    ('강원특별자치도', '강원도'),
+    ('세종특별자치시', '세종시'),
+    ('서울특별시', '서울시'),
+    ('  ', ' '), # Double spaces
+    ('-', ''),
+]
 
 def normalize_address(address):
     """
@@ -45,51 +62,129 @@ def normalize_address(address):
     address = str(address).strip()
     
     # Remove everything in brackets (e.g., (Apt 101), (Bldg B))
-    address = re.sub(r'\([^)]*\)', '', address)
+    address = _ADDRESS_BRACKETS.sub('', address)
     
     # Standardize
-    address = address.replace('강원특별자치도', '강원도')
-    address = address.replace('세종특별자치시', '세종시')
-    address = address.replace('서울특별시', '서울시')
-    address = address.replace('  ', ' ') # Double spaces
-    address = address.replace('-', '')
+    for old, new in ADDRESS_REPLACEMENTS:
+        address = address.replace(old, new)
     
     if '*' in address or len(address) < 8:  # Too short or masked
         return None
         
     return address.strip()
 
+def normalize_addresses(addresses):
+    """
+    normalize_address over a Series: string ops run once per distinct value and are mapped back.
+    Returns an object Series (None where the address is missing, masked or too short).
+    """
+    codes, uniques = pd.factorize(addresses)
+    values = pd.Series(uniques, dtype=object).astype(str).str.strip()
+    values = values.str.replace(_ADDRESS_BRACKETS, '', regex=True)
+    for old, new in ADDRESS_REPLACEMENTS:
+        values = values.str.replace(old, new, regex=False)
+    rejected = values.str.contains('*', regex=False) | (values.str.len() < 8)
+    normalized = values.str.strip().where(~rejected, None).to_numpy(dtype=object)
+    # NaN rows (code -1) pick the trailing None
+    normalized = np.append(normalized, None)
+    return pd.Series(normalized[codes], index=addresses.index, name=addresses.name, dtype=object)
+
+# Korea bounding box (WGS84) used to validate converted coordinates
+KOREA_LAT_RANGE = (30, 45)
+KOREA_LON_RANGE = (120, 140)
+
+def _in_korea(lat, lon):
+    return (lat > KOREA_LAT_RANGE[0]) & (lat < KOREA_LAT_RANGE[1]) & (lon > KOREA_LON_RANGE[0]) & (lon < KOREA_LON_RANGE[1])
+
+# [NEW] Projected CRS candidates: (CRS, X range, Y range) covering South Korea in that system, in priority order.
+# EPSG:5174 / 5181 / 2097 share the Central Belt origin (false northing 500,000) and differ by a few hundred
+# metres, so they cannot be told apart by value; 5174 (the LOCALDATA default) stands for all three.
+# EPSG:5186 (Central Belt 2010) is the same grid shifted 100km north; EPSG:5179 (UTM-K) is disjoint.
+PROJECTED_CRS_RANGES = [
+    ("epsg:5174", (-100_000, 700_000), (-100_000, 600_000)),
+    ("epsg:5186", (-100_000, 700_000), (0, 700_000)),
+    ("epsg:5179", (600_000, 1_500_000), (1_300_000, 2_200_000)),
+]
+
+def _crs_group_keys(groups):
+    """Group key per row (first two address tokens, i.e. 시도 + 시군구), computed once per distinct value."""
+    codes, uniques = pd.factorize(pd.Series(groups), use_na_sentinel=True)
+    keys = np.array([' '.join(str(u).split()[:2]) for u in uniques] + [''], dtype=object)
+    return pd.factorize(keys[codes])[0]
+
+def classify_crs(x, y, groups=None):
+    """
+    Index into PROJECTED_CRS_RANGES per row (-1 when no candidate fits).
+    Rows that fit several candidates take the first one, unless `groups` (e.g. the address) is given and
+    the unambiguous rows of their group (same 시도 + 시군구, i.e. same publishing authority) vote otherwise.
+    """
+    fits = np.column_stack([(x >= xr[0]) & (x < xr[1]) & (y >= yr[0]) & (y < yr[1])
+                            for _, xr, yr in PROJECTED_CRS_RANGES])
+    crs = np.where(fits.any(axis=1), fits.argmax(axis=1), -1)
+    n_fits = fits.sum(axis=1)
+    ambiguous = n_fits > 1
+    # Only a group vote can override the default, and only if some unambiguous row disagrees with it
+    if groups is None or not ambiguous.any() or not ((n_fits == 1) & (crs > 0)).any():
+        return crs
+
+    codes = _crs_group_keys(groups)
+    unambiguous = n_fits == 1
+    votes = np.zeros((codes.max() + 1, len(PROJECTED_CRS_RANGES)))
+    np.add.at(votes, (codes[unambiguous], crs[unambiguous]), 1)
+    winner = votes.argmax(axis=1)
+
+    rows = np.flatnonzero(ambiguous)
+    chosen = winner[codes[rows]]
+    use = (votes[codes[rows]].sum(axis=1) > 0) & fits[rows, chosen]
+    crs[rows[use]] = chosen[use]
+    return crs
+
+def convert_coordinates(xs, ys, groups=None):
+    """
+    Batched coordinate engine: X/Y values (any type) -> (lat, lon) float arrays, NaN where invalid.
+    Rows that already look like lon/lat are kept, projected rows are classified by source CRS
+    (see classify_crs; `groups` is an optional per-row address used to settle ambiguous rows)
+    and go through one cached pyproj call per CRS, and every result is checked against the Korea bounding box.
+    """
+    x = pd.to_numeric(pd.Series(xs), errors='coerce').to_numpy(dtype=np.float64)
+    y = pd.to_numeric(pd.Series(ys), errors='coerce').to_numpy(dtype=np.float64)
+    lats = np.full(x.shape, np.nan)
+    lons = np.full(x.shape, np.nan)
+
+    # Heuristic: If values are small (lat/lon like), use as is
+    geographic = _in_korea(y, x)
+    lats[geographic] = y[geographic]
+    lons[geographic] = x[geographic]
+
+    projected = np.flatnonzero(~geographic & np.isfinite(x) & np.isfinite(y))
+    if HAS_PYPROJ and len(projected):
+        crs = classify_crs(x[projected], y[projected],
+                           None if groups is None else np.asarray(groups, dtype=object)[projected])
+        for i in np.unique(crs[crs >= 0]):
+            rows = projected[crs == i]
+            try:
+                lon_v, lat_v = get_transformer(PROJECTED_CRS_RANGES[i][0]).transform(x[rows], y[rows])
+                lats[rows] = lat_v
+                lons[rows] = lon_v
+            except Exception as e:
+                print(f"Coordinate transform failed ({PROJECTED_CRS_RANGES[i][0]}): {e}")
+
+    # Sanity check for Korea
+    bad = ~_in_korea(lats, lons)
+    lats[bad] = np.nan
+    lons[bad] = np.nan
+    return lats, lons
+
 def parse_coordinates_row(row, x_col, y_col):
     """
-    Helper to parse and convert coordinates.
+    Helper to parse and convert coordinates (single row; see convert_coordinates for frames).
     """
-    try:
-        if not x_col or not y_col:
-            return None, None
-            
-        x_val = row.get(x_col)
-        y_val = row.get(y_col)
-        
-        if pd.isna(x_val) or pd.isna(y_val):
-            return None, None
-            
-        x = float(x_val)
-        y = float(y_val)
-        
-        # Heuristic: If values are small (lat/lon like), return as is
-        if 120 < x < 140 and 30 < y < 45:
-            return y, x # Lat, Lon
-            
-        # Conversion
-        if HAS_PYPROJ:
-            lon, lat = transformer.transform(x, y)
-            # Sanity check for Korea
-            if 30 < lat < 45 and 120 < lon < 140:
-                return lat, lon
-                
-    except:
+    if not x_col or not y_col:
         return None, None
-    return None, None
+    lats, lons = convert_coordinates([row.get(x_col)], [row.get(y_col)])
+    if np.isnan(lats[0]):
+        return None, None
+    return lats[0], lons[0]
 
 def get_best_match(address, choices, vectorizer, tfidf_matrix, threshold=0.7):
     """
@@ -237,68 +332,101 @@ def embed_local_images(html_content, base_path=""):
     pattern = r'src="([^"]+)"'
     return re.sub(pattern, replace_match, html_content)
 
+# [IMPROVED] Comprehensive address normalization including all official government variations
+# Long form -> short form, so "서울특별시" == "서울" in record keys (applied to title and address alike)
+RECORD_KEY_REPLACEMENTS = {
+    # Seoul (서울)
+    "서울특별시": "서울", "서울시": "서울",
+    
+    # Gyeonggi (경기)
+    "경기도": "경기", "기도": "경기",
+    
+    # Metropolitan Cities (광역시 / 특별광역시)
+    "인천특별광역시": "인천", "인천광역시": "인천", "인천시": "인천",
+    "부산광역시": "부산", "부산시": "부산",
+    "대구광역시": "대구", "대구시": "대구",
+    "광주광역시": "광주", "광주시": "광주",
+    "대전광역시": "대전", "대전시": "대전",
+    "울산광역시": "울산", "울산시": "울산",
+    
+    # Special Self-Governing City/Province (특별자치시/도)
+    "세종특별자치시": "세종", "세종시": "세종",
+    "제주특별자치도": "제주", "제주도": "제주", "제주시": "제주",
+    "강원특별자치도": "강원", "강원도": "강원",
+    "전북특별자치도": "전북", "전라북도": "전북",
+    
+    # Provinces (도)
+    "충청북도": "충북", "충북도": "충북",
+    "충청남도": "충남", "충남도": "충남",
+    "전라남도": "전남", "전남도": "전남",
+    "경상북도": "경북", "경북도": "경북",
+    "경상남도": "경남", "경남도": "경남"
+}
+
+# [OPTIMIZATION] One compiled pass instead of ~40 str.replace calls: longest alternative first,
+# plus the quote/newline removal (keys never contain them, so one scan is equivalent)
+_RECORD_KEY_SUBS = dict(RECORD_KEY_REPLACEMENTS, **{'"': '', "'": '', '\n': ''})
+_RECORD_KEY_PATTERN = re.compile('|'.join(re.escape(k) for k in sorted(_RECORD_KEY_SUBS, key=len, reverse=True)))
+_RECORD_KEY_LONG_FORMS = re.compile('|'.join(re.escape(k) for k in sorted(RECORD_KEY_REPLACEMENTS, key=len, reverse=True)))
+_WHITESPACE = re.compile(r'\s+')
+
+def clean_record_key_part(s):
+    """
+    Normalizes one record-key component (title or address).
+    Single source of truth for generate_record_key and generate_record_keys.
+    """
+    if s is None: return ""
+    s = str(s)
+    if s.lower() == 'nan': return ""
+    # Normalize unicode (e.g. separate jamo)
+    s = unicodedata.normalize('NFC', s)
+    
+    out = _RECORD_KEY_PATTERN.sub(lambda m: _RECORD_KEY_SUBS[m.group(0)], s)
+    if _RECORD_KEY_LONG_FORMS.search(out):
+        # A short form completed another long form (e.g. "서울특별시시"): replay the legacy
+        # sequential replacement order so existing keys stay byte-identical
+        out = s
+        for k, v in RECORD_KEY_REPLACEMENTS.items():
+            out = out.replace(k, v)
+        out = out.replace('"', '').replace("'", "").replace('\n', '')
+        
+    # Remove quotes for robustness, but KEEP spaces to match legacy keys
+    # Only collapse multiple spaces to single space
+    return _WHITESPACE.sub(' ', out).strip()
+
 def generate_record_key(title, addr):
     """
     Generate a normalized, consistent record key from Title and Address.
     This function MUST be used by both the frontend (app.py) and backend (activity_logger.py)
     to ensure data consistency.
     """
-    def clean(s):
-        if s is None: return ""
-        s = str(s)
-        if s.lower() == 'nan': return ""
-        # Normalize unicode (e.g. separate jamo)
-        s = unicodedata.normalize('NFC', s)
-        
-        # [IMPROVED] Address Semantic Normalization
-        # Replace common long forms with short forms to ensure "서울특별시" == "서울"
-        # Only apply this to the address part, but here 's' could be title too.
-        # However, titles unlikely to have these exact strings unless coincidence.
-        # Safer to apply replacement only if recognized as address components.
-        # For simplicity and robustness, we replace globally as these are district names.
-        
-        # [IMPROVED] Comprehensive address normalization including all official government variations
-        replacements = {
-            # Seoul (서울)
-            "서울특별시": "서울", "서울시": "서울",
-            
-            # Gyeonggi (경기)
-            "경기도": "경기", "기도": "경기",
-            
-            # Metropolitan Cities (광역시 / 특별광역시)
-            "인천특별광역시": "인천", "인천광역시": "인천", "인천시": "인천",
-            "부산광역시": "부산", "부산시": "부산",
-            "대구광역시": "대구", "대구시": "대구",
-            "광주광역시": "광주", "광주시": "광주",
-            "대전광역시": "대전", "대전시": "대전",
-            "울산광역시": "울산", "울산시": "울산",
-            
-            # Special Self-Governing City/Province (특별자치시/도)
-            "세종특별자치시": "세종", "세종시": "세종",
-            "제주특별자치도": "제주", "제주도": "제주", "제주시": "제주",
-            "강원특별자치도": "강원", "강원도": "강원",
-            "전북특별자치도": "전북", "전라북도": "전북",
-            
-            # Provinces (도)
-            "충청북도": "충북", "충북도": "충북",
-            "충청남도": "충남", "충남도": "충남",
-            "전라남도": "전남", "전남도": "전남",
-            "경상북도": "경북", "경북도": "경북",
-            "경상남도": "경남", "경남도": "경남"
-        }
-        
-        # Pre-clean strict logic: remove spaces first? No, replacements might need boundaries if we were regexing.
-        # But here we do simple string replace. "서울특별시" -> "서울" works even if attached.
-        
-        for k, v in replacements.items():
-            s = s.replace(k, v)
-            
-        # Remove quotes for robustness, but KEEP spaces to match legacy keys
-        s = s.replace('"', '').replace("'", "").replace('\n', '')
-        # Only collapse multiple spaces to single space
-        s = re.sub(r'\s+', ' ', s)
-        return s.strip()
-
-    c_title = clean(title)
-    c_addr = clean(addr)
+    c_title = clean_record_key_part(title)
+    c_addr = clean_record_key_part(addr)
     return f"{c_title}_{c_addr}"
+
+def generate_record_keys(titles, addrs):
+    """
+    Vectorized generate_record_key over two aligned Series (byte-identical keys).
+    Each distinct title/address is cleaned once.
+    """
+    def clean_unique(ser):
+        codes, uniques = pd.factorize(ser, use_na_sentinel=False)
+        cleaned = np.array([clean_record_key_part(u) for u in uniques], dtype=object)
+        return cleaned[codes]
+    
+    t_arr = clean_unique(titles)
+    a_arr = clean_unique(pd.Series(addrs, index=titles.index))
+    return pd.Series([f"{t}_{a}" for t, a in zip(t_arr, a_arr)], index=titles.index, dtype=object)
+
+def record_address_series(df):
+    """
+    Vectorized `row.get('소재지전체주소') or row.get('도로명전체주소') or row.get('주소')`,
+    the address fallback used by activity_logger.get_record_key.
+    """
+    addr = pd.Series([""] * len(df), index=df.index, dtype=object)
+    for col in ['주소', '도로명전체주소', '소재지전체주소']:
+        if col in df.columns:
+            values = df[col].astype(object)
+            # `or` semantics: '' / None fall through, NaN does not
+            addr = values.where(values.astype(bool), addr)
+    return addr
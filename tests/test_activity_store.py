@@ -0,0 +1,69 @@
+import json
+
+import pytest
+
+from src import activity_logger, utils
+from src.activity_store import SqliteActivityStore
+
+USER = {"name": "김담당", "role": "manager", "branch": "중앙지사"}
+
+
+@pytest.fixture
+def storage(tmp_path, monkeypatch):
+    """Returns a switch that points activity_logger at a fresh 'sqlite' or 'json' backend under tmp_path."""
+    monkeypatch.setattr(activity_logger, 'sync_to_gsheet', lambda *a, **k: None)
+
+    def use(backend):
+        root = tmp_path / backend
+        root.mkdir()
+        for name, filename in [('ACTIVITY_STATUS_FILE', 'activity_status.json'), ('VISIT_REPORT_FILE', 'visit_reports.json'),
+                               ('CHANGE_HISTORY_FILE', 'change_history.json')]:
+            monkeypatch.setattr(activity_logger, name, root / filename)
+        clock = iter(f"2026-10-17 09:{m:02d}:00" for m in range(60))
+        monkeypatch.setattr(utils, 'get_now_kst_str', lambda: next(clock))
+        monkeypatch.setattr(activity_logger, 'ACTIVITY_STORE', backend)
+        monkeypatch.setattr(activity_logger, '_store', SqliteActivityStore(root / 'activity.db') if backend == 'sqlite' else None)
+        return root
+    return use
+
+
+def _scenario():
+    activity_logger.register_visit('key_A', '첫 방문', None, None, USER)
+    activity_logger.save_activity_status('key_B', '상담중', '메모', '박담당', '강북지사', 'manager')
+    activity_logger.register_visit_batch([{'record_key': 'key_A', 'content': '재방문', 'user_info': USER},
+                                          {'record_key': 'key_C', 'content': '신규', 'user_info': USER, 'forced_status': '계약완료'}])
+    report_id = activity_logger.get_visit_reports(record_key='key_B')[0]['id']
+    activity_logger.update_visit_report(report_id, new_content='수정됨')
+    first_id = activity_logger.get_visit_reports(record_key='key_A', limit=None)[-1]['id']
+    activity_logger.delete_visit_report(first_id)
+    return {
+        'status': activity_logger.get_activity_status('key_A'),
+        'missing': activity_logger.get_activity_status('key_Z'),
+        'mine': activity_logger.get_user_activity_keys(USER['name']),
+        'reports': activity_logger.get_visit_reports(user_branch='중앙지사'),
+        'history': activity_logger.get_change_history('key_A'),
+        'all_statuses': activity_logger.load_json_file(activity_logger.ACTIVITY_STATUS_FILE),
+        'all_reports': activity_logger.load_json_file(activity_logger.VISIT_REPORT_FILE),
+    }
+
+
+def test_sqlite_backend_matches_json_backend(storage):
+    storage('json')
+    expected = _scenario()
+    root = storage('sqlite')
+    assert _scenario() == expected
+    # Row-level writes never touch the JSON files
+    assert not any(root.glob('*.json'))
+
+
+def test_sqlite_rows_and_migration(tmp_path):
+    legacy = [{"timestamp": "2026-01-01 10:00:00", "record_key": "old_key", "content": "legacy", "user_name": "이담당"}]
+    (tmp_path / 'visit_reports.json').write_text(json.dumps(legacy, ensure_ascii=False), encoding='utf-8')
+    store = SqliteActivityStore(tmp_path / 'activity.db')
+    assert store.migrate_json('visit_reports', tmp_path / 'visit_reports.json')
+    assert not store.migrate_json('visit_reports', tmp_path / 'visit_reports.json')  # one-time
+    migrated = store.query('visit_reports', user_name='이담당')
+    assert migrated[0]['content'] == 'legacy' and migrated[0]['id'].startswith('rep_fix_')
+
+    store.append('change_history', [{"record_key": "k", "timestamp": str(i)} for i in range(10)], keep=3)
+    assert [h['timestamp'] for h in store.load('change_history')] == ['7', '8', '9']
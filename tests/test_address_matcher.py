@@ -0,0 +1,178 @@
+from src import address_matcher
+from src.utils import normalize_address
+
+DISTRICT = ['서울 동대문구 용두동', '서울 동대문구 전농동', '서울 동대문구 전농1동', '경기 고양시 덕양구 능곡동',
+            '충북 제천시 화산동', '서울 중구 명동']
+
+
+def _match(addrs):
+    norms = [normalize_address(a) for a in addrs]
+    return address_matcher.match_addresses(norms, address_matcher.compile_district_index(DISTRICT, DISTRICT))
+
+
+def test_prefix_hits_use_short_province_names():
+    assert _match(['서울특별시 동대문구 용두동 39-1', '경기도 고양시 덕양구 능곡동 12 (1층)', '충청북도 제천시 화산동 424']) == [
+        '서울 동대문구 용두동', '경기 고양시 덕양구 능곡동', '충북 제천시 화산동']
+
+
+def test_longest_prefix_wins_and_exact_dong_is_not_confused():
+    assert _match(['서울시 동대문구 전농1동 5', '서울시 동대문구 전농동 5']) == ['서울 동대문구 전농1동', '서울 동대문구 전농동']
+
+
+def test_index_misses_fall_back_to_tfidf_with_city_check():
+    # Road address: no 동 token, resolved by the fuzzy stage within the same city
+    assert _match(['서울시 중구 명동길 14']) == ['서울 중구 명동']
+    # Same 구 name in another city is rejected
+    assert _match(['인천광역시 중구 신포동 3']) == [None]
+
+
+def test_index_agrees_with_tfidf_on_common_hits():
+    queries = [normalize_address(a) for a in ['서울특별시 동대문구 용두동 1', '경기도 고양시 덕양구 능곡동 7']]
+    fuzzy, _ = address_matcher.tfidf_match(queries, address_matcher.compile_district_index(DISTRICT, DISTRICT))
+    index = address_matcher.build_district_index(DISTRICT)
+    assert [address_matcher.lookup_district_index(index, q) for q in queries] == fuzzy.tolist()
+
+
+def test_fuzzy_stage_only_searches_the_same_block():
+    assert address_matcher.block_key('강원특별자치도 춘천시 중앙로1가 91') == '강원 춘천시'
+    district = ['서울 중구 중앙로1가', '강원 춘천시 중앙로3가']
+    assert address_matcher.tfidf_match(['강원도 춘천시 중앙로1가 91', '부산시 중구 중앙로1가 1'], address_matcher.compile_district_index(district, district))[0].tolist() == [1, -1]
+
+
+def test_sparse_topk_matches_dense_cosine():
+    import numpy as np
+    from sklearn.feature_extraction.text import TfidfVectorizer
+    from sklearn.metrics.pairwise import cosine_similarity
+
+    queries = ['서울 동대문구 용두동 39', '서울 중구 명동길', '경기 고양시 능곡동', '부산 해운대구 우동', '충북 제천시 화산동 4']
+    vec = TfidfVectorizer(analyzer='char', ngram_range=(2, 3)).fit(DISTRICT)
+    q, c = vec.transform(queries), vec.transform(DISTRICT)
+    dense = cosine_similarity(q, c)
+
+    idx, scores = address_matcher.sparse_topk(q, c, k=3, threshold=0.2)
+    for r in range(len(queries)):
+        expected = [j for j in np.lexsort((np.arange(len(DISTRICT)), -dense[r])) if dense[r, j] >= 0.2][:3]
+        got = [j for j in idx[r] if j >= 0]
+        assert got == expected
+        assert np.allclose(scores[r, :len(got)], dense[r, got])
+
+
+def test_parallel_matching_is_deterministic(monkeypatch):
+    import random
+    monkeypatch.setattr(address_matcher, 'MATCH_PARALLEL_MIN_ROWS', 0)
+    monkeypatch.setattr(address_matcher, 'TFIDF_CHUNK_SIZE', 50)
+    rng = random.Random(3)
+    stems = ['용두', '전농', '능곡', '화산', '명동', '장안', '답십리']
+    queries = [f"{rng.choice(['서울시 동대문구', '서울시 중구', '경기도 고양시', '충청북도 제천시'])} {rng.choice(stems)}로 {rng.randint(1, 300)}"
+               for _ in range(400)]
+    compiled = address_matcher.compile_district_index(DISTRICT, DISTRICT)
+    sequential, seq_scores = address_matcher.tfidf_match(queries, compiled, workers=1)
+    parallel, par_scores = address_matcher.tfidf_match(queries, compiled, workers=2)
+    assert parallel.tolist() == sequential.tolist() and par_scores.tolist() == seq_scores.tolist()
+    assert (sequential >= 0).any()
+
+
+def test_compiled_district_index_is_persisted_per_file_content(tmp_path, monkeypatch):
+    import pandas as pd
+    from src import data_loader, snapshot_cache
+    monkeypatch.setattr(snapshot_cache, 'DISTRICT_INDEX_DIR', str(tmp_path / 'index'))
+    monkeypatch.setattr(data_loader, '_district_index_memo', {})
+
+    path = tmp_path / 'district.xlsx'
+    pd.DataFrame({'관리지사': ['중앙'], 'SP담당': ['김'], '주소시': ['서울'], '주소군구': ['동대문구'], '주소동': ['용두동']}).to_excel(path, index=False)
+    compiled, err = data_loader.load_district_index(str(path))
+    assert err is None and compiled['originals'] == ['서울 동대문구 용두동']
+    assert compiled['mgr_info'] == [{'SP담당': '김', '관리지사': '중앙지사'}]
+    assert len(list((tmp_path / 'index').iterdir())) == 1
+
+    # A fresh process reads the artifact instead of the Excel file
+    data_loader._district_index_memo.clear()
+    monkeypatch.setattr(data_loader, '_read_district_frame', lambda _: (_ for _ in ()).throw(AssertionError('re-read')))
+    again, _ = data_loader.load_district_index(str(path))
+    assert again['originals'] == compiled['originals']
+
+
+def test_match_memo_skips_tfidf_for_known_addresses(monkeypatch):
+    compiled = address_matcher.compile_district_index(DISTRICT, DISTRICT)
+    queries = [normalize_address('서울시 중구 명동길 14'), normalize_address('부산시 중구 중앙동 1')]
+    memo = {}
+    first = address_matcher.match_addresses(queries, compiled, memo=memo)
+    assert first == ['서울 중구 명동', None]
+    # Only addresses that reached the fuzzy stage are remembered
+    assert list(memo) == [queries[0]] and memo[queries[0]][0] == DISTRICT.index('서울 중구 명동')
+
+    monkeypatch.setattr(address_matcher, 'tfidf_match', lambda *a, **k: (_ for _ in ()).throw(AssertionError('re-matched')))
+    assert address_matcher.match_addresses(queries, compiled, memo=memo) == first
+
+
+def test_vectorized_index_lookup_matches_scalar(monkeypatch):
+    compiled = address_matcher.compile_district_index(DISTRICT, DISTRICT)
+    addrs = [normalize_address(a) or a for a in [
+        '서울특별시 동대문구 용두동 39-1', '경기도  고양시   덕양구 능곡동 1', '충청북도 제천시 화산동', '서울 중구 명동',
+        '서울시 중구 명동길 14', '부산광역시 해운대구 우동 1', '서울', '강원특별자치도 원주시']]
+    expected = ([address_matcher.lookup_district_index(compiled, a) for a in addrs],
+                compiled['block_keys'].get_indexer([address_matcher.block_key(a) for a in addrs]).tolist())
+    for has_pyarrow in (True, False):
+        monkeypatch.setattr(address_matcher, 'HAS_PYARROW', has_pyarrow)
+        positions, blocks = address_matcher.index_lookup(addrs, compiled)
+        assert (positions.tolist(), blocks.tolist()) == expected
+
+
+def test_rerank_prefers_the_closest_head_among_tfidf_candidates():
+    import numpy as np
+    district = ['강원 홍천군 홍천읍', '강원 홍천군 서석면', '경기 고양시 덕양구 능곡동']
+    state = address_matcher.compile_district_index(district, district)
+    queries = [normalize_address('강원특별자치도 홍천군 서면 마곡리 14-2'), normalize_address('강원도 홍천군 서면 1'),
+               normalize_address('경기도 고양시 덕양구 능곡동 12')]
+    candidates = np.array([[0, 1], [0, 1], [1, 2]])
+    cosine = np.array([[0.62, 0.58], [0.90, 0.55], [0.60, 0.55]])
+    positions, scores = address_matcher.rerank_topk(queries, candidates, cosine, state)
+    # Ratio re-rank for the first and third rows; the second keeps its trusted cosine hit
+    assert positions.tolist() == [1, 0, 2]
+    assert scores.tolist() == [0.58, 0.90, 0.55]
+
+
+def test_spatial_fallback_stays_within_block_and_distance():
+    import numpy as np
+    positions = np.array([0, 0, 0, 1, -1, -1, -1, -1])
+    blocks = np.array([0, 0, 0, 1, 0, 1, 0, 0])
+    lat = np.array([37.50, 37.51, 37.49, 37.60, 37.505, 37.505, 37.60, np.nan])
+    lon = np.array([127.00, 127.00, 127.00, 127.10, 127.01, 127.01, 127.00, 127.00])
+    centroids = address_matcher.district_centroids(positions, lat, lon, 2)
+    result = address_matcher.spatial_fallback(positions, blocks, lat, lon, centroids, np.array([0, 1]))
+    # Row 4: 1km from the block-0 anchor; row 5: other block (its anchor has < SPATIAL_MIN_POINTS rows);
+    # row 6: ~11km away; row 7: no coordinates
+    assert result.tolist() == [0, 0, 0, 1, 0, -1, -1, -1]
+
+
+def test_spatial_fallback_uses_master_centroids_for_partial_loads():
+    import numpy as np
+    compiled = address_matcher.compile_district_index(DISTRICT, DISTRICT)
+    master = [normalize_address('서울특별시 중구 명동 1')] * 3 + [normalize_address('서울특별시 중구 을지로 1')]
+    lat = np.array([37.56, 37.561, 37.559, 37.562])
+    lon = np.array([126.98, 126.981, 126.979, 126.982])
+    memo = {master[3]: (-1, 0.0)}  # a remembered TF-IDF miss
+    full = address_matcher.match_addresses(master, compiled, memo=memo, coords=(lat, lon), locate_districts=True)
+    assert full == ['서울 중구 명동'] * 4
+
+    # A delta with only the unmatched row gets the same district from the persisted centroids
+    delta = address_matcher.match_addresses(master[3:], compiled, memo=memo, coords=(lat[3:], lon[3:]))
+    assert delta == ['서울 중구 명동']
+
+    # A later master load with other rows keeps the persisted locations
+    moved = address_matcher.match_addresses(master, compiled, memo=memo, coords=(lat + 0.1, lon), locate_districts=True)
+    assert moved == ['서울 중구 명동'] * 3 + [None]
+
+    # Without master centroids the fallback is skipped instead of using the partial load
+    compiled['centroids'] = None
+    assert address_matcher.match_addresses(master, compiled, memo=memo, coords=(lat, lon)) == ['서울 중구 명동'] * 3 + [None]
+
+
+def test_normalize_addresses_matches_scalar():
+    import numpy as np
+    import pandas as pd
+    from src.utils import normalize_addresses
+    values = pd.Series(['서울특별시  중구 (명동) 1-2', ' 강원특별자치도 춘천시 (1)(2) 효자동 ', '세종특별자치시 한누리대로',
+                        '경기도 ***동 1', 'short', None, np.nan, 12345678, '서울특별시  중구 (명동) 1-2'])
+    expected = [normalize_address(v) for v in values]
+    assert normalize_addresses(values).tolist() == expected
@@ -0,0 +1,64 @@
+import numpy as np
+import pandas as pd
+
+from src.utils import convert_coordinates, parse_coordinates_row
+
+
+def test_convert_coordinates_handles_mixed_rows_in_one_call():
+    xs = ['127.0276', 198000.0, '', 'abc', 9e6, 126.97]
+    ys = ['37.4979', 451000.0, '37.5', None, 9e6, 37.56]
+    lats, lons = convert_coordinates(xs, ys)
+    # lat/lon rows pass through, projected rows are transformed, junk and out-of-Korea rows are NaN
+    assert np.allclose([lats[0], lons[0]], [37.4979, 127.0276])
+    assert 37 < lats[1] < 38 and 126.5 < lons[1] < 127.5
+    assert np.isnan(lats[2:5]).all() and np.isnan(lons[2:5]).all()
+    assert np.allclose([lats[5], lons[5]], [37.56, 126.97])
+
+
+def test_parse_coordinates_row_agrees_with_batch():
+    df = pd.DataFrame({'x': [198000.0, 126.97, None], 'y': [451000.0, 37.56, 1.0]})
+    lats, lons = convert_coordinates(df['x'], df['y'])
+    for i, row in df.iterrows():
+        lat, lon = parse_coordinates_row(row, 'x', 'y')
+        if np.isnan(lats[i]):
+            assert (lat, lon) == (None, None)
+        else:
+            assert (lat, lon) == (lats[i], lons[i])
+
+
+def test_mixed_crs_bundle_is_projected_per_group():
+    from pyproj import Transformer
+    lon = np.array([126.978, 129.0756, 127.0, 127.05, 126.98])
+    lat = np.array([37.5665, 35.1796, 38.5, 37.6, 37.57])
+    xs, ys = np.empty(5), np.empty(5)
+    # Row 0: Central Belt (5174); row 1: UTM-K (5179); rows 2-4: one authority publishing in 5186
+    for rows, crs in [([0], 'epsg:5174'), ([1], 'epsg:5179'), ([2, 3, 4], 'epsg:5186')]:
+        xs[rows], ys[rows] = Transformer.from_crs('epsg:4326', crs, always_xy=True).transform(lon[rows], lat[rows])
+    groups = ['서울특별시 중구 태평로', '부산광역시 중구 중앙동', '강원도 철원군 갈말읍', '강원도 철원군 동송읍', '서울특별시 종로구']
+    lats, lons = convert_coordinates(xs, ys, groups=groups)
+    # Row 4 is ambiguous and alone in its group, so it keeps the Central Belt default (~100km north)
+    assert np.allclose(lats[:4], lat[:4], atol=1e-4) and np.allclose(lons[:4], lon[:4], atol=1e-4)
+    assert abs(lats[4] - lat[4] - 0.9) < 0.05
+
+
+def test_fixed_coordinates_are_cleaned_and_cached(tmp_path, monkeypatch):
+    from src import data_loader, snapshot_cache
+    monkeypatch.setattr(snapshot_cache, 'FIXED_COORDS_DIR', str(tmp_path / 'fixed'))
+    monkeypatch.setattr(data_loader, '_fixed_coords_memo', {})
+
+    path = tmp_path / 'fixed_0224.xlsx'
+    pd.DataFrame({'상호': ['A', 'B', 'C', 'D'], '설치주소': ['서울 중구 1', None, '서울 중구 3', '서울 중구 4'],
+                  '위도': [37.56, '37,5', 0, 'x'], '경도': [126.97, ' 127.01 ', 200, None]}).to_excel(path, index=False)
+    df, _, err, _ = data_loader.load_fixed_coordinates_data(str(path))
+    assert err == ""
+    assert df['lat'].tolist()[:2] == [37.56, 37.5] and df['lat'][2:].isna().all()
+    assert df['lon'].tolist()[:2] == [126.97, 127.01] and df['lon'][2:].isna().all()
+    assert df['record_key'].notna().all()
+
+    # Later calls (and fresh processes) do not re-read the Excel file
+    monkeypatch.setattr(data_loader, '_read_fixed_coordinates_frame', lambda _: (_ for _ in ()).throw(AssertionError('re-read')))
+    df['lat'] = 0.0  # callers may mutate their result without touching the cache
+    again = data_loader.load_fixed_coordinates_data(str(path))[0]
+    assert again is not df and again['lat'].tolist()[:2] == [37.56, 37.5]
+    data_loader._fixed_coords_memo.clear()
+    pd.testing.assert_frame_equal(data_loader.load_fixed_coordinates_data(str(path))[0], again)
@@ -0,0 +1,60 @@
+import json
+
+import pandas as pd
+
+from src import activity_logger, event_log, utils
+
+NOW = pd.Timestamp('2026-10-17 12:00:00', tz='Asia/Seoul')
+
+
+def _entry(day, i=0):
+    return {"timestamp": f"{day} 09:00:{i:02d}+09:00", "user_name": "김담당", "action": "login", "n": i}
+
+
+def test_segments_rotate_by_day_and_size_and_readers_open_only_the_window(tmp_path, monkeypatch):
+    monkeypatch.setattr(utils, 'get_now_kst', lambda: NOW)
+    monkeypatch.setattr(event_log, 'SEGMENT_MAX_BYTES', 150)
+    log_dir = tmp_path / 'usage_logs'
+    for day in ['2026-10-10', '2026-10-16', '2026-10-17']:
+        for i in range(3):
+            event_log.append_event(log_dir, _entry(day, i))
+
+    names = sorted(p.name for p in log_dir.iterdir())
+    assert names == ['2026-10-10.1.jsonl', '2026-10-10.jsonl', '2026-10-16.1.jsonl', '2026-10-16.jsonl',
+                     '2026-10-17.1.jsonl', '2026-10-17.jsonl']
+    assert [e['n'] for e in event_log.read_events(log_dir)] == [0, 1, 2] * 3
+
+    opened = []
+    monkeypatch.setattr(event_log, '_read_segment', lambda path: opened.append(path.name) or [])
+    event_log.read_events(log_dir, days=2)
+    assert all(not name.startswith('2026-10-10') for name in opened)
+
+
+def test_limit_reads_newest_segments_and_old_ones_are_archived(tmp_path, monkeypatch):
+    monkeypatch.setattr(utils, 'get_now_kst', lambda: NOW)
+    log_dir = tmp_path / 'access_logs'
+    event_log.append_event(log_dir, _entry('2026-08-01'))
+    event_log.append_event(log_dir, _entry('2026-10-17', 1))
+    event_log.append_event(log_dir, _entry('2026-10-17', 2))
+
+    # The August segment was compressed into archive/ when the October segment was opened
+    assert (log_dir / 'archive' / '2026-08-01.jsonl.gz').exists() and not (log_dir / '2026-08-01.jsonl').exists()
+    assert [e['n'] for e in event_log.read_events(log_dir, limit=2)] == [1, 2]
+    assert [e['n'] for e in event_log.read_events(log_dir, days=90)] == [0, 1, 2]
+
+
+def test_activity_logger_migrates_legacy_json_and_appends(tmp_path, monkeypatch):
+    monkeypatch.setattr(utils, 'get_now_kst', lambda: NOW)
+    monkeypatch.setattr(activity_logger, 'LOGS_DIR', tmp_path / 'logs')
+    monkeypatch.setattr(activity_logger, 'ACCESS_LOG_FILE', tmp_path / 'access_logs.json')
+    monkeypatch.setattr(activity_logger, '_migrated_logs', set())
+    monkeypatch.setattr(activity_logger, 'sync_to_gsheet', lambda *a, **k: None)
+    legacy = [_entry('2026-10-01', i) for i in range(3)]
+    (tmp_path / 'access_logs.json').write_text(json.dumps(legacy), encoding='utf-8')
+
+    activity_logger.log_access('admin', '관리자')
+    logs = activity_logger.load_json_file(activity_logger.ACCESS_LOG_FILE)
+    assert [e.get('n') for e in logs] == [0, 1, 2, None] and logs[-1]['user_name'] == '관리자'
+    assert (tmp_path / 'access_logs.json.migrated').exists()
+    assert activity_logger.local_logs_exist()
+    assert len(activity_logger.get_access_logs(days=7)) == 1
@@ -0,0 +1,82 @@
+import os
+import glob
+import random
+import re
+import unicodedata
+
+import pandas as pd
+import pytest
+
+from src import utils
+from src.data_loader import generate_vectorized_record_key
+
+NOWMON_DIR = os.path.join(os.path.dirname(__file__), '..', 'data', 'LOCALDATA_NOWMON_CSV_2월')
+
+
+def legacy_record_key(title, addr):
+    """Reference: the original sequential str.replace implementation."""
+    def clean(s):
+        if s is None: return ""
+        s = str(s)
+        if s.lower() == 'nan': return ""
+        s = unicodedata.normalize('NFC', s)
+        for k, v in utils.RECORD_KEY_REPLACEMENTS.items():
+            s = s.replace(k, v)
+        s = s.replace('"', '').replace("'", "").replace('\n', '')
+        s = re.sub(r'\s+', ' ', s)
+        return s.strip()
+    return f"{clean(title)}_{clean(addr)}"
+
+
+def test_scalar_matches_legacy_on_edge_cases():
+    cases = [
+        ("서울특별시시", "경기도도"), ("기도원", "경기도 수원시"), ('"카페" 서울', "인천특별광역시\n 남동구"),
+        (None, float('nan')), ("nan", "NaN"), ("  a  \t b ", "제주특별자치도 제주시"), ("서\"울시", "강원특별자치도"),
+    ]
+    for title, addr in cases:
+        assert utils.generate_record_key(title, addr) == legacy_record_key(title, addr)
+
+
+def test_scalar_matches_legacy_on_random_fragments():
+    rng = random.Random(0)
+    pieces = list(utils.RECORD_KEY_REPLACEMENTS) + list(set(utils.RECORD_KEY_REPLACEMENTS.values())) + \
+        ['시', '도', '경', '특별', ' ', '  ', '"', "'", '\n', '구', '동 12']
+    for _ in range(5000):
+        s = ''.join(rng.choice(pieces) for _ in range(rng.randint(1, 6)))
+        assert utils.generate_record_key(s, s) == legacy_record_key(s, s)
+
+
+def test_vectorized_matches_scalar():
+    titles = pd.Series(["서울특별시 카페", "기도원", None, "nan", "경기도도", "서울특별시 카페"])
+    addrs = pd.Series(["서울시 강남구", "경기도  수원시", "부산광역시", float('nan'), "", "서울시 강남구"])
+    keys = utils.generate_record_keys(titles, addrs)
+    assert keys.tolist() == [utils.generate_record_key(t, a) for t, a in zip(titles, addrs)]
+
+
+@pytest.mark.skipif(not os.path.isdir(NOWMON_DIR), reason="LOCALDATA sample not available")
+def test_vectorized_matches_scalar_on_real_data():
+    frames = []
+    for path in sorted(glob.glob(os.path.join(NOWMON_DIR, '*.csv')))[:40]:
+        try:
+            frames.append(pd.read_csv(path, encoding='cp949', dtype=str, usecols=lambda c: c in ('사업장명', '소재지전체주소')))
+        except Exception:
+            continue
+    df = pd.concat(frames, ignore_index=True)
+    assert not df.empty
+    
+    keys = generate_vectorized_record_key(df.copy())['record_key']
+    expected = [legacy_record_key(t, a if pd.notna(a) else '') for t, a in zip(df['사업장명'].fillna(''), df['소재지전체주소'])]
+    assert keys.tolist() == expected
+
+
+def test_display_normalization_keeps_nan_and_record_keys():
+    from src.data_loader import normalize_display_columns
+    df = pd.DataFrame({
+        '사업장명': ['명품禮家 ', '카페'], '소재지전체주소': [' ', '서울특별시 중구 명동 1'],
+        '도로명전체주소': ['서울특별시 중구 을지로 1', None], '업태구분명': [float('nan'), ' 한식'],
+    })
+    raw_keys = utils.generate_record_keys(df['사업장명'], utils.record_address_series(df)).tolist()
+    out = normalize_display_columns(df.copy())
+    assert out['업태구분명'].isna().tolist() == [True, False] and out.loc[1, '업태구분명'] == '한식'
+    assert out['사업장명'].tolist() == [unicodedata.normalize('NFC', '명품禮家'), '카페']
+    assert out['record_key'].tolist() == raw_keys